@@ -0,0 +1,89 @@
+# Import libraries
+import io
+import base64
+import numpy as np
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from PIL import Image
+from flask import Flask, request, jsonify
+from flask_cors import CORS, cross_origin
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.micro_batcher import MicroBatcher
+from chest_cancer_classifier.pipeline.stage_5_prediction import PredictionPipeline, IMAGE_SIZE
+
+
+# Load the serving settings from config/config.yaml
+serving_config = ConfigurationManager().get_serving_config()
+
+# Prediction pipeline backed by the resident model cache
+pipeline = PredictionPipeline(
+    model_path=serving_config.model_path,
+    backend=serving_config.backend,
+    backend_options=serving_config.backend_options
+)
+
+
+def predict_batch(images):
+    # Run one forward pass for the whole coalesced batch; a fixed batch size keeps the input shape stable
+    return pipeline.predict_batch(images, batch_size=serving_config.max_batch_size)
+
+
+# Background batcher that coalesces concurrent requests
+batcher = MicroBatcher(
+    predict_fn=predict_batch,
+    max_batch_size=serving_config.max_batch_size,
+    max_wait_ms=serving_config.max_wait_ms
+).start()
+
+app = Flask(__name__)
+CORS(app)
+
+
+def decode_request_image(imgstring: str) -> np.ndarray:
+    """
+    Decode a base64 image payload into a resized uint8 RGB array.
+
+    Decoding happens in the request thread so the batching worker only runs the model.
+    """
+    image = Image.open(io.BytesIO(base64.b64decode(imgstring)))
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    image = image.resize((IMAGE_SIZE[1], IMAGE_SIZE[0]), Image.BILINEAR)
+    return np.asarray(image, dtype=np.uint8)
+
+
+@app.route("/health", methods=["GET"])
+@cross_origin()
+def health():
+    # Liveness probe
+    return jsonify({"status": "ok"})
+
+
+@app.route("/predict", methods=["POST"])
+@cross_origin()
+def predict():
+    # Expect a JSON body of the form {"image": "<base64 string>"}
+    payload = request.get_json(silent=True) or {}
+    if "image" not in payload:
+        return jsonify({"error": "Request body must contain a base64 'image' field"}), 400
+
+    try:
+        image = decode_request_image(payload["image"])
+    except Exception as e:
+        logger.error(f"Could not decode request image: {e}")
+        return jsonify({"error": "Could not decode image"}), 400
+
+    # Queue the image and wait for its batch to be scored, giving up when the batch takes too long
+    future = batcher.submit(image)
+    try:
+        result = future.result(timeout=serving_config.request_timeout_s)
+    except FutureTimeoutError:
+        future.cancel()  # Skipped by the batcher if its batch has not started yet
+        logger.error(f"Prediction timed out after {serving_config.request_timeout_s} s")
+        return jsonify({"error": "Prediction timed out"}), 503
+    return jsonify([result])
+
+
+if __name__ == "__main__":
+    logger.info(f"Starting inference server on {serving_config.host}:{serving_config.port}")
+    app.run(host=serving_config.host, port=serving_config.port, threaded=True)
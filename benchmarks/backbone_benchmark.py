@@ -0,0 +1,106 @@
+# Compare the selectable backbones and classification heads of the prepare base model stage
+#
+# For every backbone / head pair the full model is built with the remaining params.yaml
+# settings, then the matrix records parameters, FLOPs, single-image CPU latency, saved
+# model size, training step time and throughput, and validation accuracy after EPOCHS of
+# training on the split index. Models and caches go to --output, so the pipeline
+# artifacts are left untouched.
+#
+# Usage (after the data ingestion and data split stages have run):
+#   python benchmarks/backbone_benchmark.py
+#   python benchmarks/backbone_benchmark.py --backbones vgg16 mobilenet_v3_small efficientnet_b0 --epochs 3
+#   python benchmarks/backbone_benchmark.py --backbones vgg16 --heads flatten gap gmp mlp
+
+import os
+import json
+import argparse
+import numpy as np
+import tensorflow as tf
+from pathlib import Path
+from dataclasses import replace
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.prepare_base_models import PrepareBaseModel, BACKBONES, HEADS
+from chest_cancer_classifier.components.model_trainer import Training
+from chest_cancer_classifier.components.model_pruning import count_flops, single_image_latency_ms
+
+
+def benchmark_model(backbone: str, head: str, output: Path, epochs: int, latency_runs: int) -> dict:
+    config_manager = ConfigurationManager()
+    workdir = output / f"{backbone}-{head}"
+    os.makedirs(workdir, exist_ok=True)
+
+    # Build the full model with this backbone and head
+    prepare_config = replace(
+        config_manager.get_prepare_base_model_config(),
+        params_backbone=backbone,
+        params_head=head,
+        base_model_path=workdir / "base_model.h5",
+        updated_base_model_path=workdir / "base_model_updated.h5",
+    )
+    prepare = PrepareBaseModel(config=prepare_config)
+    prepare.get_base_model()
+    prepare.update_base_model()
+
+    result = {
+        "parameters": int(prepare.full_model.count_params()),
+        "trainable_parameters": int(sum(np.prod(w.shape) for w in prepare.full_model.trainable_weights)),
+        "gflops": count_flops(prepare.full_model) / 1e9,
+        "cpu_latency_ms": single_image_latency_ms(prepare.full_model, prepare_config.params_image_size, latency_runs),
+        "size_mb": os.path.getsize(prepare_config.updated_base_model_path) / 2**20,
+    }
+
+    # Train the head and score it on the validation subset of the split index
+    training_config = replace(
+        config_manager.get_training_config(),
+        updated_base_model_path=prepare_config.updated_base_model_path,
+        trained_model_path=workdir / "model.h5",
+        training_metrics_path=workdir / "training_metrics.json",
+        features_dir=workdir / "features",
+        params_epochs=epochs,
+    )
+    training = Training(config=training_config)
+    training.get_base_model()
+    training.train_valid_generator()
+    training.train()
+
+    with open(training_config.training_metrics_path) as f:
+        result["train_images_per_second"] = json.load(f)["train_images_per_second"]
+    result["train_step_ms"] = training_config.params_batch_size / result["train_images_per_second"] * 1000.0
+    _, result["validation_accuracy"] = training.model.evaluate(training.valid_generator, verbose=0)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark matrix of the selectable backbones and heads")
+    parser.add_argument("--backbones", nargs="+", default=list(BACKBONES), choices=list(BACKBONES))
+    parser.add_argument("--heads", nargs="+", default=None, choices=list(HEADS),
+                        help="Classification heads to compare (default: HEAD from params.yaml)")
+    parser.add_argument("--epochs", type=int, default=None, help="Training epochs per model (default: EPOCHS)")
+    parser.add_argument("--latency-runs", type=int, default=50, help="Timed single-image predictions")
+    parser.add_argument("--output", default="artifacts/backbone_benchmark", help="Directory for models and the report")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    params = ConfigurationManager().params
+    epochs = args.epochs or params.EPOCHS
+    heads = args.heads or [params.HEAD]
+    results = {}
+    for backbone in args.backbones:
+        for head in heads:
+            results[f"{backbone}-{head}"] = benchmark_model(backbone, head, output, epochs, args.latency_runs)
+            tf.keras.backend.clear_session()
+
+    print(f"{'model':>28} {'params (M)':>11} {'GFLOPs':>8} {'latency (ms)':>13} {'size (MB)':>10} "
+          f"{'step (ms)':>10} {'train img/s':>12} {'val acc':>8}")
+    for name, r in results.items():
+        print(f"{name:>28} {r['parameters'] / 1e6:>11.2f} {r['gflops']:>8.2f} {r['cpu_latency_ms']:>13.1f} "
+              f"{r['size_mb']:>10.1f} {r['train_step_ms']:>10.1f} {r['train_images_per_second']:>12.1f} "
+              f"{r['validation_accuracy']:>8.3f}")
+
+    with open(output / "report.json", "w") as f:
+        json.dump({"epochs": epochs, "models": results}, f, indent=4)
+    print(f"Report saved at {output / 'report.json'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Generate a synthetic chest-CT-like dataset for offline and scale testing
+#
+# Writes a directory tree with the same layout as Chest-CT-Scan-data (one sub-folder
+# of PNGs per class) and, optionally, a data.zip with the same top-level folder as the
+# real archive, so every stage can be run and benchmarked without the Google Drive
+# download. Images are drawn in a process pool with a per-image seed, so the same
+# arguments always produce byte-identical files.
+#
+# The real dataset has a few hundred scans; use --images-per-class to reach 10x / 100x.
+# Every image has its own anatomy and texture, so the ingestion duplicate scan (default
+# hamming_threshold 4) keeps nearly all of them: about 99% of 1,000 and of 5,000 images.
+#
+# Usage:
+#   python benchmarks/generate_synthetic_dataset.py --output artifacts/synthetic --images-per-class 5000 --zip
+#   python benchmarks/range_http_server.py --directory artifacts/synthetic --port 8000
+#   (then point data_ingestion.source_URL at http://localhost:8000/data.zip)
+
+import os
+import time
+import zipfile
+import argparse
+import numpy as np
+from PIL import Image
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+# Top-level folder of the real archive (see ConfigurationManager.get_training_config)
+DATA_ROOT = "Chest-CT-Scan-data"
+
+
+def draw_scan(seed: int, size: int, lesion: bool) -> np.ndarray:
+    """
+    Draw one axial-CT-like slice: body ellipse, two dark lungs, mediastinum, vessels,
+    noise and, for the positive class, a bright lesion inside a lung.
+
+    Every image gets its own anatomy (slice level, patient position and tilt, body and
+    lung shape, vessel and lesion placement, a smooth intensity bias), so images differ
+    at the coarse scale the ingestion duplicate scan (8x8 difference hash) looks at,
+    not only in pixel noise.
+    """
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:size, 0:size].astype(np.float32) / size
+
+    # Patient position and tilt on the table
+    angle = rng.uniform(-0.25, 0.25)
+    cy0, cx0 = 0.5 + rng.uniform(-0.06, 0.06), 0.5 + rng.uniform(-0.06, 0.06)
+    yr = (y - cy0) * np.cos(angle) - (x - cx0) * np.sin(angle)
+    xr = (y - cy0) * np.sin(angle) + (x - cx0) * np.cos(angle)
+
+    def ellipse(cy, cx, ry, rx):
+        return ((yr - cy) / ry) ** 2 + ((xr - cx) / rx) ** 2 <= 1.0
+
+    # Slice level: lungs are small near the apex and largest mid-chest, the heart only shows lower down
+    level = rng.uniform(0.0, 1.0)
+    lung_scale = 0.45 + 0.55 * np.sin(np.pi * min(level * 1.2, 1.0))
+
+    image = np.full((size, size), 10.0, dtype=np.float32)  # Air around the patient
+    image[ellipse(0.0, 0.0, rng.uniform(0.28, 0.40), rng.uniform(0.36, 0.47))] = 150.0
+    for side in (-1, 1):
+        lung_ry = lung_scale * rng.uniform(0.17, 0.26)
+        lung_rx = lung_scale * rng.uniform(0.09, 0.15)
+        lung_cx = side * rng.uniform(0.12, 0.2)
+        image[ellipse(rng.uniform(-0.06, 0.04), lung_cx, lung_ry, lung_rx)] = 35.0 + rng.uniform(-10, 10)
+    if level > 0.4:
+        heart = rng.uniform(0.04, 0.1) * (level - 0.2)
+        image[ellipse(rng.uniform(0.0, 0.1), rng.uniform(-0.06, 0.04), heart * 1.4 + 0.03, heart + 0.03)] = 200.0
+
+    # Vessels and benign nodules (every class)
+    for _ in range(rng.integers(3, 12)):
+        radius = rng.uniform(0.005, 0.025)
+        image[ellipse(rng.uniform(-0.25, 0.25), rng.uniform(-0.35, 0.35), radius, radius)] = rng.uniform(90, 210)
+
+    if lesion:
+        radius = rng.uniform(0.02, 0.08)
+        cy, cx = rng.uniform(-0.15, 0.1), rng.choice([-1, 1]) * rng.uniform(0.08, 0.22)
+        image[ellipse(cy, cx, radius, radius * rng.uniform(0.6, 1.4))] = rng.uniform(160, 210)
+
+    # Smooth intensity bias (scanner and windowing differences) and coarse soft-tissue texture
+    gy, gx = rng.normal(0, 25, 2)
+    image += gy * (y - 0.5) + gx * (x - 0.5)
+    texture = Image.fromarray(rng.normal(0, 25, (8, 8)).astype(np.float32), mode="F")
+    image += np.asarray(texture.resize((size, size), Image.BICUBIC))
+    image += rng.normal(0, 8.0, image.shape)
+    return np.clip(image, 0, 255).astype(np.uint8)
+
+
+def write_image(task: tuple) -> int:
+    # Draw and save one PNG; returns the number of bytes written
+    path, seed, size, lesion, mode, compress_level = task
+    pixels = draw_scan(seed, size, lesion)
+    image = Image.fromarray(pixels, mode="L")
+    if mode == "RGB":
+        image = image.convert("RGB")
+    image.save(path, compress_level=compress_level)
+    return os.path.getsize(path)
+
+
+def write_zip(output: Path, zip_path: Path):
+    # PNGs are already compressed, so members are stored; the layout matches the real data.zip
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for root, _, files in sorted(os.walk(output / DATA_ROOT)):
+            for name in sorted(files):
+                path = Path(root, name)
+                archive.write(path, path.relative_to(output).as_posix())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic Chest-CT-Scan-data tree (and data.zip)")
+    parser.add_argument("--output", default="artifacts/synthetic", help="Output directory")
+    parser.add_argument("--classes", nargs="+", default=["adenocarcinoma", "normal"],
+                        help="Class folder names; every class except the last gets lesions")
+    parser.add_argument("--images-per-class", type=int, default=500)
+    parser.add_argument("--size", type=int, default=512, help="Image height and width in pixels")
+    parser.add_argument("--mode", choices=["L", "RGB"], default="RGB", help="PNG colour mode")
+    parser.add_argument("--compress-level", type=int, default=1, help="PNG zlib level (higher is smaller but slower)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="Processes drawing images (default: CPU count)")
+    parser.add_argument("--zip", action="store_true", help="Also write <output>/data.zip")
+    args = parser.parse_args()
+
+    output = Path(args.output)
+    tasks = []
+    for label, class_name in enumerate(args.classes):
+        class_dir = output / DATA_ROOT / class_name
+        os.makedirs(class_dir, exist_ok=True)
+        lesion = label < len(args.classes) - 1
+        for i in range(args.images_per_class):
+            seed = args.seed * 1_000_003 + label * 10_000_019 + i
+            tasks.append((str(class_dir / f"{class_name}_{i:07d}.png"), seed, args.size, lesion,
+                          args.mode, args.compress_level))
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        total_bytes = sum(executor.map(write_image, tasks, chunksize=64))
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {len(tasks)} images ({total_bytes / 2**20:.1f} MB) to {output / DATA_ROOT} "
+          f"in {elapsed:.1f}s ({len(tasks) / elapsed:.0f} images/s)")
+
+    if args.zip:
+        start = time.perf_counter()
+        write_zip(output, output / "data.zip")
+        print(f"Wrote {output / 'data.zip'} ({os.path.getsize(output / 'data.zip') / 2**20:.1f} MB) "
+              f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
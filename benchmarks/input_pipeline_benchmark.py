@@ -0,0 +1,50 @@
+# Compare training input throughput of the ImageDataGenerator and tf.data pipelines
+#
+# Usage (after the data ingestion stage has run):
+#   python benchmarks/input_pipeline_benchmark.py --steps 50
+#   python benchmarks/input_pipeline_benchmark.py --steps 20 --with-model
+
+import time
+import argparse
+from dataclasses import replace
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.model_trainer import Training
+
+
+def measure(training: Training, steps: int, with_model: bool) -> float:
+    # Return steps per second over `steps` training batches (after one warm-up epoch for the tf.data cache)
+    iterator = iter(training.train_generator)
+    warmup = training.train_samples // training.config.params_batch_size
+    for _ in range(warmup):
+        next(iterator)
+
+    start = time.perf_counter()
+    for _ in range(steps):
+        images, labels = next(iterator)
+        if with_model:
+            training.model.train_on_batch(images, labels)
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark training input pipelines")
+    parser.add_argument("--steps", type=int, default=50, help="Number of batches to time")
+    parser.add_argument("--with-model", action="store_true", help="Include a training step per batch")
+    args = parser.parse_args()
+
+    base_config = ConfigurationManager().get_training_config()
+
+    results = {}
+    for mode in ("generator", "tf_data"):
+        training = Training(config=replace(base_config, params_data_pipeline=mode))
+        if args.with_model:
+            training.get_base_model()
+        training.train_valid_generator()
+        results[mode] = measure(training, args.steps, args.with_model)
+        print(f"{mode:>10}: {results[mode]:.2f} steps/s")
+
+    print(f"speed-up:   {results['tf_data'] / results['generator']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
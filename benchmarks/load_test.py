@@ -0,0 +1,61 @@
+# Load test for the inference server in app.py
+#
+# Usage:
+#   python app.py &
+#   python benchmarks/load_test.py --url http://localhost:8080/predict --concurrency 32 --requests 1000
+
+import time
+import base64
+import argparse
+import requests
+from requests.adapters import HTTPAdapter
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+
+def load_payloads(image_dir: Path) -> list:
+    # Encode every sample image once so the client does not measure its own file IO
+    paths = sorted(p for p in image_dir.rglob("*") if p.suffix.lower() in {".png", ".jpg", ".jpeg"})
+    if not paths:
+        raise ValueError(f"No images found under {image_dir}")
+    return [{"image": base64.b64encode(p.read_bytes()).decode("utf-8")} for p in paths]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure latency and throughput of the /predict endpoint")
+    parser.add_argument("--url", default="http://localhost:8080/predict")
+    parser.add_argument("--images", default="sample_images", help="Directory of images to send")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=500, help="Total number of requests")
+    args = parser.parse_args()
+
+    payloads = load_payloads(Path(args.images))
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount("http://", adapter)
+
+    def send(i):
+        start = time.perf_counter()
+        response = session.post(args.url, json=payloads[i % len(payloads)])
+        response.raise_for_status()
+        return time.perf_counter() - start
+
+    # Warm up the server (first request pays model loading and graph tracing)
+    send(0)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        latencies = np.array(list(executor.map(send, range(args.requests)))) * 1000.0
+    elapsed = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"requests:     {args.requests} (concurrency {args.concurrency})")
+    print(f"p50 latency:  {p50:.1f} ms")
+    print(f"p95 latency:  {p95:.1f} ms")
+    print(f"p99 latency:  {p99:.1f} ms")
+    print(f"throughput:   {args.requests / elapsed:.1f} images/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Launch local multi-worker training runs and report the scaling efficiency
+#
+# For every worker count N the launcher starts N worker processes on this machine, each
+# with its own TF_CONFIG (localhost ports), and trains the full model with
+# DISTRIBUTION 'multi_worker' for EPOCHS. Each worker reads its own share of the
+# training files; gradients are all-reduced between the processes. The chief's
+# measured throughput is compared with the single-worker run:
+#
+#   speedup    = images/s with N workers / images/s with 1 worker
+#   efficiency = speedup / N
+#
+# Local workers share the CPU cores of one machine, so use --threads-per-worker to give
+# every worker a fixed slice of the cores; across machines, start the same worker
+# command on every node with a TF_CONFIG listing all of them and a shared output
+# directory. Models, metrics and checkpoints go to --output, so the pipeline artifacts
+# are left untouched.
+#
+# Usage (after the data split and prepare base model stages have run):
+#   python benchmarks/multi_worker_launcher.py --workers 1 2 4 --epochs 1
+#   python benchmarks/multi_worker_launcher.py --workers 1 2 --threads-per-worker 4
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import subprocess
+from pathlib import Path
+from dataclasses import replace
+
+
+def free_ports(count: int) -> list:
+    # Ask the OS for unused ports (kept open until all are chosen so they differ)
+    sockets = [socket.socket() for _ in range(count)]
+    for s in sockets:
+        s.bind(("localhost", 0))
+    ports = [s.getsockname()[1] for s in sockets]
+    for s in sockets:
+        s.close()
+    return ports
+
+
+def run_worker(run_dir: Path, epochs: int, threads: int):
+    """
+    Train as one worker of the cluster described by TF_CONFIG (runs in a child process).
+    """
+    import tensorflow as tf
+    from chest_cancer_classifier.config.configuration import ConfigurationManager
+    from chest_cancer_classifier.components.model_trainer import Training
+
+    if threads:
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+        tf.config.threading.set_inter_op_parallelism_threads(2)
+
+    config = ConfigurationManager().get_training_config()
+    config = replace(
+        config,
+        params_distribution="multi_worker",
+        params_training_mode="full",
+        # Multi-worker training needs a tf.data pipeline that can be sharded per worker
+        params_data_pipeline=config.params_data_pipeline if config.params_data_pipeline in ("tf_data", "zip", "shards") else "tf_data",
+        params_epochs=epochs,
+        trained_model_path=run_dir / "model.h5",
+        training_metrics_path=run_dir / "training_metrics.json",
+        checkpoint_dir=run_dir / "checkpoints",
+    )
+    training = Training(config=config)
+    training.get_base_model()
+    training.train_valid_generator()
+    training.train()
+
+
+def launch(workers: int, output: Path, epochs: int, threads: int) -> dict:
+    """
+    Start `workers` local worker processes and wait for them.
+
+    :return: The chief's training metrics plus the wall-clock time of the run.
+    """
+    run_dir = output / f"workers-{workers}"
+    os.makedirs(run_dir, exist_ok=True)
+    cluster = {"worker": [f"localhost:{port}" for port in free_ports(workers)]}
+
+    processes = []
+    start = time.perf_counter()
+    for index in range(workers):
+        env = dict(os.environ, TF_CONFIG=json.dumps({"cluster": cluster, "task": {"type": "worker", "index": index}}))
+        with open(run_dir / f"worker-{index}.log", "w") as log:
+            processes.append(subprocess.Popen(
+                [sys.executable, __file__, "--run-worker", "--run-dir", str(run_dir),
+                 "--epochs", str(epochs), "--threads-per-worker", str(threads)],
+                env=env, stdout=log, stderr=subprocess.STDOUT
+            ))
+
+    failed = [index for index, process in enumerate(processes) if process.wait() != 0]
+    wall_clock = time.perf_counter() - start
+    if failed:
+        raise RuntimeError(f"Workers {failed} of the {workers}-worker run failed; see the logs in {run_dir}")
+
+    with open(run_dir / "training_metrics.json") as f:
+        metrics = json.load(f)
+    metrics["wall_clock_seconds"] = wall_clock
+    return metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local multi-worker training and scaling efficiency")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2], help="Worker counts to run")
+    parser.add_argument("--epochs", type=int, default=1, help="Training epochs per run")
+    parser.add_argument("--threads-per-worker", type=int, default=0,
+                        help="TensorFlow intra-op threads of every worker (0: TensorFlow default)")
+    parser.add_argument("--output", default="artifacts/multi_worker", help="Directory for models, logs and the report")
+    parser.add_argument("--run-worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--run-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_worker:
+        run_worker(Path(args.run_dir), args.epochs, args.threads_per_worker)
+        return
+
+    output = Path(args.output)
+    # The single-worker run is the reference for the speedup
+    counts = sorted(set(args.workers) | {1})
+    results = {n: launch(n, output, args.epochs, args.threads_per_worker) for n in counts}
+
+    baseline = results[1]["train_images_per_second"]
+    print(f"{'workers':>8} {'img/s':>10} {'speedup':>8} {'efficiency':>11} {'wall clock (s)':>15}")
+    for n, r in results.items():
+        r["speedup"] = r["train_images_per_second"] / baseline
+        r["efficiency"] = r["speedup"] / n
+        print(f"{n:>8} {r['train_images_per_second']:>10.1f} {r['speedup']:>8.2f} "
+              f"{r['efficiency']:>11.2f} {r['wall_clock_seconds']:>15.1f}")
+
+    with open(output / "scaling_report.json", "w") as f:
+        json.dump({"epochs": args.epochs, "threads_per_worker": args.threads_per_worker,
+                   "runs": {str(n): r for n, r in results.items()}}, f, indent=4)
+    print(f"Report saved at {output / 'scaling_report.json'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Local HTTP stand-in for the dataset host, with Range request support
+#
+# Serves a directory like `python -m http.server`, but answers `Range: bytes=a-b`
+# requests with 206 Partial Content so ChunkedDownloader can be exercised offline.
+# --fail-every N makes every Nth request fail with a 503 to test retries and resume.
+#
+# Usage:
+#   python benchmarks/range_http_server.py --directory /path/with/data.zip --port 8000
+#   (then set data_ingestion.source_URL to http://localhost:8000/data.zip)
+
+import os
+import re
+import argparse
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+
+class RangeRequestHandler(SimpleHTTPRequestHandler):
+    fail_every = 0
+    _counter = 0
+    _lock = threading.Lock()
+
+    def do_GET(self):
+        # Optionally inject failures
+        with self._lock:
+            RangeRequestHandler._counter += 1
+            should_fail = self.fail_every and RangeRequestHandler._counter % self.fail_every == 0
+        if should_fail:
+            self.send_error(503, "Injected failure")
+            return
+
+        match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+        path = self.translate_path(self.path)
+        if not match or not os.path.isfile(path):
+            return super().do_GET()
+
+        size = os.path.getsize(path)
+        start = int(match.group(1))
+        end = min(int(match.group(2)) if match.group(2) else size - 1, size - 1)
+        if start > end:
+            self.send_error(416, "Requested range not satisfiable")
+            return
+
+        self.send_response(206)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        with open(path, "rb") as f:
+            f.seek(start)
+            self.wfile.write(f.read(end - start + 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve files with HTTP Range support")
+    parser.add_argument("--directory", default=".")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--fail-every", type=int, default=0, help="Fail every Nth request with 503 (0 disables)")
+    args = parser.parse_args()
+
+    RangeRequestHandler.fail_every = args.fail_every
+    handler = partial(RangeRequestHandler, directory=args.directory)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), handler)
+    print(f"Serving {args.directory} on http://127.0.0.1:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# Compare cold-cache read throughput of the per-file directory layout and the TFRecord shards
+#
+# Before every run the source files are evicted from the OS page cache with
+# posix_fadvise(DONTNEED) (or, with --drop-caches as root, by dropping all caches),
+# so the numbers reflect reads from disk / the network filesystem.
+#
+# Usage (after the data ingestion and data sharding stages have run):
+#   python benchmarks/shard_read_benchmark.py
+#   python benchmarks/shard_read_benchmark.py --decode --repeats 3
+
+import os
+import time
+import random
+import argparse
+import tensorflow as tf
+from pathlib import Path
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.input_pipeline import list_image_files, build_dataset
+from chest_cancer_classifier.components.data_sharding import load_shard_index, build_shard_dataset
+
+
+def evict(paths, drop_caches: bool):
+    # Push the given files out of the page cache
+    if drop_caches:
+        os.sync()
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+
+def time_dataset(dataset, total_bytes: int, count_fn) -> dict:
+    # Iterate the whole dataset once and return images/s and MB/s
+    start = time.perf_counter()
+    images = 0
+    for element in dataset:
+        images += count_fn(element)
+    elapsed = time.perf_counter() - start
+    return {"images_per_second": images / elapsed, "mb_per_second": total_bytes / 2**20 / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-cache read throughput: per-file directory vs TFRecord shards")
+    parser.add_argument("--decode", action="store_true", help="Decode and resize images instead of only reading bytes")
+    parser.add_argument("--repeats", type=int, default=1, help="Number of cold runs per layout")
+    parser.add_argument("--drop-caches", action="store_true", help="Drop all OS caches (requires root)")
+    args = parser.parse_args()
+
+    config = ConfigurationManager()
+    training_config = config.get_training_config()
+    sharding_config = config.get_data_sharding_config()
+    image_size = training_config.params_image_size[:-1]
+    batch_size = training_config.params_batch_size
+
+    filepaths, labels, class_names = list_image_files(training_config.training_data)
+    index = load_shard_index(sharding_config.index_path, data_dir=training_config.training_data)
+    shard_paths = [str(Path(sharding_config.index_path).parent / shard["path"]) for shard in index["shards"]]
+    file_bytes = sum(os.path.getsize(p) for p in filepaths)
+    shard_bytes = sum(os.path.getsize(p) for p in shard_paths)
+
+    def per_file():
+        # Random file order, as a shuffled training epoch would read them
+        order = random.sample(range(len(filepaths)), len(filepaths))
+        paths = [filepaths[i] for i in order]
+        if args.decode:
+            dataset = build_dataset(paths, [labels[i] for i in order], len(class_names), image_size, batch_size, cache=False)
+            return dataset, lambda batch: int(batch[0].shape[0])
+        dataset = tf.data.Dataset.from_tensor_slices(paths).map(tf.io.read_file, num_parallel_calls=tf.data.AUTOTUNE)
+        return dataset.prefetch(tf.data.AUTOTUNE), lambda _: 1
+
+    def sharded():
+        if args.decode:
+            dataset = build_shard_dataset(sharding_config.index_path, image_size, batch_size, shuffle=True,
+                                          cycle_length=training_config.shard_cycle_length,
+                                          shuffle_buffer=training_config.shard_shuffle_buffer)
+            return dataset, lambda batch: int(batch[0].shape[0])
+        files = tf.data.Dataset.from_tensor_slices(random.sample(shard_paths, len(shard_paths)))
+        dataset = files.interleave(lambda p: tf.data.TFRecordDataset(p, buffer_size=8 * 2**20),
+                                   cycle_length=min(training_config.shard_cycle_length, len(shard_paths)),
+                                   num_parallel_calls=tf.data.AUTOTUNE, deterministic=False)
+        return dataset.prefetch(tf.data.AUTOTUNE), lambda _: 1
+
+    layouts = {
+        "per-file": (per_file, filepaths, file_bytes),
+        "shards": (sharded, shard_paths, shard_bytes),
+    }
+    print(f"{len(filepaths)} images, {file_bytes / 2**20:.1f} MB as files, "
+          f"{shard_bytes / 2**20:.1f} MB in {len(shard_paths)} shards ({'decode' if args.decode else 'read only'})")
+
+    results = {}
+    for name, (build, paths, total_bytes) in layouts.items():
+        runs = []
+        for _ in range(args.repeats):
+            dataset, count_fn = build()
+            evict(paths, args.drop_caches)
+            runs.append(time_dataset(dataset, total_bytes, count_fn))
+        results[name] = max(runs, key=lambda r: r["images_per_second"])
+        print(f"{name:>9}: {results[name]['images_per_second']:8.1f} images/s  {results[name]['mb_per_second']:7.1f} MB/s")
+
+    print(f"speed-up:  {results['shards']['images_per_second'] / results['per-file']['images_per_second']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
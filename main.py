@@ -3,9 +3,14 @@
 
 from src.chest_cancer_classifier import logger
 from chest_cancer_classifier.pipeline.stage_1_data_ingestion import DataIngestionTrainingPipeline
+from chest_cancer_classifier.pipeline.stage_9_data_split import DataSplitPipeline
+from chest_cancer_classifier.pipeline.stage_6_data_preprocessing import DataPreprocessingPipeline
+from chest_cancer_classifier.pipeline.stage_8_data_sharding import DataShardingPipeline
 from chest_cancer_classifier.pipeline.stage_2_prepare_base_model import PrepareBaseModelTrainingPipeline
 from chest_cancer_classifier.pipeline.stage_3_model_training import ModelTrainingPipeline
 from chest_cancer_classifier.pipeline.stage_4_model_evaluation import EvaluationPipeline
+from chest_cancer_classifier.pipeline.stage_10_model_pruning import ModelPruningPipeline
+from chest_cancer_classifier.pipeline.stage_7_model_export import ModelExportPipeline
 
 # Define the name of the current stage in the data processing pipeline
 STAGE_NAME = "Data Ingestion stage"
@@ -25,6 +30,66 @@ except Exception as e:
         raise e  # Reraise the exception for further handling if necessary
 
 
+# Define the name of the current stage in the data processing pipeline
+STAGE_NAME = "Data Split stage"
+
+try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        
+        # Write (or reuse) the training / validation / test split index
+        data_split = DataSplitPipeline()
+        data_split.main()
+        
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
+
+
+# Define the name of the current stage in the data processing pipeline
+STAGE_NAME = "Data Preprocessing stage"
+
+try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        
+        # Build (or reuse) the preprocessed tensor cache
+        data_preprocessing = DataPreprocessingPipeline()
+        data_preprocessing.main()
+        
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
+
+
+# Define the name of the current stage in the data processing pipeline
+STAGE_NAME = "Data Sharding stage"
+
+try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        
+        # Pack the images into TFRecord shards (or reuse up-to-date shards)
+        data_sharding = DataShardingPipeline()
+        data_sharding.main()
+        
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
+
+
 # Define the name of the current stage in the data processing pipeline
 STAGE_NAME = "Prepare Base Model stage"
 
@@ -83,4 +148,44 @@ except Exception as e:
         # Log any exceptions that occur during the execution
         logger.exception(e)
         # Raise the exception to propagate it further
-        raise e
\ No newline at end of file
+        raise e
+
+
+# Define the name of the current stage in the data processing pipeline
+STAGE_NAME = "Model Pruning stage"
+
+try:
+        # Log the start of the pruning stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        
+        # Prune conv filters at every configured ratio, fine-tune and report the trade-off
+        model_pruning = ModelPruningPipeline()
+        model_pruning.main()
+        
+        # Log the completion of the pruning stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
+
+
+# Define the name of the current stage in the data processing pipeline
+STAGE_NAME = "Model Export stage"
+
+try:
+        # Log the start of the export stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+        
+        # Export quantized TFLite models and compare them with the Keras model
+        model_export = ModelExportPipeline()
+        model_export.main()
+        
+        # Log the completion of the export stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
@@ -0,0 +1,178 @@
+# Import libraries
+import os
+import json
+import hashlib
+import numpy as np
+from PIL import Image
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import DataPreprocessingConfig
+from chest_cancer_classifier.components.input_pipeline import list_image_files
+from chest_cancer_classifier.components.dataset_manifest import file_hashes
+
+
+def compute_source_fingerprint(data_dir: Path, filepaths: list) -> str:
+    """
+    Fingerprint the source images by relative path, size and modification time.
+
+    :param data_dir: Dataset root directory.
+    :param filepaths: Image files under `data_dir`.
+    :return: Hex digest that changes whenever a file is added, removed or modified.
+    """
+    digest = hashlib.sha256()
+    for path in filepaths:
+        stat = os.stat(path)
+        digest.update(f"{os.path.relpath(path, data_dir)}|{stat.st_size}|{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+def _load_resized(path: str, image_size) -> np.ndarray:
+    """
+    Decode an image and resize it the same way the training pipelines do (RGB, bilinear).
+    """
+    with Image.open(path) as image:
+        image = image.convert("RGB").resize((image_size[1], image_size[0]), Image.BILINEAR)
+        return np.asarray(image, dtype=np.uint8)
+
+
+def load_tensor_cache(images_path: Path, index_path: Path, data_dir: Path = None, image_size=None):
+    """
+    Open the preprocessed tensor cache for reading.
+
+    The image array is memory-mapped, so slicing it does not copy data until it is used.
+    When `data_dir` / `image_size` are given the cache is validated against them.
+
+    :param images_path: Path to the `.npy` image array.
+    :param index_path: Path to the JSON index sidecar.
+    :param data_dir: Source dataset directory to validate against.
+    :param image_size: Expected [height, width, channels].
+    :raises ValueError: If the cache is missing or stale.
+    :return: Tuple of (memory-mapped uint8 images, int labels, index dict).
+    """
+    if not (os.path.exists(images_path) and os.path.exists(index_path)):
+        raise ValueError(f"Tensor cache not found at {images_path}; run the data preprocessing stage first")
+
+    with open(index_path) as f:
+        index = json.load(f)
+
+    if image_size is not None and list(index["image_size"]) != list(image_size):
+        raise ValueError(f"Tensor cache was built for IMAGE_SIZE {index['image_size']}, expected {list(image_size)}")
+    if data_dir is not None:
+        filepaths, _, _ = list_image_files(data_dir)
+        if compute_source_fingerprint(data_dir, filepaths) != index["fingerprint"]:
+            raise ValueError("Source images changed since the tensor cache was built; rerun the data preprocessing stage")
+
+    images = np.load(images_path, mmap_mode="r")
+    if images.shape != (len(index["labels"]), *index["image_size"]):
+        raise ValueError("Tensor cache array does not match its index; rerun the data preprocessing stage")
+    labels = np.asarray(index["labels"], dtype=np.int64)
+    return images, labels, index
+
+
+class DataPreprocessing:
+    def __init__(self, config: DataPreprocessingConfig):
+        """
+        Initialize the DataPreprocessing class with a DataPreprocessingConfig object.
+
+        :param config: DataPreprocessingConfig object containing the cache locations and image size.
+        """
+        self.config = config
+
+    def is_cache_valid(self) -> bool:
+        """
+        Check whether the on-disk cache matches the current IMAGE_SIZE and source images.
+        """
+        try:
+            load_tensor_cache(
+                self.config.images_path, self.config.index_path,
+                data_dir=self.config.data_dir, image_size=self.config.params_image_size
+            )
+            return True
+        except (ValueError, KeyError, json.JSONDecodeError):
+            return False
+
+    def _reusable_rows(self, image_size):
+        """
+        Open the previous cache and map its content hashes to rows.
+
+        :return: Tuple of (memory-mapped images or None, dict of sha256 -> row).
+        """
+        try:
+            with open(self.config.index_path) as f:
+                index = json.load(f)
+            if list(index["image_size"]) != list(image_size) or "hashes" not in index:
+                return None, {}
+            images = np.load(self.config.images_path, mmap_mode="r")
+        except (OSError, ValueError, KeyError):
+            return None, {}
+        if images.shape[0] != len(index["hashes"]):
+            return None, {}
+        return images, {digest: row for row, digest in enumerate(index["hashes"])}
+
+    def build_tensor_cache(self, num_workers: int = None):
+        """
+        Decode and resize every image once and write them into a memory-mapped uint8 array.
+
+        Rows are stored in `flow_from_directory` order (class by class, sorted file names),
+        and a JSON sidecar records the file list, per-file content hashes, labels, class
+        names, image size and a fingerprint of the source data. When the source images
+        change, rows of the previous cache whose content hash is unchanged are copied
+        over, so only new or modified images are decoded.
+
+        :param num_workers: Threads used to decode images (defaults to the CPU count).
+        """
+        if self.is_cache_valid():
+            logger.info(f"Tensor cache at {self.config.images_path} is up to date, skipping")
+            return
+
+        image_size = list(self.config.params_image_size)
+        filepaths, labels, class_names = list_image_files(self.config.data_dir)
+        hashes = file_hashes(self.config.data_dir, filepaths, self.config.manifest_path, num_workers)
+
+        os.makedirs(self.config.root_dir, exist_ok=True)
+        tmp_images_path = f"{self.config.images_path}.tmp.npy"
+
+        # Preallocate the array on disk and fill it row by row
+        images = np.lib.format.open_memmap(
+            tmp_images_path, mode="w+", dtype=np.uint8, shape=(len(filepaths), *image_size)
+        )
+
+        # Copy rows whose content is already in the previous cache
+        old_images, old_rows = self._reusable_rows(image_size)
+        pending = []
+        for i, digest in enumerate(hashes):
+            if digest in old_rows:
+                images[i] = old_images[old_rows[digest]]
+            else:
+                pending.append(i)
+        del old_images
+        logger.info(f"Building tensor cache at {image_size}: decoding {len(pending)} of {len(filepaths)} images")
+
+        with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+            arrays = executor.map(lambda i: _load_resized(filepaths[i], image_size), pending)
+            for i, array in zip(pending, arrays):
+                images[i] = array
+        images.flush()
+        del images
+
+        index = {
+            "image_size": image_size,
+            "fingerprint": compute_source_fingerprint(self.config.data_dir, filepaths),
+            "class_names": class_names,
+            "files": [os.path.relpath(p, self.config.data_dir) for p in filepaths],
+            "hashes": hashes,
+            "labels": labels,
+        }
+
+        # The two files cannot be replaced together: remove the old index first and write the
+        # new one last, so a crash in between leaves an array without an index (read as a
+        # missing cache and rebuilt) rather than a new array next to a stale index
+        with open(f"{self.config.index_path}.tmp", "w") as f:
+            json.dump(index, f)
+        if os.path.exists(self.config.index_path):
+            os.remove(self.config.index_path)
+        os.replace(tmp_images_path, self.config.images_path)
+        os.replace(f"{self.config.index_path}.tmp", self.config.index_path)
+
+        logger.info(f"Tensor cache saved at {self.config.images_path}")
@@ -0,0 +1,291 @@
+# Import libraries
+import os
+import json
+import random
+import tensorflow as tf
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import DataShardingConfig
+from chest_cancer_classifier.components.input_pipeline import (list_image_files,
+                                                                batch_and_prefetch,
+                                                                _decode_and_resize)
+from chest_cancer_classifier.components.data_preprocessing import compute_source_fingerprint
+from chest_cancer_classifier.components.data_validation import load_excluded_files
+
+# Bytes TFRecord adds around every record: length (8) + length CRC (4) + data CRC (4)
+TFRECORD_OVERHEAD = 16
+
+# Features stored in every record
+FEATURE_DESCRIPTION = {
+    "image": tf.io.FixedLenFeature([], tf.string),  # Encoded image file, as stored on disk
+    "label": tf.io.FixedLenFeature([], tf.int64),  # Class index
+    "position": tf.io.FixedLenFeature([], tf.int64),  # Rank of the file within its class (flow_from_directory order)
+}
+
+
+def _serialize(image_bytes: bytes, label: int, position: int) -> bytes:
+    """
+    Serialize one image into a tf.train.Example.
+    """
+    feature = {
+        "image": tf.train.Feature(bytes_list=tf.train.BytesList(value=[image_bytes])),
+        "label": tf.train.Feature(int64_list=tf.train.Int64List(value=[label])),
+        "position": tf.train.Feature(int64_list=tf.train.Int64List(value=[position])),
+    }
+    return tf.train.Example(features=tf.train.Features(feature=feature)).SerializeToString()
+
+
+def load_shard_index(index_path: Path, data_dir: Path = None) -> dict:
+    """
+    Read the shard index, optionally checking it against the source images.
+
+    :param index_path: Path to the JSON index written by `DataSharding`.
+    :param data_dir: Source dataset directory to validate against.
+    :raises ValueError: If the index is missing or the source images changed.
+    :return: The index dictionary.
+    """
+    if not os.path.exists(index_path):
+        raise ValueError(f"Shard index not found at {index_path}; run the data sharding stage first")
+
+    with open(index_path) as f:
+        index = json.load(f)
+
+    if data_dir is not None:
+        filepaths, _, _ = list_image_files(data_dir)
+        if compute_source_fingerprint(data_dir, filepaths) != index["fingerprint"]:
+            raise ValueError("Source images changed since the shards were written; rerun the data sharding stage")
+    return index
+
+
+def build_shard_dataset(index_path: Path, image_size, batch_size: int, files=None,
+                        shuffle: bool = False, augment: bool = False, repeat: bool = False,
+                        shuffle_buffer: int = 1024, cycle_length: int = 4,
+                        seed: int = None, num_workers: int = 1, worker_index: int = 0) -> tf.data.Dataset:
+    """
+    Build a tf.data pipeline that streams images from the TFRecord shards.
+
+    Shards are read sequentially and `cycle_length` of them are interleaved in
+    parallel; shuffled pipelines also shuffle the shard order every epoch and mix
+    records through a shuffle buffer. A subset (e.g. from the split index) is
+    selected per record by its (label, rank) pair, so all subsets share one set of
+    shards. For multi-worker training every worker reads its own shard files (see
+    `worker_shard_files`).
+
+    :param index_path: Path to the shard index.
+    :param image_size: (height, width) to resize to.
+    :param batch_size: Batch size.
+    :param files: Paths relative to the dataset root to keep, or None for all records.
+    :param shuffle: Shuffle shards and records every epoch.
+    :param augment: Apply random augmentation to every batch.
+    :param repeat: Repeat the dataset indefinitely.
+    :param shuffle_buffer: Number of records in the shuffle buffer.
+    :param cycle_length: Number of shards read concurrently.
+    :param seed: Shuffle seed.
+    :param num_workers: Number of training workers.
+    :param worker_index: Index of this worker.
+    :return: A batched, prefetched tf.data.Dataset.
+    """
+    autotune = tf.data.AUTOTUNE
+    index = load_shard_index(index_path)
+    shard_dir = Path(index_path).parent
+    shard_paths = [str(shard_dir / shard["path"]) for shard in _worker_shards(index, num_workers, worker_index)]
+
+    paths = tf.data.Dataset.from_tensor_slices(shard_paths)
+    if shuffle:
+        paths = paths.shuffle(len(shard_paths), seed=seed, reshuffle_each_iteration=True)
+    if repeat:
+        paths = paths.repeat()
+
+    # Sequential reads within a shard, several shards in flight at once
+    dataset = paths.interleave(
+        lambda path: tf.data.TFRecordDataset(path, buffer_size=8 * 2**20),
+        cycle_length=min(cycle_length, len(shard_paths)),
+        num_parallel_calls=autotune,
+        deterministic=not shuffle
+    )
+    dataset = dataset.map(
+        lambda record: tf.io.parse_single_example(record, FEATURE_DESCRIPTION),
+        num_parallel_calls=autotune
+    )
+
+    # Keep the records of the requested subset before paying for the decode
+    if files is not None:
+        selected = shard_subset_mask(index, files)
+        dataset = dataset.filter(lambda r: tf.gather_nd(selected, tf.stack([r["label"], r["position"]])))
+
+    if shuffle:
+        dataset = dataset.shuffle(shuffle_buffer, seed=seed, reshuffle_each_iteration=True)
+
+    # The record already holds the encoded bytes, so "reading" is the identity
+    dataset = dataset.map(lambda r: (r["image"], r["label"]), num_parallel_calls=autotune)
+    dataset = dataset.map(_decode_and_resize(tuple(image_size), read_fn=lambda data: data),
+                          num_parallel_calls=autotune)
+
+    return batch_and_prefetch(dataset, len(index["class_names"]), batch_size, augment)
+
+
+def _worker_shards(index: dict, num_workers: int, worker_index: int) -> list:
+    # Every num_workers-th shard, so each worker reads whole files and no record twice
+    if len(index["shards"]) < num_workers:
+        raise ValueError(f"{len(index['shards'])} shards cannot be divided among {num_workers} workers; "
+                         "lower shard_size_mb in config.yaml and rerun the data sharding stage")
+    return index["shards"][worker_index::num_workers]
+
+
+def worker_shard_files(index: dict, num_workers: int, worker_index: int) -> list:
+    """
+    Files stored in the shards read by one training worker.
+
+    :param index: Shard index.
+    :param num_workers: Number of training workers.
+    :param worker_index: Index of the worker.
+    :return: Paths relative to the dataset root.
+    """
+    return [
+        Path(name).as_posix()
+        for shard in _worker_shards(index, num_workers, worker_index) for name in shard["files"]
+    ]
+
+
+def shard_subset_mask(index: dict, files) -> tf.Tensor:
+    """
+    Boolean [class, rank] table marking the records of the given files.
+
+    :param index: Shard index.
+    :param files: Paths relative to the dataset root.
+    :raises ValueError: If a file is not in the shards.
+    :return: A bool tensor indexed by (label, position).
+    """
+    wanted = {Path(f).as_posix() for f in files}
+    mask = [[False] * count for count in index["class_counts"]]
+    found = 0
+    for shard in index["shards"]:
+        for name, label, position in zip(shard["files"], shard["labels"], shard["positions"]):
+            if Path(name).as_posix() in wanted:
+                mask[label][position] = True
+                found += 1
+    if found != len(wanted):
+        raise ValueError(f"{len(wanted) - found} files of the subset are not in the shards; rerun the data sharding stage")
+    width = max(index["class_counts"], default=0)
+    return tf.constant([row + [False] * (width - len(row)) for row in mask], tf.bool)
+
+
+class DataSharding:
+    def __init__(self, config: DataShardingConfig):
+        """
+        Initialize the DataSharding class with a DataShardingConfig object.
+
+        :param config: DataShardingConfig object containing the shard locations and shard size.
+        """
+        self.config = config
+
+    def is_up_to_date(self) -> bool:
+        """
+        Check whether the shards match the current source images, exclusions and shard size.
+        """
+        try:
+            index = load_shard_index(self.config.index_path, data_dir=self.config.data_dir)
+        except (ValueError, KeyError, json.JSONDecodeError):
+            return False
+        excluded = sorted(load_excluded_files(self.config.validation_report_path))
+        return index.get("shard_size") == self.config.shard_size and index.get("excluded") == excluded and all(
+            (Path(self.config.index_path).parent / shard["path"]).exists() for shard in index["shards"]
+        )
+
+    def _plan_shards(self, filepaths: list) -> list:
+        """
+        Assign files to shards of roughly `shard_size` bytes.
+
+        Files are shuffled with a fixed seed first, so every shard holds a mix of
+        classes and a shard-level shuffle already gives well-mixed batches.
+        """
+        order = list(range(len(filepaths)))
+        random.Random(42).shuffle(order)
+
+        shards, current, current_size = [], [], 0
+        for i in order:
+            size = os.path.getsize(filepaths[i]) + TFRECORD_OVERHEAD
+            if current and current_size + size > self.config.shard_size:
+                shards.append(current)
+                current, current_size = [], 0
+            current.append(i)
+            current_size += size
+        if current:
+            shards.append(current)
+        return shards
+
+    def write_shards(self, num_workers: int = None):
+        """
+        Pack the ingested images into TFRecord shards and write the shard index.
+
+        Records keep the original encoded bytes (no decode), the label, and the file's
+        rank within its class. Files excluded by the validation report are left out.
+        The index lists, per shard, the relative file names, labels, ranks and byte
+        offsets of its records. Nothing is rewritten when the shards already match the
+        source images.
+
+        :param num_workers: Threads writing shards in parallel (defaults to the CPU count).
+        """
+        if self.is_up_to_date():
+            logger.info(f"Shards at {self.config.root_dir} are up to date, skipping")
+            return
+
+        excluded = load_excluded_files(self.config.validation_report_path)
+        filepaths, labels, class_names = list_image_files(self.config.data_dir, exclude=excluded)
+        class_counts = [labels.count(label) for label in range(len(class_names))]
+        positions = []
+        for label, count in enumerate(class_counts):
+            positions.extend(range(count))  # list_image_files groups files by class
+
+        plan = self._plan_shards(filepaths)
+        os.makedirs(self.config.root_dir, exist_ok=True)
+        logger.info(f"Writing {len(filepaths)} images into {len(plan)} shards")
+
+        def write(shard_id: int) -> dict:
+            name = f"shard-{shard_id:05d}-of-{len(plan):05d}.tfrecord"
+            path = Path(self.config.root_dir, name)
+            entry = {"path": name, "files": [], "labels": [], "positions": [], "offsets": []}
+            offset = 0
+
+            # Write under a temporary name so a crash never leaves a truncated shard behind
+            with tf.io.TFRecordWriter(f"{path}.tmp") as writer:
+                for i in plan[shard_id]:
+                    with open(filepaths[i], "rb") as f:
+                        record = _serialize(f.read(), labels[i], positions[i])
+                    writer.write(record)
+                    entry["files"].append(os.path.relpath(filepaths[i], self.config.data_dir))
+                    entry["labels"].append(labels[i])
+                    entry["positions"].append(positions[i])
+                    entry["offsets"].append(offset)
+                    offset += len(record) + TFRECORD_OVERHEAD
+            os.replace(f"{path}.tmp", path)
+
+            entry["num_records"] = len(plan[shard_id])
+            entry["size"] = offset
+            return entry
+
+        with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+            shards = list(executor.map(write, range(len(plan))))
+
+        # Remove shards left over from an earlier layout
+        names = {shard["path"] for shard in shards}
+        for stale in Path(self.config.root_dir).glob("shard-*.tfrecord"):
+            if stale.name not in names:
+                stale.unlink()
+
+        all_filepaths, _, _ = list_image_files(self.config.data_dir)
+        index = {
+            "fingerprint": compute_source_fingerprint(self.config.data_dir, all_filepaths),
+            "shard_size": self.config.shard_size,
+            "excluded": sorted(excluded),
+            "class_names": class_names,
+            "class_counts": class_counts,
+            "num_records": len(filepaths),
+            "shards": shards,
+        }
+        with open(f"{self.config.index_path}.tmp", "w") as f:
+            json.dump(index, f)
+        os.replace(f"{self.config.index_path}.tmp", self.config.index_path)
+
+        logger.info(f"Shard index saved at {self.config.index_path}")
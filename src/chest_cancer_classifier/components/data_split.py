@@ -0,0 +1,156 @@
+# Import libraries
+import os
+import json
+import hashlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import DataSplitConfig
+from chest_cancer_classifier.components.input_pipeline import list_image_files
+from chest_cancer_classifier.components.dataset_manifest import file_hashes
+from chest_cancer_classifier.components.data_validation import load_excluded_files
+from chest_cancer_classifier.components.zip_dataset import ZipImageReader, list_zip_images
+
+# Subsets written to the split index
+SUBSETS = ("training", "validation", "test")
+
+
+def load_split_index(split_index_path: Path) -> dict:
+    """
+    Read the split index written by the data split stage.
+
+    :param split_index_path: Path to the JSON split index.
+    :raises ValueError: If the index does not exist.
+    :return: The index dictionary.
+    """
+    if not os.path.exists(split_index_path):
+        raise ValueError(f"Split index not found at {split_index_path}; run the data split stage first")
+    with open(split_index_path) as f:
+        return json.load(f)
+
+
+def load_split(split_index_path: Path, subset: str, data_dir: Path = None):
+    """
+    Files and labels of one subset of the persisted split.
+
+    :param split_index_path: Path to the JSON split index.
+    :param subset: "training", "validation" or "test".
+    :param data_dir: Dataset root to join the relative paths with (relative paths if None).
+    :return: Tuple of (file paths, integer labels, class names).
+    """
+    index = load_split_index(split_index_path)
+    split = index["splits"][subset]
+    files = split["files"] if data_dir is None else [os.path.join(data_dir, f) for f in split["files"]]
+    return files, split["labels"], index["class_names"]
+
+
+def split_digest(split_index_path: Path, subset: str) -> str:
+    """
+    Content digest of one subset (file names, content hashes and labels).
+
+    Caches of anything computed from a subset can use it as their key.
+    """
+    return load_split_index(split_index_path)["digests"][subset]
+
+
+class DataSplit:
+    def __init__(self, config: DataSplitConfig):
+        """
+        Initialize the DataSplit class with a DataSplitConfig object.
+
+        :param config: DataSplitConfig object containing the dataset, index path and split fractions.
+        """
+        self.config = config
+
+    def _rank_key(self, content_hash: str) -> str:
+        # Seeded, content-based order: the ranking does not depend on file names, and
+        # identical copies sort next to each other
+        return hashlib.sha256(f"{self.config.params_seed}:{content_hash}".encode()).hexdigest()
+
+    def list_images(self) -> tuple:
+        """
+        Relative paths, labels, class names and content hashes of the images to split.
+
+        Images come from the extracted tree, or straight from data.zip when extraction is
+        disabled (DATA_PIPELINE: zip). Files excluded by the validation report are left out.
+
+        :return: Tuple of (posix paths relative to the dataset root, labels, class names, sha256 digests).
+        """
+        excluded = load_excluded_files(self.config.validation_report_path)
+        if self.config.extract_archive:
+            filepaths, labels, class_names = list_image_files(self.config.data_dir, exclude=excluded)
+            hashes = file_hashes(self.config.data_dir, filepaths, self.config.manifest_path)
+            relpaths = [Path(os.path.relpath(p, self.config.data_dir)).as_posix() for p in filepaths]
+            return relpaths, labels, class_names, hashes
+
+        reader = ZipImageReader(self.config.source_zip_path)
+        try:
+            names, labels, class_names = list_zip_images(reader, self.config.zip_data_root, exclude=excluded)
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                hashes = list(executor.map(lambda name: hashlib.sha256(reader.read(name)).hexdigest(), names))
+        finally:
+            reader.close()
+        prefix = self.config.zip_data_root.strip("/") + "/"
+        return [name[len(prefix):] for name in names], labels, class_names, hashes
+
+    def write_split_index(self) -> dict:
+        """
+        Assign every image to the training, validation or test subset and persist the result.
+
+        The split is stratified (each class is divided with the same fractions) and
+        deterministic: within a class, files are ranked by a seeded hash of their
+        content and the first round(n * VALIDATION_SPLIT) / round(n * TEST_SPLIT) files
+        go to validation and test. Files excluded by the validation report are left out
+        of every subset. The index is only rewritten when the assignment changes.
+
+        :raises ValueError: If a class would get no file in a subset with a non-zero fraction.
+        :return: The split index.
+        """
+        relpaths, labels, class_names, hashes = self.list_images()
+
+        assignment = {}
+        for label, class_name in enumerate(class_names):
+            rows = [i for i, l in enumerate(labels) if l == label]
+            rows.sort(key=lambda i: (self._rank_key(hashes[i]), relpaths[i]))
+            n_valid = int(round(self.config.params_validation_split * len(rows)))
+            n_test = int(round(self.config.params_test_split * len(rows)))
+            sizes = {"training": len(rows) - n_valid - n_test, "validation": n_valid, "test": n_test}
+            fractions = {"training": 1.0 - self.config.params_validation_split - self.config.params_test_split,
+                         "validation": self.config.params_validation_split, "test": self.config.params_test_split}
+            empty = [subset for subset in SUBSETS if fractions[subset] > 0 and sizes[subset] < 1]
+            if empty:
+                raise ValueError(f"Class '{class_name}' has {len(rows)} files, too few to give the "
+                                 f"{', '.join(empty)} subset(s) at least one; lower the split fractions or add files")
+            for rank, i in enumerate(rows):
+                assignment[i] = "validation" if rank < n_valid else "test" if rank < n_valid + n_test else "training"
+
+        # Every subset keeps flow_from_directory order (class by class, sorted paths)
+        splits, digests = {}, {}
+        for subset in SUBSETS:
+            rows = [i for i in range(len(relpaths)) if assignment[i] == subset]
+            splits[subset] = {"files": [relpaths[i] for i in rows], "labels": [labels[i] for i in rows]}
+            digests[subset] = hashlib.sha256(json.dumps(
+                [[relpaths[i], hashes[i], labels[i]] for i in rows]
+            ).encode()).hexdigest()
+
+        index = {
+            "seed": self.config.params_seed,
+            "validation_split": self.config.params_validation_split,
+            "test_split": self.config.params_test_split,
+            "class_names": class_names,
+            "digests": digests,
+            "splits": splits,
+        }
+
+        if os.path.exists(self.config.split_index_path) and load_split_index(self.config.split_index_path) == index:
+            logger.info(f"Split index at {self.config.split_index_path} is unchanged")
+            return index
+
+        os.makedirs(Path(self.config.split_index_path).parent, exist_ok=True)
+        with open(f"{self.config.split_index_path}.tmp", "w") as f:
+            json.dump(index, f)
+        os.replace(f"{self.config.split_index_path}.tmp", self.config.split_index_path)
+
+        sizes = ", ".join(f"{subset}: {len(splits[subset]['files'])}" for subset in SUBSETS)
+        logger.info(f"Split index saved at {self.config.split_index_path} ({sizes})")
+        return index
@@ -0,0 +1,261 @@
+# Import libraries
+import io
+import os
+import json
+import shutil
+import itertools
+from PIL import Image
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import DataValidationConfig
+from chest_cancer_classifier.components.input_pipeline import list_image_files
+from chest_cancer_classifier.components.zip_dataset import ZipImageReader, list_zip_images
+
+
+def difference_hash(image: Image.Image, hash_size: int = 8) -> int:
+    """
+    64-bit difference hash (dHash) of an image.
+
+    The image is shrunk to (hash_size + 1) x hash_size grayscale pixels and every bit
+    records whether a pixel is brighter than its right neighbour, so re-encoding,
+    resizing and small intensity changes flip only a few bits.
+    """
+    pixels = list(image.convert("L").resize((hash_size + 1, hash_size), Image.BILINEAR).getdata())
+    value = 0
+    for row in range(hash_size):
+        for col in range(hash_size):
+            left = pixels[row * (hash_size + 1) + col]
+            right = pixels[row * (hash_size + 1) + col + 1]
+            value = (value << 1) | int(left > right)
+    return value
+
+
+def inspect_image(source) -> tuple:
+    """
+    Fully decode an image and compute its perceptual hash.
+
+    Runs in a worker process.
+
+    :param source: Image file path, or the encoded bytes of the image.
+    :return: Tuple of (error message or None, dHash or None).
+    """
+    try:
+        # verify() catches structural damage, load() catches truncated pixel data
+        with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+            image.verify()
+        with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as image:
+            image.load()
+            return None, difference_hash(image)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", None
+
+
+def inspect_zip_member(reader: ZipImageReader, name: str) -> tuple:
+    """
+    `inspect_image` for a member of a zip archive (the worker opens its own handle).
+    """
+    try:
+        data = reader.read(name)
+    except Exception as e:
+        return f"{type(e).__name__}: {e}", None
+    return inspect_image(data)
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over integer hashes with Hamming distance.
+
+    Children are keyed by their distance to the parent, and the triangle inequality
+    limits a radius-r query to the children at distance d - r .. d + r, so lookups
+    visit only a small part of the tree instead of every stored hash.
+    """
+
+    def __init__(self):
+        self.root = None  # [hash, item, {distance: child}]
+
+    @staticmethod
+    def distance(a: int, b: int) -> int:
+        return bin(a ^ b).count("1")
+
+    def add(self, value: int, item):
+        """
+        Insert a hash with an associated item.
+        """
+        if self.root is None:
+            self.root = [value, item, {}]
+            return
+        node = self.root
+        while True:
+            d = self.distance(value, node[0])
+            child = node[2].get(d)
+            if child is None:
+                node[2][d] = [value, item, {}]
+                return
+            node = child
+
+    def query(self, value: int, radius: int) -> list:
+        """
+        Return the items of every stored hash within `radius` of `value`.
+        """
+        if self.root is None:
+            return []
+        matches, stack = [], [self.root]
+        while stack:
+            node = stack.pop()
+            d = self.distance(value, node[0])
+            if d <= radius:
+                matches.append(node[1])
+            for child_distance, child in node[2].items():
+                if d - radius <= child_distance <= d + radius:
+                    stack.append(child)
+        return matches
+
+
+def load_excluded_files(report_path: Path) -> set:
+    """
+    Files the validation report marks for exclusion from training and evaluation.
+
+    :param report_path: Path to the validation report.
+    :return: Set of paths relative to the dataset root (empty if there is no report).
+    """
+    if not report_path or not os.path.exists(report_path):
+        return set()
+    with open(report_path) as f:
+        return set(json.load(f)["excluded"])
+
+
+class DataValidation:
+    def __init__(self, config: DataValidationConfig):
+        """
+        Initialize the DataValidation class with a DataValidationConfig object.
+
+        :param config: DataValidationConfig object containing the dataset, quarantine and report paths.
+        """
+        self.config = config
+
+    def validate(self) -> dict:
+        """
+        Decode every image, quarantine broken files and find near-duplicate scans.
+
+        Images are decoded in a process pool, from the extracted tree or, when
+        extraction is disabled (DATA_PIPELINE: zip), straight from data.zip. Files that
+        fail to decode are listed as quarantined and excluded; extracted ones are also
+        moved into the quarantine directory (keeping their relative path), so no input
+        pipeline ever sees them, and flagged in the extraction manifest, so extraction
+        does not restore them until the archive member changes; flagged members stay
+        listed as quarantined on later runs. Near-duplicates (dHash within the configured
+        Hamming distance, including exact copies) are grouped around representatives
+        kept in a BK-tree: every image joins the closest earlier representative within
+        the threshold, or becomes a representative itself. Every member is therefore a
+        direct match of its representative, and matches cannot chain through a series
+        of similar images (e.g. adjacent CT slices) into one large group. The
+        representative of every group is kept and the rest are listed as excluded;
+        a group whose direct matches carry different classes has contradictory labels
+        and is excluded entirely.
+
+        :raises ValueError: If more than `max_excluded_fraction` of the images would be
+            quarantined or excluded (the report is still written for inspection).
+        :return: The report, also written to `report_path`.
+        """
+        if self.config.extract_archive:
+            filepaths, labels, class_names = list_image_files(self.config.data_dir)
+            relpaths = [Path(os.path.relpath(p, self.config.data_dir)).as_posix() for p in filepaths]
+        else:
+            reader = ZipImageReader(self.config.source_zip_path)
+            try:
+                filepaths, labels, class_names = list_zip_images(reader, self.config.zip_data_root)
+            finally:
+                reader.close()
+            relpaths = [name[len(self.config.zip_data_root.strip("/")) + 1:] for name in filepaths]
+        logger.info(f"Checking {len(filepaths)} images with {self.config.num_workers or os.cpu_count()} processes")
+
+        with ProcessPoolExecutor(max_workers=self.config.num_workers) as executor:
+            if self.config.extract_archive:
+                results = list(executor.map(inspect_image, filepaths, chunksize=32))
+            else:
+                results = list(executor.map(inspect_zip_member, itertools.repeat(reader), filepaths, chunksize=32))
+
+        # Members quarantined by an earlier run and not extracted again since (a file back
+        # in the tree is checked again instead)
+        prefix = self.config.zip_data_root.strip("/") + "/"
+        extract_manifest = {}
+        if self.config.extract_archive and os.path.exists(self.config.extract_manifest_path):
+            with open(self.config.extract_manifest_path) as f:
+                extract_manifest = json.load(f)
+        present = {prefix + relpath for relpath in relpaths}
+        quarantined = []
+        for name, entry in sorted(extract_manifest.items()):
+            if entry.get("quarantined") and name in present:
+                del entry["quarantined"]
+            elif entry.get("quarantined"):
+                quarantined.append({"file": name[len(prefix):], "error": entry["quarantined"]})
+        carried = len(quarantined)
+
+        # Move undecodable files out of the dataset (members of data.zip can only be excluded)
+        for path, relpath, (error, _) in zip(filepaths, relpaths, results):
+            if error is None:
+                continue
+            if self.config.extract_archive:
+                target = Path(self.config.quarantine_dir, relpath)
+                os.makedirs(target.parent, exist_ok=True)
+                shutil.move(path, target)
+                if prefix + relpath in extract_manifest:
+                    extract_manifest[prefix + relpath]["quarantined"] = error
+            quarantined.append({"file": relpath, "error": error})
+            logger.warning(f"Quarantined undecodable image {relpath}: {error}")
+
+        if extract_manifest:
+            with open(f"{self.config.extract_manifest_path}.tmp", "w") as f:
+                json.dump(extract_manifest, f)
+            os.replace(f"{self.config.extract_manifest_path}.tmp", self.config.extract_manifest_path)
+
+        # Group near-duplicates around representatives; only representatives go into the
+        # tree, so an image is only ever compared with (and grouped by) a kept file
+        tree = BKTree()
+        groups = {}
+        for i, (error, dhash) in enumerate(results):
+            if error is None:
+                matches = tree.query(dhash, self.config.hamming_threshold)
+                if matches:
+                    # Closest representative, the earliest one on ties
+                    closest = min(matches, key=lambda j: (BKTree.distance(dhash, results[j][1]), j))
+                    groups[closest].append(i)
+                else:
+                    groups[i] = [i]
+                    tree.add(dhash, i)
+
+        duplicate_groups, excluded = [], [entry["file"] for entry in quarantined]
+        for members in sorted((sorted(m) for m in groups.values() if len(m) > 1), key=lambda m: m[0]):
+            classes = sorted({class_names[labels[i]] for i in members})
+            duplicate_groups.append({"files": [relpaths[i] for i in members], "classes": classes})
+            dropped = members if len(classes) > 1 else members[1:]
+            excluded.extend(relpaths[i] for i in dropped)
+
+        checked = len(filepaths) + carried
+        removed_fraction = len(excluded) / max(checked, 1)
+        report = {
+            "checked": checked,
+            "hamming_threshold": self.config.hamming_threshold,
+            "removed_fraction": removed_fraction,
+            "quarantined": quarantined,
+            "duplicate_groups": duplicate_groups,
+            "excluded": excluded,
+        }
+        os.makedirs(Path(self.config.report_path).parent, exist_ok=True)
+        with open(self.config.report_path, "w") as f:
+            json.dump(report, f, indent=4)
+
+        logger.info(
+            f"Validation report saved at {self.config.report_path}: {len(quarantined)} quarantined, "
+            f"{len(duplicate_groups)} duplicate groups, {len(excluded)} files excluded"
+        )
+
+        # Losing a large part of the dataset points at a bad threshold or broken data, not at duplicates
+        if removed_fraction > self.config.max_excluded_fraction:
+            raise ValueError(
+                f"Validation would remove {removed_fraction:.1%} of the images (limit "
+                f"{self.config.max_excluded_fraction:.1%}); check {self.config.report_path} and the "
+                "data_validation hamming_threshold"
+            )
+        return report
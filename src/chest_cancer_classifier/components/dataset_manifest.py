@@ -0,0 +1,205 @@
+# Import libraries
+import io
+import os
+import time
+import hashlib
+import zipfile
+import numpy as np
+from PIL import Image
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.components.downloader import sha256_file
+from chest_cancer_classifier.components.input_pipeline import list_image_files
+from chest_cancer_classifier.components.zip_dataset import ZipImageReader, list_zip_images
+
+
+def _describe(path: str) -> tuple:
+    """
+    Hash one image and read its dimensions from the header (no full decode).
+
+    :return: Tuple of (sha256 hex digest, height, width); dimensions are -1 if unreadable.
+    """
+    digest = sha256_file(path)
+    try:
+        with Image.open(path) as image:
+            width, height = image.size
+    except Exception:
+        height, width = -1, -1
+    return digest, height, width
+
+
+def _describe_member(reader: ZipImageReader, name: str) -> tuple:
+    """
+    `_describe` for a member of a zip archive.
+    """
+    data = reader.read(name)
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            width, height = image.size
+    except Exception:
+        height, width = -1, -1
+    return hashlib.sha256(data).hexdigest(), height, width
+
+
+def load_manifest(manifest_path: Path):
+    """
+    Load a manifest written by `build_manifest`.
+
+    :param manifest_path: Path to the `.npz` manifest.
+    :return: Dictionary of column name -> numpy array, or None if there is no manifest.
+    """
+    if not manifest_path or not os.path.exists(manifest_path):
+        return None
+    with np.load(manifest_path, allow_pickle=False) as data:
+        return {name: data[name] for name in data.files}
+
+
+def build_manifest(data_dir: Path, manifest_path: Path, num_workers: int = None) -> dict:
+    """
+    Build the content-addressed manifest of the dataset and save it as a compressed `.npz`.
+
+    The manifest is columnar: one array per column (relative path, SHA-256, label,
+    size, mtime, height, width) plus the class names. Files whose path, size and
+    mtime match the previous manifest keep their recorded hash; only new or modified
+    files are hashed, in parallel.
+
+    :param data_dir: Dataset root with one sub-directory per class.
+    :param manifest_path: Where to write the manifest.
+    :param num_workers: Threads hashing files (defaults to the CPU count).
+    :return: The manifest columns.
+    """
+    filepaths, labels, class_names = list_image_files(data_dir)
+    relpaths = [os.path.relpath(p, data_dir) for p in filepaths]
+    stats = [os.stat(p) for p in filepaths]
+    sizes = [stat.st_size for stat in stats]
+    mtimes = [stat.st_mtime_ns for stat in stats]
+
+    previous = load_manifest(manifest_path)
+    rows = _reusable_rows(previous, relpaths, sizes, mtimes)
+    pending = [i for i, row in enumerate(rows) if row is None]
+    logger.info(f"Hashing {len(pending)} of {len(filepaths)} images for the dataset manifest")
+
+    with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+        for i, row in zip(pending, executor.map(_describe, [filepaths[i] for i in pending])):
+            rows[i] = row
+
+    return _save_manifest(relpaths, labels, class_names, sizes, mtimes, rows, previous, manifest_path)
+
+
+def build_zip_manifest(zip_path: Path, data_root: str, manifest_path: Path, num_workers: int = None) -> dict:
+    """
+    Build the manifest of the images inside a zip archive (for DATA_PIPELINE: zip).
+
+    Same columns as `build_manifest`, with paths relative to `data_root`, the member's
+    uncompressed size and its archive timestamp as the mtime. Members whose path, size
+    and timestamp match the previous manifest keep their recorded hash.
+
+    :param zip_path: Path to the zip archive.
+    :param data_root: Directory inside the archive that holds one sub-directory per class.
+    :param manifest_path: Where to write the manifest.
+    :param num_workers: Threads reading and hashing members (defaults to the CPU count).
+    :return: The manifest columns.
+    """
+    with zipfile.ZipFile(zip_path) as zip_ref:
+        infos = {info.filename: info for info in zip_ref.infolist()}
+    reader = ZipImageReader(zip_path)
+    try:
+        names, labels, class_names = list_zip_images(reader, data_root)
+        infos = [infos[name] for name in names]
+        prefix = data_root.strip("/") + "/" if data_root.strip("/") else ""
+        relpaths = [name[len(prefix):] for name in names]
+        sizes = [info.file_size for info in infos]
+        mtimes = [int(time.mktime(info.date_time + (0, 0, -1))) * 10**9 for info in infos]
+
+        previous = load_manifest(manifest_path)
+        rows = _reusable_rows(previous, relpaths, sizes, mtimes)
+        pending = [i for i, row in enumerate(rows) if row is None]
+        logger.info(f"Hashing {len(pending)} of {len(names)} archive members for the dataset manifest")
+
+        with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+            for i, row in zip(pending, executor.map(lambda name: _describe_member(reader, name),
+                                                    [names[i] for i in pending])):
+                rows[i] = row
+    finally:
+        reader.close()
+
+    return _save_manifest(relpaths, labels, class_names, sizes, mtimes, rows, previous, manifest_path)
+
+
+def _reusable_rows(previous, relpaths: list, sizes: list, mtimes: list) -> list:
+    # Rows of the previous manifest that still describe the same file (None where it has to be hashed)
+    known = {}
+    if previous is not None:
+        for i, relpath in enumerate(previous["path"]):
+            known[(str(relpath), int(previous["size"][i]), int(previous["mtime_ns"][i]))] = (
+                str(previous["sha256"][i]), int(previous["height"][i]), int(previous["width"][i])
+            )
+    return [known.get(key) for key in zip(relpaths, sizes, mtimes)]
+
+
+def _save_manifest(relpaths: list, labels: list, class_names: list, sizes: list, mtimes: list,
+                   rows: list, previous, manifest_path: Path) -> dict:
+    # Assemble the columns, log the changes since the previous manifest and write it
+    manifest = {
+        "path": np.array(relpaths, dtype=str),
+        "sha256": np.array([row[0] for row in rows], dtype="<U64"),
+        "label": np.array(labels, dtype=np.int16),
+        "size": np.array(sizes, dtype=np.int64),
+        "mtime_ns": np.array(mtimes, dtype=np.int64),
+        "height": np.array([row[1] for row in rows], dtype=np.int32),
+        "width": np.array([row[2] for row in rows], dtype=np.int32),
+        "class_names": np.array(class_names, dtype=str),
+    }
+
+    # Report what changed since the previous manifest
+    if previous is not None:
+        old_hashes = dict(zip(map(str, previous["path"]), map(str, previous["sha256"])))
+        new_hashes = dict(zip(relpaths, manifest["sha256"].tolist()))
+        added = len(new_hashes.keys() - old_hashes.keys())
+        removed = len(old_hashes.keys() - new_hashes.keys())
+        changed = sum(1 for p in new_hashes.keys() & old_hashes.keys() if new_hashes[p] != old_hashes[p])
+        logger.info(f"Dataset manifest: {added} added, {changed} changed, {removed} removed")
+
+    # Write to a temporary file first so readers never see a partial manifest
+    os.makedirs(Path(manifest_path).parent, exist_ok=True)
+    tmp_path = f"{manifest_path}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.savez_compressed(f, **manifest)
+    os.replace(tmp_path, manifest_path)
+    logger.info(f"Dataset manifest saved at {manifest_path}")
+    return manifest
+
+
+def file_hashes(data_dir: Path, filepaths: list, manifest_path: Path = None, num_workers: int = None) -> list:
+    """
+    Content hashes of `filepaths`, taken from the manifest where it is still current.
+
+    Files missing from the manifest, or whose size / mtime changed since it was
+    written, are hashed on the fly.
+
+    :param data_dir: Dataset root the manifest paths are relative to.
+    :param filepaths: Image files under `data_dir`.
+    :param manifest_path: Path to the manifest (optional).
+    :param num_workers: Threads hashing files that are not in the manifest.
+    :return: List of SHA-256 hex digests aligned with `filepaths`.
+    """
+    manifest = load_manifest(manifest_path)
+    known = {}
+    if manifest is not None:
+        for relpath, size, mtime_ns, digest in zip(manifest["path"], manifest["size"],
+                                                   manifest["mtime_ns"], manifest["sha256"]):
+            known[str(relpath)] = (int(size), int(mtime_ns), str(digest))
+
+    hashes = []
+    for path in filepaths:
+        entry = known.get(os.path.relpath(path, data_dir))
+        stat = os.stat(path)
+        hashes.append(entry[2] if entry and entry[:2] == (stat.st_size, stat.st_mtime_ns) else None)
+
+    pending = [i for i, digest in enumerate(hashes) if digest is None]
+    if pending:
+        with ThreadPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+            for i, digest in zip(pending, executor.map(sha256_file, [filepaths[i] for i in pending])):
+                hashes[i] = digest
+    return hashes
@@ -0,0 +1,104 @@
+# Import libraries
+import tensorflow as tf
+from chest_cancer_classifier.components.input_pipeline import _decode_and_resize
+
+
+def teacher_logits_model(teacher: tf.keras.Model) -> tf.keras.Model:
+    """
+    Expose the pre-softmax logits of a trained classifier.
+
+    The final Dense layer is re-applied with a linear activation and the same weights,
+    so the logits are exact (not recovered from clipped probabilities).
+
+    :param teacher: Trained model ending in a softmax Dense layer.
+    :return: Model mapping images to logits.
+    """
+    output_layer = teacher.layers[-1]
+    if not isinstance(output_layer, tf.keras.layers.Dense):
+        raise ValueError("The teacher model must end with a Dense softmax layer")
+    config = output_layer.get_config()
+    config.update(activation="linear", name="teacher_logits")
+    logits_layer = tf.keras.layers.Dense.from_config(config)
+    logits = logits_layer(output_layer.input)
+    logits_layer.set_weights(output_layer.get_weights())
+    return tf.keras.models.Model(inputs=teacher.input, outputs=logits)
+
+
+def build_student(image_size, classes: int, filters, dropout: float = 0.2) -> tf.keras.Model:
+    """
+    Compact CNN student: Conv-BN-ReLU blocks with max pooling, global average pooling and a
+    Dense output layer.
+
+    The model takes the same [0, 1] images as the teacher and ends in a softmax, so it is
+    saved, loaded and served exactly like the teacher. The pre-softmax Dense layer is
+    named "logits" for the distillation loss.
+
+    :param image_size: Input shape (height, width, channels).
+    :param classes: Number of classes.
+    :param filters: Filters of every block (the spatial size halves after each block).
+    :param dropout: Dropout rate before the output layer.
+    :return: The student model.
+    """
+    inputs = tf.keras.Input(shape=image_size)
+    x = inputs
+    for block_filters in filters:
+        x = tf.keras.layers.Conv2D(block_filters, 3, padding="same", use_bias=False)(x)
+        x = tf.keras.layers.BatchNormalization()(x)
+        x = tf.keras.layers.ReLU()(x)
+        x = tf.keras.layers.MaxPooling2D()(x)
+    x = tf.keras.layers.GlobalAveragePooling2D()(x)
+    x = tf.keras.layers.Dropout(dropout)(x)
+    logits = tf.keras.layers.Dense(classes, name="logits")(x)
+    outputs = tf.keras.layers.Activation("softmax", name="probabilities")(logits)
+    return tf.keras.models.Model(inputs=inputs, outputs=outputs, name="student")
+
+
+def distillation_loss(classes: int, temperature: float, alpha: float):
+    """
+    Knowledge distillation loss on student logits (Hinton et al.).
+
+    `y_true` holds the one-hot label followed by the teacher logits. The loss is
+    `alpha` x cross-entropy with the hard label plus (1 - `alpha`) x T^2 x KL divergence
+    between the temperature-softened teacher and student distributions.
+    """
+    def loss(y_true, y_pred):
+        labels, teacher_logits = y_true[:, :classes], y_true[:, classes:]
+        hard = tf.keras.losses.categorical_crossentropy(labels, y_pred, from_logits=True)
+        soft = tf.keras.losses.kl_divergence(
+            tf.nn.softmax(teacher_logits / temperature), tf.nn.softmax(y_pred / temperature)
+        )
+        return alpha * hard + (1.0 - alpha) * temperature ** 2 * soft
+    return loss
+
+
+def distillation_accuracy(classes: int):
+    """
+    Accuracy of the student logits against the one-hot part of the distillation targets.
+    """
+    def accuracy(y_true, y_pred):
+        return tf.cast(tf.equal(tf.argmax(y_true[:, :classes], axis=-1), tf.argmax(y_pred, axis=-1)), tf.float32)
+    return accuracy
+
+
+def build_distillation_dataset(filepaths, labels, teacher_logits, num_classes: int, image_size,
+                               batch_size: int, shuffle: bool = False, seed: int = None) -> tf.data.Dataset:
+    """
+    tf.data pipeline yielding (images scaled to [0, 1], one-hot label + teacher logits).
+
+    Images are decoded in parallel and cached after decode/resize like `build_dataset`;
+    the teacher logits travel with their image, so shuffling keeps them aligned. Images
+    are not augmented, since the cached logits belong to the unaugmented image.
+    """
+    autotune = tf.data.AUTOTUNE
+    dataset = tf.data.Dataset.from_tensor_slices(
+        (list(map(str, filepaths)), (list(labels), tf.constant(teacher_logits, tf.float32)))
+    )
+    dataset = dataset.map(_decode_and_resize(tuple(image_size)), num_parallel_calls=autotune).cache()
+    if shuffle:
+        dataset = dataset.shuffle(len(filepaths), seed=seed, reshuffle_each_iteration=True)
+    dataset = dataset.batch(batch_size).map(
+        lambda images, y: (tf.cast(images, tf.float32) / 255.0,
+                           tf.concat([tf.one_hot(y[0], num_classes), y[1]], axis=-1)),
+        num_parallel_calls=autotune
+    )
+    return dataset.prefetch(autotune)
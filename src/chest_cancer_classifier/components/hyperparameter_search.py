@@ -0,0 +1,273 @@
+# Import libraries
+import os
+import json
+import math
+import time
+import random
+import itertools
+import multiprocessing
+import numpy as np
+import tensorflow as tf
+from pathlib import Path
+from dataclasses import replace
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import HyperparameterSearchConfig
+from chest_cancer_classifier.components.model_trainer import Training
+
+# Search algorithms selectable with SEARCH_ALGORITHM in params.yaml
+ALGORITHMS = ("hyperband", "successive_halving")
+
+
+def successive_halving_rungs(trials: int, min_epochs: float, eta: int, max_epochs: int) -> list:
+    """
+    Rungs of one successive-halving bracket.
+
+    Every rung trains the surviving trials up to a larger epoch budget (eta times the
+    previous one) and keeps the best 1 / eta of them for the next rung.
+
+    :param trials: Trials started in the first rung.
+    :param min_epochs: Epoch budget of the first rung.
+    :param eta: Reduction factor between rungs.
+    :param max_epochs: Epoch budget of the last rung.
+    :return: List of (number of trials, epochs) per rung.
+    """
+    rungs = []
+    i = 0
+    while True:
+        epochs = min(max_epochs, max(1, int(round(min_epochs * eta ** i))))
+        rungs.append((max(1, trials // eta ** i), epochs))
+        if epochs >= max_epochs or trials // eta ** (i + 1) < 1:
+            return rungs
+        i += 1
+
+
+def hyperband_brackets(max_epochs: int, eta: int) -> list:
+    """
+    Successive-halving brackets of Hyperband (Li et al., 2018).
+
+    The first bracket starts many trials with a small budget and stops most of them
+    early; the last one trains a few trials for `max_epochs` without stopping any, which
+    protects against hyperparameters that only pay off with longer training.
+
+    :return: List of brackets, each a list of (number of trials, epochs) per rung.
+    """
+    s_max = int(math.log(max_epochs, eta) + 1e-9)
+    return [
+        successive_halving_rungs(math.ceil((s_max + 1) / (s + 1) * eta ** s), max_epochs / eta ** s, eta, max_epochs)
+        for s in range(s_max, -1, -1)
+    ]
+
+
+def _init_worker(threads: int):
+    # Split the cores between the concurrent trials instead of oversubscribing them
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+
+def run_trial(task: dict) -> dict:
+    """
+    Train the head of one trial up to `task["epochs"]` epochs (runs in a worker process).
+
+    The first rung starts from the initial head weights; later rungs continue from the
+    trial's saved model, optimizer state included. Features are memory-mapped, so the
+    concurrent trials share one copy in the page cache.
+
+    :return: Validation accuracy and loss after training, and the wall-clock seconds of the rung.
+    """
+    start = time.perf_counter()
+    features_dir = Path(task["features_dir"])
+    train_x, train_y, valid_x, valid_y = (
+        np.load(features_dir / f"{name}.npy", mmap_mode="r")
+        for name in ("train_features", "train_labels", "valid_features", "valid_labels")
+    )
+    tf.keras.utils.set_random_seed(task["seed"])
+
+    if task["start_epoch"] == 0:
+        head = tf.keras.models.load_model(task["initial_head_path"], compile=False)
+        head.compile(
+            optimizer=tf.keras.optimizers.Adam(learning_rate=task["learning_rate"]),
+            loss="binary_crossentropy",  # Same loss and metrics as the training stage
+            metrics=["accuracy"],
+            jit_compile=task["jit_compile"]
+        )
+    else:
+        head = tf.keras.models.load_model(task["model_path"])
+
+    head.fit(
+        train_x, train_y,
+        batch_size=task["batch_size"],
+        initial_epoch=task["start_epoch"],
+        epochs=task["epochs"],
+        shuffle=True,
+        verbose=0
+    )
+    loss, accuracy = head.evaluate(valid_x, valid_y, batch_size=task["batch_size"], verbose=0)
+    head.save(task["model_path"])
+    return {
+        "validation_accuracy": float(accuracy),
+        "validation_loss": float(loss),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class HyperparameterSearch:
+    def __init__(self, config: HyperparameterSearchConfig):
+        """
+        Initialize the HyperparameterSearch class with a HyperparameterSearchConfig object.
+
+        :param config: HyperparameterSearchConfig object containing the search space, budget and paths.
+        """
+        self.config = config
+        self.features_dir = Path(self.config.root_dir, "features")
+        self.initial_head_path = Path(self.config.root_dir, "head_initial.keras")
+        self.trials_dir = Path(self.config.root_dir, "trials")
+
+    def prepare_features(self):
+        """
+        Cache the backbone features and the initial head shared by all trials.
+
+        Trials only train the classification head, so the frozen backbone runs once per
+        image for the whole search. Features come from the training stage's
+        content-addressed store, so images it already processed are not run again.
+        """
+        training = Training(config=replace(
+            self.config.training,
+            params_distribution="none",
+            params_precision_policy="float32"  # Trials train in float32 for comparable scores
+        ))
+        training.get_base_model()
+        backbone, head_layers = training.split_frozen_model()
+        train_features, train_labels = training.extract_features(backbone, "training")
+        valid_features, valid_labels = training.extract_features(backbone, "validation")
+
+        os.makedirs(self.features_dir, exist_ok=True)
+        for name, array in (("train_features", train_features), ("train_labels", train_labels),
+                            ("valid_features", valid_features), ("valid_labels", valid_labels)):
+            np.save(self.features_dir / f"{name}.npy", np.asarray(array, dtype=np.float32))
+
+        # Head on a features input, starting from the weights of the prepared model
+        inputs = tf.keras.Input(shape=train_features.shape[1:])
+        x = inputs
+        for layer in head_layers:
+            x = layer(x)
+        tf.keras.models.Model(inputs=inputs, outputs=x).save(self.initial_head_path)
+        tf.keras.backend.clear_session()
+
+    def _sample(self, count: int) -> list:
+        # Walk the shuffled grid so trials differ until every combination has been tried
+        grid = list(itertools.product(self.config.params_learning_rates, self.config.params_batch_sizes))
+        random.Random(self.config.params_seed).shuffle(grid)
+        return [grid[i % len(grid)] for i in range(count)]
+
+    def _run_bracket(self, pool: ProcessPoolExecutor, bracket: int, rungs: list, trial_ids: list):
+        # Train the bracket rung by rung, keeping the best trials of every rung
+        active = list(trial_ids)
+        start_epoch = 0
+        for n_trials, epochs in rungs:
+            active = active[:n_trials]
+            tasks = [{
+                "features_dir": str(self.features_dir),
+                "initial_head_path": str(self.initial_head_path),
+                "model_path": str(self.trials[trial]["model_path"]),
+                "learning_rate": self.trials[trial]["learning_rate"],
+                "batch_size": self.trials[trial]["batch_size"],
+                "start_epoch": start_epoch,
+                "epochs": epochs,
+                "seed": self.config.params_seed + trial,
+                "jit_compile": self.config.training.params_jit_compile,
+            } for trial in active]
+
+            for trial, result in zip(active, pool.map(run_trial, tasks)):
+                record = self.trials[trial]
+                record.update(epochs=epochs, validation_accuracy=result["validation_accuracy"],
+                              validation_loss=result["validation_loss"])
+                record["wall_clock_seconds"] += result["seconds"]
+                record["rungs"].append({"epochs": epochs, "validation_accuracy": result["validation_accuracy"]})
+
+            active.sort(key=lambda t: (-self.trials[t]["validation_accuracy"], self.trials[t]["validation_loss"]))
+            logger.info(f"Bracket {bracket}: {len(active)} trials trained to {epochs} epochs, best accuracy "
+                        f"{self.trials[active[0]]['validation_accuracy']:.3f}")
+            start_epoch = epochs
+
+    def search(self) -> dict:
+        """
+        Search TRAINING_LEARNING_RATE, BATCH_SIZE and EPOCHS for the head trained on cached features.
+
+        Trials run concurrently in a process pool with one process per core (or
+        SEARCH_WORKERS), each limited to its share of the cores. Weak trials are stopped
+        early by successive halving; 'hyperband' runs several brackets concurrently. The
+        leaderboard lists every trial with its hyperparameters, the epochs it reached,
+        its validation scores and its wall-clock training time.
+
+        :return: The leaderboard report, also written to `leaderboard_path`.
+        """
+        if self.config.params_algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown SEARCH_ALGORITHM '{self.config.params_algorithm}'; choose one of {', '.join(ALGORITHMS)}")
+        start = time.perf_counter()
+        self.prepare_features()
+
+        max_epochs, eta = self.config.params_max_epochs, self.config.params_eta
+        if self.config.params_algorithm == "hyperband":
+            brackets = hyperband_brackets(max_epochs, eta)
+        else:
+            promotions = min(int(math.log(max_epochs, eta) + 1e-9), int(math.log(self.config.params_trials, eta) + 1e-9))
+            brackets = [successive_halving_rungs(self.config.params_trials, max_epochs / eta ** promotions, eta, max_epochs)]
+
+        # One record per trial, numbered across brackets
+        candidates = iter(self._sample(sum(rungs[0][0] for rungs in brackets)))
+        os.makedirs(self.trials_dir, exist_ok=True)
+        self.trials, bracket_trials = {}, []
+        for bracket, rungs in enumerate(brackets):
+            ids = []
+            for _ in range(rungs[0][0]):
+                trial = len(self.trials)
+                learning_rate, batch_size = next(candidates)
+                self.trials[trial] = {
+                    "trial": trial, "bracket": bracket,
+                    "learning_rate": learning_rate, "batch_size": batch_size,
+                    "epochs": 0, "validation_accuracy": None, "validation_loss": None,
+                    "wall_clock_seconds": 0.0, "rungs": [],
+                    "model_path": self.trials_dir / f"trial-{trial:03d}.keras",
+                }
+                ids.append(trial)
+            bracket_trials.append(ids)
+
+        workers = min(self.config.params_workers or os.cpu_count(), os.cpu_count())
+        threads = max(1, os.cpu_count() // workers)
+        logger.info(f"Searching {len(self.trials)} trials in {len(brackets)} brackets with {workers} workers "
+                    f"({threads} threads each)")
+
+        # Spawned workers: TensorFlow's runtime is not fork-safe
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker, initargs=(threads,)) as pool:
+            with ThreadPoolExecutor(max_workers=len(brackets)) as brackets_pool:
+                futures = [brackets_pool.submit(self._run_bracket, pool, bracket, rungs, ids)
+                           for bracket, (rungs, ids) in enumerate(zip(brackets, bracket_trials))]
+                for future in futures:
+                    future.result()
+
+        leaderboard = sorted(self.trials.values(), key=lambda t: (-t["validation_accuracy"], t["validation_loss"]))
+        for record in leaderboard:
+            record["status"] = "completed" if record["epochs"] >= max_epochs else "stopped"
+            record["model_path"] = str(record["model_path"])
+        best = leaderboard[0]
+
+        report = {
+            "algorithm": self.config.params_algorithm,
+            "max_epochs": max_epochs,
+            "eta": eta,
+            "workers": workers,
+            "wall_clock_seconds": time.perf_counter() - start,
+            "best": {"TRAINING_LEARNING_RATE": best["learning_rate"], "BATCH_SIZE": best["batch_size"], "EPOCHS": best["epochs"]},
+            "trials": leaderboard,
+        }
+        with open(self.config.leaderboard_path, "w") as f:
+            json.dump(report, f, indent=4)
+
+        logger.info(f"{'trial':>6} {'lr':>8} {'batch':>6} {'epochs':>7} {'val acc':>8} {'val loss':>9} {'seconds':>8}")
+        for r in leaderboard:
+            logger.info(f"{r['trial']:>6} {r['learning_rate']:>8g} {r['batch_size']:>6} {r['epochs']:>7} "
+                        f"{r['validation_accuracy']:>8.3f} {r['validation_loss']:>9.4f} {r['wall_clock_seconds']:>8.1f}")
+        logger.info(f"Leaderboard saved at {self.config.leaderboard_path}; best: {report['best']}")
+        return report
@@ -0,0 +1,250 @@
+# Import libraries
+import os
+import functools
+import threading
+import numpy as np
+from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from chest_cancer_classifier.utils.model_registry import get_model, load_keras_model
+
+# Path to the model served by the prediction entry points
+MODEL_PATH = os.path.join("model", "model.h5")
+
+# Input size expected by the model (height, width)
+IMAGE_SIZE = (224, 224)
+
+# Class index -> label, in the order used by flow_from_directory during training
+CLASS_LABELS = ['Adenocarcinoma Cancer', 'Normal']
+
+
+def load_image_array(image, target_size=IMAGE_SIZE) -> np.ndarray:
+    """
+    Decode and resize a single image into a float32 array scaled to [0, 1].
+
+    :param image: File path, PIL image or HxWxC numpy array with pixel values in [0, 255].
+    :param target_size: (height, width) the model expects.
+    :return: Array of shape (height, width, 3).
+    """
+    if isinstance(image, np.ndarray):
+        # Arrays that already have the target shape skip the PIL round trip
+        if image.shape[:2] == tuple(target_size) and image.ndim == 3 and image.shape[-1] == 3:
+            return image.astype(np.float32) / 255.0
+        image = Image.fromarray(np.asarray(image, dtype=np.uint8))
+    elif not isinstance(image, Image.Image):
+        image = Image.open(image)
+
+    # Match the RGB / bilinear resizing used by the training data generators
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    image = image.resize((target_size[1], target_size[0]), Image.BILINEAR)
+    return np.asarray(image, dtype=np.float32) / 255.0
+
+
+class TFLiteModel:
+    """
+    Run a `.tflite` model with the same `predict_on_batch` interface as a Keras model.
+
+    Uses the standalone `tflite_runtime` interpreter when installed, so serving does not
+    need TensorFlow; falls back to `tf.lite.Interpreter` otherwise. Quantized (int8)
+    inputs and outputs are converted with the scale / zero point stored in the model.
+    """
+
+    def __init__(self, path: str, num_threads: int = None):
+        """
+        :param path: Path to the `.tflite` file.
+        :param num_threads: Interpreter threads (defaults to the runtime's choice).
+        """
+        try:
+            from tflite_runtime.interpreter import Interpreter
+        except ImportError:
+            from tensorflow.lite import Interpreter
+
+        self.interpreter = Interpreter(model_path=str(path), num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+        self.input_details = self.interpreter.get_input_details()[0]
+        self.output_details = self.interpreter.get_output_details()[0]
+        self._lock = threading.Lock()  # The interpreter is not thread-safe
+
+    def predict_on_batch(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run a forward pass on a batch of float images scaled to [0, 1].
+        """
+        with self._lock:
+            # Resize the input tensor once per new batch shape
+            if tuple(self.input_details["shape"]) != batch.shape:
+                self.interpreter.resize_tensor_input(self.input_details["index"], batch.shape)
+                self.interpreter.allocate_tensors()
+                self.input_details = self.interpreter.get_input_details()[0]
+                self.output_details = self.interpreter.get_output_details()[0]
+
+            # Quantize the input for integer-only models
+            if self.input_details["dtype"] != np.float32:
+                scale, zero_point = self.input_details["quantization"]
+                info = np.iinfo(self.input_details["dtype"])
+                batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max)
+            self.interpreter.set_tensor(self.input_details["index"], batch.astype(self.input_details["dtype"]))
+            self.interpreter.invoke()
+            output = self.interpreter.get_tensor(self.output_details["index"])
+
+            # Dequantize integer outputs back to probabilities
+            if self.output_details["dtype"] != np.float32:
+                scale, zero_point = self.output_details["quantization"]
+                output = (output.astype(np.float32) - zero_point) * scale
+            return output
+
+
+def load_tflite_model(path: str) -> TFLiteModel:
+    """
+    Loader for the model registry that opens a `.tflite` file.
+    """
+    return TFLiteModel(path)
+
+
+class ONNXModel:
+    """
+    Run an `.onnx` model with ONNX Runtime behind the Keras `predict_on_batch` interface.
+
+    Nothing here imports TensorFlow, which keeps import time and memory of serving
+    processes low.
+    """
+
+    def __init__(self, path: str, intra_op_threads: int = 0, inter_op_threads: int = 0):
+        """
+        :param path: Path to the `.onnx` file.
+        :param intra_op_threads: Threads used inside a single operator (0 lets ONNX Runtime decide).
+        :param inter_op_threads: Threads used to run independent operators in parallel (0 lets ONNX Runtime decide).
+        """
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_name = self.session.get_inputs()[0].name
+
+    def predict_on_batch(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run a forward pass on a batch of float images scaled to [0, 1].
+        """
+        return self.session.run(None, {self.input_name: batch.astype(np.float32)})[0]
+
+
+def load_onnx_model(path: str, intra_op_threads: int = 0, inter_op_threads: int = 0) -> ONNXModel:
+    """
+    Loader for the model registry that opens an `.onnx` file.
+    """
+    return ONNXModel(path, intra_op_threads=intra_op_threads, inter_op_threads=inter_op_threads)
+
+
+# Prediction backends: name -> model registry loader
+BACKENDS = {
+    "keras": load_keras_model,
+    "tflite": load_tflite_model,
+    "onnx": load_onnx_model,
+}
+
+
+class ImageClassifier:
+    """
+    Shared inference path used by the prediction pipeline, the Flask server and the Streamlit app.
+
+    Every prediction runs exactly one forward pass per batch and returns the label,
+    the per-class probabilities and the confidence together.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, model=None, backend: str = "keras", backend_options: dict = None):
+        """
+        Initialize the classifier.
+
+        :param model_path: Path of the model to fetch from the model registry.
+        :param model: Already loaded model (takes precedence over `model_path`).
+        :param backend: Runtime used to load `model_path`, one of `BACKENDS`.
+        :param backend_options: Keyword arguments for the backend loader (e.g. ONNX thread counts).
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown prediction backend '{backend}', expected one of {sorted(BACKENDS)}")
+        self.model_path = model_path
+        self.backend = backend
+        self._model = model
+
+        # Bind backend options into the loader so the registry caches one model per configuration
+        self._loader = BACKENDS[backend]
+        if backend_options:
+            self._loader = functools.partial(self._loader, **backend_options)
+
+    @property
+    def model(self):
+        # Use the injected model, otherwise the resident copy from the registry
+        if self._model is not None:
+            return self._model
+        return get_model(self.model_path, loader=self._loader)
+
+    def predict_proba(self, batch: np.ndarray) -> np.ndarray:
+        """
+        Run a single forward pass on a preprocessed batch.
+
+        :param batch: Array of shape (batch, height, width, 3) scaled to [0, 1].
+        :return: Softmax probabilities of shape (batch, classes).
+        """
+        return np.asarray(self.model.predict_on_batch(batch))
+
+    def classify(self, image) -> dict:
+        """
+        Classify one image.
+
+        :param image: File path, PIL image or numpy array.
+        :return: Prediction record (see `to_records`).
+        """
+        batch = np.expand_dims(load_image_array(image), axis=0)
+        return self.to_records(self.predict_proba(batch))[0]
+
+    def classify_batch(self, images, batch_size=32, num_workers=4) -> list:
+        """
+        Classify many images with one forward pass per batch.
+
+        Images are decoded and resized in a thread pool, stacked into fixed-size
+        batches (the last batch is zero-padded so the model sees a single input
+        shape), and the results are returned in input order.
+
+        :param images: Iterable of file paths, PIL images or numpy arrays.
+        :param batch_size: Number of images per forward pass.
+        :param num_workers: Threads used to decode images.
+        :return: List of prediction records.
+        """
+        items = list(images)
+        if not items:
+            return []
+
+        records = []
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            for start in range(0, len(items), batch_size):
+                chunk = items[start:start + batch_size]
+
+                # Decode the chunk in parallel and stack it into a fixed-size batch
+                batch = np.zeros((batch_size, *IMAGE_SIZE, 3), dtype=np.float32)
+                for i, array in enumerate(executor.map(load_image_array, chunk)):
+                    batch[i] = array
+
+                # One forward pass per batch; padded rows are dropped
+                records.extend(self.to_records(self.predict_proba(batch)[:len(chunk)]))
+
+        return records
+
+    @staticmethod
+    def to_records(probabilities: np.ndarray) -> list:
+        """
+        Convert a (batch, classes) probability matrix into prediction records.
+
+        :param probabilities: Softmax outputs of the model.
+        :return: List of dicts with `label`, `probabilities` and `confidence` keys.
+        """
+        records = []
+        for row in probabilities:
+            index = int(np.argmax(row))
+            records.append({
+                "label": CLASS_LABELS[index],
+                "probabilities": {label: float(p) for label, p in zip(CLASS_LABELS, row)},
+                "confidence": float(row[index]),
+            })
+        return records
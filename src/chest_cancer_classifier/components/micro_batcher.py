@@ -0,0 +1,121 @@
+# Import libraries
+import time
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List
+from chest_cancer_classifier import logger
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent single-item requests into batches.
+
+    Callers submit one item at a time and get a Future back. A background worker
+    waits for the first queued item, then keeps collecting until either
+    `max_batch_size` items are queued or `max_wait_ms` has passed, and runs
+    `predict_fn` once on the whole batch. Under low load a request waits at most
+    `max_wait_ms`; under high load batches fill up immediately. Futures cancelled by
+    the caller before their batch runs (e.g. after a timeout) are skipped.
+    """
+
+    def __init__(self, predict_fn: Callable[[List[Any]], List[Any]], max_batch_size: int = 16, max_wait_ms: float = 5.0):
+        """
+        Initialize the batcher.
+
+        :param predict_fn: Function that maps a list of inputs to a list of results in the same order.
+        :param max_batch_size: Largest batch passed to `predict_fn`.
+        :param max_wait_ms: Longest time the first item of a batch waits for more items.
+        """
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue = queue.Queue()
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()  # Orders submit() against stop(), so no item is queued after the final drain
+        self._worker = None
+
+    def start(self):
+        """
+        Start the background batching thread.
+        """
+        if self._worker is None or not self._worker.is_alive():
+            self._stopped.clear()
+            self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+            self._worker.start()
+        return self
+
+    def stop(self):
+        """
+        Stop the background thread after the current batch completes.
+
+        Items still queued are failed with a RuntimeError, so no caller waits forever.
+        """
+        with self._lock:
+            self._stopped.set()
+        if self._worker is not None:
+            self._worker.join()
+
+        while True:
+            try:
+                _, future = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("MicroBatcher stopped before the item was processed"))
+
+    def submit(self, item: Any) -> Future:
+        """
+        Queue a single item for prediction.
+
+        :param item: Input for `predict_fn`.
+        :return: Future resolved with the item's result (failed at once if the batcher is stopped).
+        """
+        future = Future()
+        with self._lock:
+            if self._stopped.is_set():
+                future.set_exception(RuntimeError("MicroBatcher is stopped"))
+            else:
+                self._queue.put((item, future))
+        return future
+
+    def _collect_batch(self) -> list:
+        """
+        Block for the first item, then gather more until the batch is full or the wait expires.
+        """
+        try:
+            batch = [self._queue.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """
+        Worker loop: collect a batch, run one prediction, resolve the futures.
+        """
+        while not self._stopped.is_set():
+            # Drop items whose caller already gave up; the rest can no longer be cancelled
+            batch = [(item, future) for item, future in self._collect_batch() if future.set_running_or_notify_cancel()]
+            if not batch:
+                continue
+
+            items, futures = zip(*batch)
+            try:
+                results = self.predict_fn(list(items))
+                for future, result in zip(futures, results):
+                    future.set_result(result)
+            except Exception as e:
+                # Fail every request in the batch instead of killing the worker
+                logger.exception(e)
+                for future in futures:
+                    future.set_exception(e)
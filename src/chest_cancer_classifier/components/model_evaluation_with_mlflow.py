@@ -1,13 +1,23 @@
 
 # Import necessary libraries
+import os
+import json
 import mlflow
 import mlflow.keras
+import pandas as pd
 import tensorflow as tf
 from pathlib import Path
 from urllib.parse import urlparse
+from chest_cancer_classifier import logger
 from chest_cancer_classifier.constants import *
 from chest_cancer_classifier.utils.common_functions import read_yaml, create_directories, save_json
 from chest_cancer_classifier.entity.config_entity import EvaluationConfig
+from chest_cancer_classifier.components.input_pipeline import build_dataset, TensorCacheSequence
+from chest_cancer_classifier.components.data_preprocessing import load_tensor_cache
+from chest_cancer_classifier.components.zip_dataset import ZipImageReader, build_zip_dataset
+from chest_cancer_classifier.components.data_sharding import build_shard_dataset, load_shard_index
+from chest_cancer_classifier.components.data_split import load_split, split_digest
+from chest_cancer_classifier.components.downloader import sha256_file
 
 class Evaluation:
     def __init__(self, config: EvaluationConfig):
@@ -20,28 +30,73 @@ class Evaluation:
 
     def _valid_generator(self):
         """
-        Create a validation data generator to preprocess images for evaluation.
+        Create a data generator over the held-out test subset of the split index.
+
+        The test files are never seen by training (neither as training nor as
+        validation images).
         """
+        files, labels, class_names = load_split(self.config.split_index_path, "test")
+
+        # Read from the tf.data pipeline, the tensor cache, data.zip or the shards when selected in params.yaml
+        if self.config.params_data_pipeline == "tf_data":
+            self.valid_generator = build_dataset(
+                [os.path.join(self.config.training_data, f) for f in files], labels, len(class_names),
+                self.config.params_image_size[:-1], self.config.params_batch_size, cache=False
+            )
+            return
+        if self.config.params_data_pipeline == "zip":
+            reader = ZipImageReader(self.config.source_zip_path)
+            self.valid_generator = build_zip_dataset(
+                reader, [f"{self.config.zip_data_root}/{f}" for f in files], labels, len(class_names),
+                self.config.params_image_size[:-1], self.config.params_batch_size, cache=False
+            )
+            return
+        if self.config.params_data_pipeline == "shards":
+            load_shard_index(self.config.shard_index_path, data_dir=self.config.training_data)
+            self.valid_generator = build_shard_dataset(
+                self.config.shard_index_path, self.config.params_image_size[:-1], self.config.params_batch_size,
+                files=files, cycle_length=self.config.shard_cycle_length
+            )
+            return
+        if self.config.params_data_pipeline == "tensor_cache":
+            images, cache_labels, index = load_tensor_cache(
+                self.config.preprocessed_images_path,
+                self.config.preprocessed_index_path,
+                data_dir=self.config.training_data,
+                image_size=self.config.params_image_size
+            )
+            rows = {Path(f).as_posix(): row for row, f in enumerate(index["files"])}
+            self.valid_generator = TensorCacheSequence(
+                images, cache_labels, [rows[f] for f in files],
+                len(index["class_names"]), self.config.params_batch_size
+            )
+            return
+
         # Arguments for data normalization
         datagenerator_kwargs = dict(
-            rescale=1.0 / 255,  # Normalize pixel values to [0, 1]
-            validation_split=0.30
+            rescale=1.0 / 255  # Normalize pixel values to [0, 1]
         )
 
         # Arguments for image resizing and batching
         dataflow_kwargs = dict(
+            x_col="filename",  # Column with the image paths
+            y_col="class",  # Column with the class names
+            classes=class_names,  # Keep the class indices of the split index
             target_size=self.config.params_image_size[:-1],  # Target size excluding channels
             batch_size=self.config.params_batch_size,  # Batch size
             interpolation="bilinear"  # Bilinear interpolation for resizing
         )
 
-        # Create a Keras ImageDataGenerator for validation data
+        # Create a Keras ImageDataGenerator for the test data
         valid_datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(**datagenerator_kwargs)
 
-        # Generate validation data batches from the specified directory
-        self.valid_generator = valid_datagenerator.flow_from_directory(
-            directory=self.config.training_data, # Path to validation data directory
-            subset="validation",
+        # Generate test data batches from the files of the split index
+        test_frame = pd.DataFrame({
+            "filename": [os.path.join(self.config.training_data, f) for f in files],
+            "class": [class_names[label] for label in labels],
+        })
+        self.valid_generator = valid_datagenerator.flow_from_dataframe(
+            dataframe=test_frame,
             shuffle=False,  # No shuffling for consistent evaluation
             **dataflow_kwargs
         )
@@ -70,15 +125,39 @@ class Evaluation:
         metrics=["accuracy"]  # Updated metrics
         )
 
-        # Prepare the validation data generator
-        self._valid_generator()
-
-        # Evaluate the model on the validation data
-        self.score = self.model.evaluate(self.valid_generator)
+        # Reuse the scores of an earlier run on the same model, test subset and preprocessing
+        cache_key = self._cache_key()
+        cache = {}
+        if os.path.exists(self.config.evaluation_cache_path):
+            with open(self.config.evaluation_cache_path) as f:
+                cache = json.load(f)
+
+        if cache_key in cache:
+            self.score = cache[cache_key]
+            logger.info(f"Reusing cached evaluation scores from {self.config.evaluation_cache_path}")
+        else:
+            # Prepare the test data generator
+            self._valid_generator()
+
+            # Evaluate the model on the test data
+            self.score = [float(value) for value in self.model.evaluate(self.valid_generator)]
+            cache[cache_key] = self.score
+            save_json(path=Path(self.config.evaluation_cache_path), data=cache)
 
         # Save evaluation scores
         self.save_score()
 
+    def _cache_key(self) -> str:
+        """
+        Key of the evaluation cache: model contents, test subset digest, image size and input pipeline.
+        """
+        return ":".join([
+            sha256_file(self.config.path_of_model),
+            split_digest(self.config.split_index_path, "test"),
+            "x".join(str(d) for d in self.config.params_image_size),
+            self.config.params_data_pipeline,
+        ])
+
     def save_score(self):
         """
         Save the evaluation metrics to a JSON file.
@@ -89,10 +168,49 @@ class Evaluation:
         scores = {
             "loss": self.score[0],
             "accuracy": self.score[1],
+            "test_split_digest": split_digest(self.config.split_index_path, "test"),
         }
+        scores.update(self._precision_comparison(scores))
+
         # Save scores to a JSON file
         save_json(path=Path("scores.json"), data=scores)
 
+    def _precision_comparison(self, scores: dict) -> dict:
+        """
+        Add the training throughput and compare mixed-precision runs with the float32 baseline.
+
+        float32 runs refresh the baseline file; other runs report their accuracy and
+        throughput relative to it.
+
+        :param scores: Loss and accuracy of the current model.
+        :return: Extra entries for scores.json.
+        """
+        if not os.path.exists(self.config.training_metrics_path):
+            return {}
+        with open(self.config.training_metrics_path) as f:
+            training_metrics = json.load(f)
+
+        extra = {
+            "precision_policy": training_metrics["precision_policy"],
+            "jit_compile": training_metrics["jit_compile"],
+            "train_images_per_second": training_metrics["train_images_per_second"],
+        }
+
+        if training_metrics["precision_policy"] == "float32" and not training_metrics["jit_compile"]:
+            # This run is the baseline for later mixed-precision / XLA runs
+            save_json(path=Path(self.config.float32_baseline_path), data={
+                "accuracy": scores["accuracy"],
+                "train_images_per_second": training_metrics["train_images_per_second"],
+            })
+        elif os.path.exists(self.config.float32_baseline_path):
+            with open(self.config.float32_baseline_path) as f:
+                baseline = json.load(f)
+            extra["accuracy_delta_vs_float32"] = scores["accuracy"] - baseline["accuracy"]
+            if baseline["train_images_per_second"]:
+                extra["speedup_vs_float32"] = extra["train_images_per_second"] / baseline["train_images_per_second"]
+
+        return extra
+
     def log_into_mlflow(self):
         """
         Log evaluation metrics and model to MLflow for tracking and versioning.
@@ -0,0 +1,168 @@
+# Import libraries
+import os
+import json
+import time
+import random
+import numpy as np
+import tensorflow as tf
+from pathlib import Path
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import ModelExportConfig
+from chest_cancer_classifier.components.input_pipeline import WHITE_LIST_FORMATS
+from chest_cancer_classifier.components.data_split import load_split
+from chest_cancer_classifier.components.inference import load_image_array, TFLiteModel, ONNXModel
+
+
+class ModelExport:
+    def __init__(self, config: ModelExportConfig):
+        """
+        Initialize the ModelExport class with a ModelExportConfig object.
+
+        :param config: ModelExportConfig object containing export paths and parameters.
+        """
+        self.config = config
+        self.image_size = tuple(self.config.params_image_size[:-1])
+
+    def load_model(self):
+        """
+        Load the trained Keras model that is exported.
+        """
+        self.model = tf.keras.models.load_model(self.config.model_path)
+
+    def _representative_dataset(self):
+        """
+        Yield calibration images sampled from the training subset for full-int8 quantization.
+        """
+        files, _, _ = load_split(self.config.split_index_path, "training", data_dir=self.config.training_data)
+        random.Random(42).shuffle(files)
+        for path in files[:self.config.params_calibration_samples]:
+            yield [np.expand_dims(load_image_array(path, self.image_size), axis=0)]
+
+    def export_tflite(self):
+        """
+        Convert the Keras model into a dynamic-range and a full-int8 quantized TFLite model.
+        """
+        os.makedirs(self.config.root_dir, exist_ok=True)
+
+        # Dynamic-range quantization: int8 weights, float activations
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        Path(self.config.dynamic_range_model_path).write_bytes(converter.convert())
+        logger.info(f"Dynamic-range TFLite model saved at {self.config.dynamic_range_model_path}")
+
+        # Full-int8 quantization: weights, activations and input/output calibrated on training images
+        converter = tf.lite.TFLiteConverter.from_keras_model(self.model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = self._representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
+        Path(self.config.int8_model_path).write_bytes(converter.convert())
+        logger.info(f"Full-int8 TFLite model saved at {self.config.int8_model_path}")
+
+    @staticmethod
+    def _score(model, images: np.ndarray, labels: np.ndarray) -> dict:
+        """
+        Accuracy, predictions and single-image latency of a model with `predict_on_batch`.
+        """
+        # Warm up (first call allocates buffers / traces the graph)
+        model.predict_on_batch(images[:1])
+
+        predictions, latencies = [], []
+        for image in images:
+            start = time.perf_counter()
+            probabilities = np.asarray(model.predict_on_batch(image[np.newaxis]))
+            latencies.append(time.perf_counter() - start)
+            predictions.append(int(np.argmax(probabilities[0])))
+
+        predictions = np.asarray(predictions)
+        return {
+            "predictions": predictions,
+            "accuracy": float(np.mean(predictions == labels)),
+            "latency_ms": float(np.median(latencies) * 1000.0),
+        }
+
+    def compare_models(self):
+        """
+        Compare the Keras and TFLite models on the held-out test subset and write a report.
+
+        The report lists accuracy, the accuracy delta against Keras, agreement with the
+        Keras predictions, median single-image latency and model size for every variant.
+        """
+        files, labels, _ = load_split(self.config.split_index_path, "test", data_dir=self.config.training_data)
+        images = np.stack([load_image_array(path, self.image_size) for path in files])
+        labels = np.asarray(labels)
+
+        keras_scores = self._score(self.model, images, labels)
+        report = {
+            "keras": {
+                "accuracy": keras_scores["accuracy"],
+                "latency_ms": keras_scores["latency_ms"],
+                "size_mb": os.path.getsize(self.config.model_path) / 2**20,
+            }
+        }
+
+        for name, path in (("tflite_dynamic_range", self.config.dynamic_range_model_path),
+                           ("tflite_int8", self.config.int8_model_path)):
+            scores = self._score(TFLiteModel(path), images, labels)
+            report[name] = {
+                "accuracy": scores["accuracy"],
+                "accuracy_delta_vs_keras": scores["accuracy"] - keras_scores["accuracy"],
+                "agreement_with_keras": float(np.mean(scores["predictions"] == keras_scores["predictions"])),
+                "latency_ms": scores["latency_ms"],
+                "size_mb": os.path.getsize(path) / 2**20,
+            }
+
+        with open(self.config.report_path, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"TFLite export report saved at {self.config.report_path}")
+
+    def export_onnx(self):
+        """
+        Convert the Keras model to ONNX for serving with ONNX Runtime.
+
+        The model is traced through a tf.function with a dynamic batch dimension, which
+        works for both Keras 2 and Keras 3 models.
+        """
+        import tf2onnx
+
+        os.makedirs(self.config.root_dir, exist_ok=True)
+        input_signature = [tf.TensorSpec((None, *self.config.params_image_size), tf.float32, name="input")]
+        forward = tf.function(lambda x: self.model(x, training=False), input_signature=input_signature)
+
+        tf2onnx.convert.from_function(
+            forward,
+            input_signature=input_signature,
+            opset=self.config.params_onnx_opset,
+            output_path=str(self.config.onnx_model_path)
+        )
+        logger.info(f"ONNX model saved at {self.config.onnx_model_path}")
+
+    def check_onnx_parity(self) -> float:
+        """
+        Check that ONNX Runtime reproduces the Keras predictions on the parity images.
+
+        :raises ValueError: If any probability differs by more than the configured tolerance
+            or a predicted class differs.
+        :return: Largest absolute difference between the two models' probabilities.
+        """
+        paths = sorted(
+            p for p in Path(self.config.parity_images_dir).rglob("*")
+            if p.suffix.lower().lstrip(".") in WHITE_LIST_FORMATS
+        )
+        images = np.stack([load_image_array(path, self.image_size) for path in paths])
+
+        keras_probabilities = np.asarray(self.model.predict_on_batch(images))
+        onnx_probabilities = ONNXModel(self.config.onnx_model_path).predict_on_batch(images)
+
+        max_difference = float(np.max(np.abs(keras_probabilities - onnx_probabilities)))
+        logger.info(f"ONNX parity on {len(paths)} images: max |difference| = {max_difference:.2e}")
+
+        if max_difference > self.config.params_onnx_parity_tolerance:
+            raise ValueError(
+                f"ONNX predictions differ from Keras by {max_difference:.2e} "
+                f"(tolerance {self.config.params_onnx_parity_tolerance})"
+            )
+        if not np.array_equal(keras_probabilities.argmax(axis=1), onnx_probabilities.argmax(axis=1)):
+            raise ValueError("ONNX and Keras predict different classes on the parity images")
+        return max_difference
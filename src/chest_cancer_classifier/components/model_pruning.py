@@ -0,0 +1,248 @@
+# Import libraries
+import os
+import json
+import math
+import time
+import random
+import shutil
+import numpy as np
+import tensorflow as tf
+from pathlib import Path
+from chest_cancer_classifier import logger
+from chest_cancer_classifier.entity.config_entity import ModelPruningConfig
+from chest_cancer_classifier.components.input_pipeline import build_dataset
+from chest_cancer_classifier.components.data_split import load_split
+
+# Filter ranking criteria selectable with PRUNING_CRITERION in params.yaml
+CRITERIA = ("l1", "activation")
+
+
+def count_flops(model: tf.keras.Model) -> int:
+    """
+    FLOPs of one forward pass, counted as multiply-accumulates of the convolution and
+    dense layers (the convention behind the usual ~15.5 GFLOPs quoted for VGG16).
+    Element-wise layers (activations, batch norm, pooling) are negligible and skipped.
+    """
+    flops = 0
+    for layer in model.layers:
+        if isinstance(layer, tf.keras.Model):
+            flops += count_flops(layer)
+        elif isinstance(layer, tf.keras.layers.DepthwiseConv2D):
+            kernel_h, kernel_w = layer.kernel_size
+            _, out_h, out_w, channels = layer.output.shape
+            flops += kernel_h * kernel_w * out_h * out_w * channels
+        elif isinstance(layer, tf.keras.layers.Conv2D):
+            kernel_h, kernel_w = layer.kernel_size
+            in_channels = layer.input.shape[-1] // layer.groups
+            _, out_h, out_w, out_channels = layer.output.shape
+            flops += kernel_h * kernel_w * in_channels * out_h * out_w * out_channels
+        elif isinstance(layer, tf.keras.layers.Dense):
+            flops += int(np.prod(layer.input.shape[1:])) * layer.units
+    return flops
+
+
+def single_image_latency_ms(model: tf.keras.Model, image_size, runs: int = 50) -> float:
+    """
+    Median single-image CPU latency with `predict_on_batch`, as in the model export report.
+    """
+    image = np.random.default_rng(0).random((1, *image_size), dtype=np.float32)
+    model.predict_on_batch(image)  # Warm-up (traces the graph)
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        model.predict_on_batch(image)
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies) * 1000.0)
+
+
+def prune_filters(model: tf.keras.Model, keep_filters: dict) -> tf.keras.Model:
+    """
+    Rebuild a sequential model with only the given output filters of its conv layers.
+
+    The kept filters are copied out of every Conv2D kernel, and the layers that consume
+    them are sliced to match: the input channels of the next Conv2D, BatchNormalization
+    statistics, and the rows of the first Dense layer (after Flatten, every spatial
+    position of the kept channels). The result is a smaller dense model, not a mask.
+
+    :param model: Model whose layers form a single chain (e.g. VGG16 + head).
+    :param keep_filters: Conv layer name -> sorted indices of the filters to keep.
+    :raises ValueError: If the model has branches (e.g. residual connections).
+    :return: The pruned model.
+    """
+    layers = model.layers
+    for previous, layer in zip(layers, layers[1:]):
+        if layer.input is not previous.output:
+            raise ValueError(
+                f"Filter pruning needs a sequential model; layer '{layer.name}' does not only consume "
+                f"'{previous.name}' (use the vgg16 backbone)"
+            )
+
+    inputs = tf.keras.Input(shape=model.input.shape[1:])
+    x = inputs
+    kept = None  # Indices of the previous layer's output channels (or features) that survive
+    for layer in layers[1:]:
+        config = layer.get_config()
+        weights = layer.get_weights()
+
+        if isinstance(layer, tf.keras.layers.Conv2D) and not isinstance(layer, tf.keras.layers.DepthwiseConv2D):
+            kernel = weights[0] if kept is None else weights[0][:, :, kept, :]
+            out = np.asarray(keep_filters.get(layer.name, range(kernel.shape[-1])))
+            weights = [kernel[..., out]] + [w[out] for w in weights[1:]]
+            config["filters"] = len(out)
+            kept = out
+        elif isinstance(layer, tf.keras.layers.BatchNormalization):
+            weights = [w if kept is None else w[kept] for w in weights]
+        elif isinstance(layer, tf.keras.layers.Flatten):
+            if kept is not None:
+                positions = int(np.prod(layer.input.shape[1:-1]))
+                channels = layer.input.shape[-1]
+                kept = (np.arange(positions)[:, None] * channels + kept[None, :]).reshape(-1)
+        elif isinstance(layer, tf.keras.layers.Dense):
+            if kept is not None:
+                weights = [weights[0][kept, :]] + weights[1:]
+            kept = None
+
+        new_layer = layer.__class__.from_config(config)
+        x = new_layer(x)
+        if weights:
+            new_layer.set_weights(weights)
+
+    return tf.keras.models.Model(inputs=inputs, outputs=x)
+
+
+class ModelPruning:
+    def __init__(self, config: ModelPruningConfig):
+        """
+        Initialize the ModelPruning class with a ModelPruningConfig object.
+
+        :param config: ModelPruningConfig object containing the model paths, data and pruning parameters.
+        """
+        self.config = config
+        self.image_size = tuple(self.config.params_image_size[:-1])
+
+    def load_model(self):
+        """
+        Load the trained Keras model that is pruned.
+        """
+        self.model = tf.keras.models.load_model(self.config.model_path)
+        self.model.compile(optimizer="adam", loss="binary_crossentropy", metrics=["accuracy"])
+        self.conv_layers = [
+            layer for layer in self.model.layers
+            if isinstance(layer, tf.keras.layers.Conv2D) and not isinstance(layer, tf.keras.layers.DepthwiseConv2D)
+        ]
+
+    def _dataset(self, subset: str, shuffle: bool = False, limit: int = None) -> tf.data.Dataset:
+        """
+        tf.data pipeline over a subset of the split index.
+        """
+        files, labels, class_names = load_split(self.config.split_index_path, subset, data_dir=self.config.training_data)
+        if limit is not None and limit < len(files):
+            # Seeded sample across all classes (the split lists files class by class)
+            rows = sorted(random.Random(42).sample(range(len(files)), limit))
+            files, labels = [files[i] for i in rows], [labels[i] for i in rows]
+        return build_dataset(files, labels, len(class_names), self.image_size,
+                             self.config.params_batch_size, shuffle=shuffle, cache=False)
+
+    def rank_filters(self) -> dict:
+        """
+        Score every filter of every conv layer; higher scores are kept first.
+
+        "l1" uses the L1 norm of the filter's kernel. "activation" uses the mean absolute
+        activation of the filter over training images, so filters that rarely fire on
+        CT scans are removed first even when their weights are large.
+
+        :return: Conv layer name -> array of filter scores.
+        """
+        if self.config.params_criterion not in CRITERIA:
+            raise ValueError(f"Unknown PRUNING_CRITERION '{self.config.params_criterion}'; choose one of {', '.join(CRITERIA)}")
+
+        if self.config.params_criterion == "l1":
+            return {layer.name: np.abs(layer.get_weights()[0]).sum(axis=(0, 1, 2)) for layer in self.conv_layers}
+
+        # One pass over a sample of training images, accumulating per-channel activation means
+        probe = tf.keras.models.Model(inputs=self.model.input, outputs=[layer.output for layer in self.conv_layers])
+        totals = [np.zeros(layer.filters, dtype=np.float64) for layer in self.conv_layers]
+        count = 0
+        for images, _ in self._dataset("training", limit=self.config.params_sample_images):
+            for i, activation in enumerate(probe(images, training=False)):
+                totals[i] += np.abs(np.asarray(activation)).mean(axis=(1, 2)).sum(axis=0)
+            count += int(images.shape[0])
+        return {layer.name: total / max(count, 1) for layer, total in zip(self.conv_layers, totals)}
+
+    def _keep_filters(self, scores: dict, ratio: float) -> dict:
+        # Keep the top (1 - ratio) of every layer, in the original filter order
+        keep = {}
+        for name, layer_scores in scores.items():
+            n_keep = max(1, math.ceil((1.0 - ratio) * len(layer_scores)))
+            keep[name] = np.sort(np.argsort(-layer_scores, kind="stable")[:n_keep])
+        return keep
+
+    def _measure(self, model: tf.keras.Model, path: Path, valid_data: tf.data.Dataset) -> dict:
+        # FLOPs, latency, size and validation accuracy of a (saved) model
+        _, accuracy = model.evaluate(valid_data, verbose=0)
+        return {
+            "parameters": int(model.count_params()),
+            "gflops": count_flops(model) / 1e9,
+            "latency_ms": single_image_latency_ms(model, self.config.params_image_size),
+            "size_mb": os.path.getsize(path) / 2**20,
+            "accuracy": float(accuracy),
+        }
+
+    def prune(self) -> dict:
+        """
+        Prune the trained model at every configured ratio, fine-tune and report the trade-off.
+
+        For every ratio the same fraction of filters is removed from every conv layer,
+        the resulting dense model is fine-tuned end to end for a few epochs on the
+        training subset and measured on the validation subset. The largest ratio whose
+        accuracy stays within PRUNING_MAX_ACCURACY_DROP of the unpruned model is copied
+        to `pruned_model_path`.
+
+        :return: The report, also written to `report_path`.
+        """
+        os.makedirs(self.config.root_dir, exist_ok=True)
+        valid_data = self._dataset("validation")
+        scores = self.rank_filters()
+
+        report = {"criterion": self.config.params_criterion, "ratios": {}}
+        report["ratios"]["0.0"] = baseline = self._measure(self.model, self.config.model_path, valid_data)
+        logger.info(f"Unpruned model: {baseline['gflops']:.2f} GFLOPs, accuracy {baseline['accuracy']:.3f}")
+
+        selected = None
+        for ratio in sorted(self.config.params_ratios):
+            pruned = prune_filters(self.model, self._keep_filters(scores, ratio))
+
+            # Brief end-to-end fine-tuning so the remaining filters compensate for the removed ones
+            for layer in pruned.layers:
+                layer.trainable = True
+            pruned.compile(
+                optimizer=tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate),
+                loss="binary_crossentropy",
+                metrics=["accuracy"]
+            )
+            if self.config.params_finetune_epochs:
+                pruned.fit(self._dataset("training", shuffle=True), epochs=self.config.params_finetune_epochs)
+
+            path = Path(self.config.root_dir, f"model_pruned_{int(round(ratio * 100))}.h5")
+            pruned.save(path)
+            metrics = self._measure(pruned, path, valid_data)
+            metrics["accuracy_delta"] = metrics["accuracy"] - baseline["accuracy"]
+            metrics["speedup"] = baseline["latency_ms"] / metrics["latency_ms"]
+            report["ratios"][str(ratio)] = metrics
+            logger.info(
+                f"Pruning ratio {ratio}: {metrics['gflops']:.2f} GFLOPs, {metrics['latency_ms']:.1f} ms, "
+                f"{metrics['size_mb']:.1f} MB, accuracy {metrics['accuracy']:.3f}"
+            )
+
+            if -metrics["accuracy_delta"] <= self.config.params_max_accuracy_drop:
+                selected = (ratio, path)
+            tf.keras.backend.clear_session()
+
+        # Keep the most compressed model that is still accurate enough (the unpruned one otherwise)
+        report["selected_ratio"] = selected[0] if selected else 0.0
+        shutil.copyfile(selected[1] if selected else self.config.model_path, self.config.pruned_model_path)
+
+        with open(self.config.report_path, "w") as f:
+            json.dump(report, f, indent=4)
+        logger.info(f"Pruning report saved at {self.config.report_path} (selected ratio {report['selected_ratio']})")
+        return report
@@ -2,13 +2,63 @@
 # import libraries
 
 import os
+import json
 import time
+import shutil
+import hashlib
+import numpy as np
+import pandas as pd
 import tensorflow as tf
 from pathlib import Path
 from zipfile import ZipFile
 import urllib.request as request
 from chest_cancer_classifier.entity.config_entity import TrainingConfig
-
+from chest_cancer_classifier.components.input_pipeline import (list_image_files,
+                                                                build_dataset,
+                                                                TensorCacheSequence)
+from chest_cancer_classifier.components.data_preprocessing import load_tensor_cache
+from chest_cancer_classifier.components.dataset_manifest import file_hashes
+from chest_cancer_classifier.components.data_split import load_split, split_digest
+from chest_cancer_classifier.components.training_checkpoint import (AsyncCheckpoint,
+                                                                    load_latest_checkpoint,
+                                                                    restore_rng_state)
+from chest_cancer_classifier.components.zip_dataset import ZipImageReader, build_zip_dataset
+from chest_cancer_classifier.components.data_sharding import build_shard_dataset, load_shard_index, worker_shard_files
+from chest_cancer_classifier.components.distillation import (teacher_logits_model,
+                                                             build_student,
+                                                             build_distillation_dataset,
+                                                             distillation_loss,
+                                                             distillation_accuracy)
+from chest_cancer_classifier import logger
+
+
+
+class ThroughputCallback(tf.keras.callbacks.Callback):
+    """
+    Measure training throughput (images per second) for every epoch.
+    """
+
+    def __init__(self, batch_size: int):
+        super().__init__()
+        self.batch_size = batch_size
+        self.epoch_images_per_second = []
+
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+        self._batches = 0
+
+    def on_train_batch_end(self, batch, logs=None):
+        self._batches += 1
+
+    def on_epoch_end(self, epoch, logs=None):
+        elapsed = time.perf_counter() - self._start
+        self.epoch_images_per_second.append(self._batches * self.batch_size / elapsed)
+
+    @property
+    def images_per_second(self) -> float:
+        # Skip the first epoch when possible: it includes tracing / XLA compilation
+        values = self.epoch_images_per_second[1:] or self.epoch_images_per_second
+        return float(np.mean(values)) if values else 0.0
 
 
 class Training:
@@ -19,45 +69,168 @@ class Training:
         :param config: TrainingConfig object containing configuration for training.
         """
         self.config = config
+        self.initial_epoch = 0  # Epoch to start from (set when resuming from a checkpoint)
+        self.strategy = None  # Distribution strategy (created on first use)
+
+    def setup_distribution(self):
+        """
+        Create the distribution strategy selected with DISTRIBUTION in params.yaml.
+
+        'multi_worker' uses MultiWorkerMirroredStrategy: every worker process holds a copy
+        of the model and gradients are all-reduced over the network (ring all-reduce, which
+        needs no GPU). The cluster and this worker's role come from the TF_CONFIG
+        environment variable. Must run before any other TensorFlow operation.
+        """
+        if self.strategy is not None:
+            return
+        self.num_workers, self.worker_index, self.is_chief = 1, 0, True
+
+        if self.config.params_distribution == "multi_worker":
+            if "TF_CONFIG" not in os.environ:
+                raise ValueError("DISTRIBUTION 'multi_worker' needs the TF_CONFIG environment variable "
+                                 "(see benchmarks/multi_worker_launcher.py)")
+            self.strategy = tf.distribute.MultiWorkerMirroredStrategy(
+                communication_options=tf.distribute.experimental.CommunicationOptions(
+                    implementation=tf.distribute.experimental.CommunicationImplementation.RING
+                )
+            )
+            resolver = self.strategy.cluster_resolver
+            cluster = resolver.cluster_spec().as_dict()
+            chiefs = len(cluster.get("chief", []))
+            self.num_workers = chiefs + len(cluster.get("worker", []))
+            self.worker_index = resolver.task_id + (chiefs if resolver.task_type == "worker" else 0)
+            self.is_chief = self.worker_index == 0
+            logger.info(f"Worker {self.worker_index} of {self.num_workers} joined the training cluster")
+        elif self.config.params_distribution == "none":
+            self.strategy = tf.distribute.get_strategy()
+        else:
+            raise ValueError(f"Unknown DISTRIBUTION '{self.config.params_distribution}'; choose 'none' or 'multi_worker'")
+
+        # Every worker runs BATCH_SIZE images per step, so one step covers BATCH_SIZE x workers images
+        self.global_batch_size = self.config.params_batch_size * self.num_workers
+
+    def worker_shard(self, items: list) -> list:
+        """
+        This worker's share of a list of files (every num_workers-th item).
+        """
+        return items[self.worker_index::self.num_workers]
+
+    def distribute(self, dataset: tf.data.Dataset) -> tf.data.Dataset:
+        """
+        Prepare a per-worker dataset for the distribution strategy.
+
+        Files are already sharded per worker, so automatic sharding is switched off; the
+        dataset is batched with the global batch size, which the strategy splits into
+        BATCH_SIZE per worker.
+        """
+        if self.num_workers == 1:
+            return dataset
+        options = tf.data.Options()
+        options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.OFF
+        return dataset.with_options(options)
 
     def get_base_model(self):
         """
         Load and compile the base model for training.
         """
-        # Load the pre-trained base model
-        self.model = tf.keras.models.load_model(self.config.updated_base_model_path)
+        self.setup_distribution()
+
+        # Variables are created in the strategy scope so they are mirrored on every worker
+        with self.strategy.scope():
+            # Load the pre-trained base model
+            self.model = tf.keras.models.load_model(self.config.updated_base_model_path)
+
+            # Switch to a mixed-precision policy when selected in params.yaml
+            if self.config.params_precision_policy != "float32":
+                tf.keras.mixed_precision.set_global_policy(self.config.params_precision_policy)
+                self.model = self.with_policy(self.model, self.config.params_precision_policy)
+
+            # Compile the model with optimizer, loss, and metrics
+            self.model.compile(
+                optimizer=tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate),  # Adam optimizer for training
+                loss="binary_crossentropy",  # Loss for binary classification
+                metrics = ["accuracy"],  # Metrics to track model performance
+                jit_compile=self.config.params_jit_compile  # XLA-compile the train step if enabled
+            )
 
-        # Compile the model with optimizer, loss, and metrics
-        self.model.compile(
-            optimizer=tf.keras.optimizers.Adam(),  # Adam optimizer for training
-            loss="binary_crossentropy",  # Loss for binary classification
-            metrics = ["accuracy"]  # Metrics to track model performance
-        )
+    @staticmethod
+    def with_policy(model: tf.keras.Model, policy: str) -> tf.keras.Model:
+        """
+        Clone a model with every layer on the given dtype policy.
+
+        Output layers always stay float32 so the softmax and the loss are computed in full
+        precision. Weights are copied over from the original model.
+
+        :param model: Model to clone.
+        :param policy: Keras dtype policy name, e.g. "mixed_bfloat16" or "float32".
+        :return: The cloned model.
+        """
+        output_layers = {t._keras_history[0].name for t in tf.nest.flatten(model.outputs)}
+
+        def clone_layer(layer):
+            config = layer.get_config()
+            config["dtype"] = "float32" if layer.name in output_layers else policy
+            return layer.__class__.from_config(config)
+
+        clone = tf.keras.models.clone_model(model, clone_function=clone_layer)
+        clone.set_weights(model.get_weights())
+        return clone
+
+    def load_subset(self, subset: str):
+        """
+        Files, labels and class names of a subset of the persisted split index.
+
+        :param subset: "training", "validation" or "test".
+        :return: Tuple of (file paths, integer labels, class names).
+        """
+        return load_split(self.config.split_index_path, subset, data_dir=self.config.training_data)
 
     def train_valid_generator(self):
         """
         Prepare training, validation, and test data generators.
         """
+        self.setup_distribution()
+        if self.num_workers > 1 and self.config.params_data_pipeline not in ("tf_data", "zip", "shards"):
+            raise ValueError("Multi-worker training needs a tf.data pipeline: set DATA_PIPELINE to "
+                             "'tf_data', 'zip' or 'shards'")
+
+        # Use the tf.data pipeline when selected in params.yaml
+        if self.config.params_data_pipeline == "tf_data":
+            return self.train_valid_dataset()
+        if self.config.params_data_pipeline == "tensor_cache":
+            return self.train_valid_tensor_cache()
+        if self.config.params_data_pipeline == "zip":
+            return self.train_valid_zip()
+        if self.config.params_data_pipeline == "shards":
+            return self.train_valid_shards()
+
+        # Subsets from the split index, as (file path, class name) data frames
+        train_files, train_labels, class_names = self.load_subset("training")
+        valid_files, valid_labels, _ = self.load_subset("validation")
+        train_frame = pd.DataFrame({"filename": train_files, "class": [class_names[l] for l in train_labels]})
+        valid_frame = pd.DataFrame({"filename": valid_files, "class": [class_names[l] for l in valid_labels]})
+
         # Arguments for data preprocessing
         datagenerator_kwargs = dict(
-            rescale=1.0 / 255,  # Normalize pixel values to [0, 1]
-            validation_split=0.20
+            rescale=1.0 / 255  # Normalize pixel values to [0, 1]
         )
 
         # Arguments for image resizing and batching
         dataflow_kwargs = dict(
+            x_col="filename",  # Column with the image paths
+            y_col="class",  # Column with the class names
+            classes=class_names,  # Keep the class indices of the split index
             target_size=self.config.params_image_size[:-1],  # Image size excluding channels
             batch_size=self.config.params_batch_size,  # Batch size for generators
             interpolation="bilinear"  # Interpolation method for resizing images
         )
 
-        # Validation data generator using 'valid' folder
+        # Validation data generator
         valid_datagenerator = tf.keras.preprocessing.image.ImageDataGenerator(
             **datagenerator_kwargs
         )
-        self.valid_generator = valid_datagenerator.flow_from_directory(
-            directory=self.config.training_data,
-            subset="validation",
+        self.valid_generator = valid_datagenerator.flow_from_dataframe(
+            dataframe=valid_frame,
             shuffle=False,  # No shuffling for validation data
             **dataflow_kwargs
         )
@@ -78,45 +251,496 @@ class Training:
             # Simple generator without augmentation
             train_datagenerator = valid_datagenerator
 
-        self.train_generator = train_datagenerator.flow_from_directory(
-            directory=self.config.training_data,
-            subset="training",
+        self.train_generator = train_datagenerator.flow_from_dataframe(
+            dataframe=train_frame,
             shuffle=True,  # Shuffle training data
             **dataflow_kwargs
         )
 
+        # Number of images in each subset
+        self.train_samples = self.train_generator.samples
+        self.valid_samples = self.valid_generator.samples
+
+    def train_valid_dataset(self):
+        """
+        Prepare training and validation tf.data pipelines.
+
+        Uses the subsets of the split index, but decodes images in parallel, caches
+        them after decode/resize, augments whole batches and prefetches the next batch
+        while the current one trains.
+        """
+        image_size = self.config.params_image_size[:-1]  # Image size excluding channels
+        batch_size = self.global_batch_size
+
+        # Same file lists as the generator subsets
+        train_files, train_labels, class_names = self.load_subset("training")
+        valid_files, valid_labels, _ = self.load_subset("validation")
+
+        # Validation pipeline: no shuffling, no augmentation
+        self.valid_generator = self.distribute(build_dataset(
+            self.worker_shard(valid_files), self.worker_shard(valid_labels), len(class_names), image_size, batch_size
+        ))
+
+        # Training pipeline: shuffled every epoch and repeated so steps_per_epoch controls the epoch length
+        self.train_generator = self.distribute(build_dataset(
+            self.worker_shard(train_files), self.worker_shard(train_labels), len(class_names), image_size, batch_size,
+            shuffle=True,
+            augment=self.config.params_is_augmentation,
+            repeat=True
+        ))
+
+        # Number of images in each subset (validation: what the smallest worker share covers)
+        self.train_samples = len(train_files)
+        self.valid_samples = len(valid_files) // self.num_workers * self.num_workers
+
+    def train_valid_tensor_cache(self):
+        """
+        Prepare training and validation batches from the preprocessed tensor cache.
+
+        Images are read from the memory-mapped array written by the data preprocessing
+        stage, so nothing is decoded or resized during training.
+        """
+        # Open the cache and make sure it matches the current data and IMAGE_SIZE
+        images, labels, index = load_tensor_cache(
+            self.config.preprocessed_images_path,
+            self.config.preprocessed_index_path,
+            data_dir=self.config.training_data,
+            image_size=self.config.params_image_size
+        )
+        num_classes = len(index["class_names"])
+
+        # Cache rows of every subset of the split index
+        rows = {Path(f).as_posix(): row for row, f in enumerate(index["files"])}
+        subset_rows = {
+            subset: [rows[f] for f in load_split(self.config.split_index_path, subset)[0]]
+            for subset in ("training", "validation")
+        }
+
+        self.valid_generator = TensorCacheSequence(
+            images, labels, subset_rows["validation"],
+            num_classes, self.config.params_batch_size
+        )
+        self.train_generator = TensorCacheSequence(
+            images, labels, subset_rows["training"],
+            num_classes, self.config.params_batch_size,
+            shuffle=True,
+            augment=self.config.params_is_augmentation
+        )
+
+        # Number of images in each subset
+        self.train_samples = self.train_generator.samples
+        self.valid_samples = self.valid_generator.samples
+
+    def train_valid_zip(self):
+        """
+        Prepare training and validation tf.data pipelines that read data.zip directly.
+
+        Members of every subset are decoded from memory by the parallel map workers,
+        so the dataset never has to be extracted.
+        """
+        image_size = self.config.params_image_size[:-1]  # Image size excluding channels
+        batch_size = self.global_batch_size
+        reader = ZipImageReader(self.config.source_zip_path)
+
+        # Subsets of the split index, as member names inside the archive
+        train_files, train_labels, class_names = load_split(self.config.split_index_path, "training")
+        valid_files, valid_labels, _ = load_split(self.config.split_index_path, "validation")
+        train_names = [f"{self.config.zip_data_root}/{f}" for f in train_files]
+        valid_names = [f"{self.config.zip_data_root}/{f}" for f in valid_files]
+
+        # Validation pipeline: no shuffling, no augmentation
+        self.valid_generator = self.distribute(build_zip_dataset(
+            reader, self.worker_shard(valid_names), self.worker_shard(valid_labels), len(class_names),
+            image_size, batch_size
+        ))
+
+        # Training pipeline: shuffled every epoch and repeated so steps_per_epoch controls the epoch length
+        self.train_generator = self.distribute(build_zip_dataset(
+            reader, self.worker_shard(train_names), self.worker_shard(train_labels), len(class_names),
+            image_size, batch_size,
+            shuffle=True,
+            augment=self.config.params_is_augmentation,
+            repeat=True
+        ))
+
+        # Number of images in each subset (validation: what the smallest worker share covers)
+        self.train_samples = len(train_names)
+        self.valid_samples = len(valid_names) // self.num_workers * self.num_workers
+
+    def train_valid_shards(self):
+        """
+        Prepare training and validation tf.data pipelines over the TFRecord shards.
+
+        Shards are read sequentially and interleaved, which keeps reads large and
+        mostly sequential on network filesystems and cold disks.
+        """
+        # Make sure the shards were written from the current images
+        index = load_shard_index(self.config.shard_index_path, data_dir=self.config.training_data)
+        shard_kwargs = dict(
+            image_size=self.config.params_image_size[:-1],  # Image size excluding channels
+            batch_size=self.global_batch_size,
+            cycle_length=self.config.shard_cycle_length,
+            num_workers=self.num_workers,  # Every worker reads its own shard files
+            worker_index=self.worker_index
+        )
+        train_files = load_split(self.config.split_index_path, "training")[0]
+        valid_files = load_split(self.config.split_index_path, "validation")[0]
+
+        # Validation pipeline: no shuffling, no augmentation
+        self.valid_generator = self.distribute(
+            build_shard_dataset(self.config.shard_index_path, files=valid_files, **shard_kwargs)
+        )
+
+        # Training pipeline: shards and records shuffled every epoch, repeated so steps_per_epoch controls the epoch length
+        self.train_generator = self.distribute(build_shard_dataset(
+            self.config.shard_index_path, files=train_files,
+            shuffle=True,
+            augment=self.config.params_is_augmentation,
+            repeat=True,
+            shuffle_buffer=self.config.shard_shuffle_buffer,
+            **shard_kwargs
+        ))
+
+        # Number of images in each subset (validation: what the smallest worker share covers)
+        self.train_samples = len(train_files)
+        valid_set = set(valid_files)
+        worker_valid = [
+            sum(f in valid_set for f in worker_shard_files(index, self.num_workers, worker))
+            for worker in range(self.num_workers)
+        ]
+        self.valid_samples = min(worker_valid) * self.num_workers
+
     @staticmethod
     def save_model(path: Path, model: tf.keras.Model):
         """
         Save the trained model to the specified path.
 
+        Mixed-precision models are converted back to float32 first, so the saved
+        model loads the same way regardless of the training policy.
+
         :param path: Path to save the model.
         :param model: Trained model object.
         """
+        if tf.keras.mixed_precision.global_policy().name != "float32":
+            tf.keras.mixed_precision.set_global_policy("float32")
+            model = Training.with_policy(model, "float32")
         model.save(path)
 
+    def checkpoint_fingerprint(self) -> str:
+        """
+        Fingerprint of everything a checkpoint depends on except the number of epochs.
+
+        A checkpoint is only resumed when the base model, the data subsets and the
+        training settings are the same; EPOCHS may grow, so a finished run can be extended.
+        """
+        model_stat = os.stat(self.config.updated_base_model_path)
+        return hashlib.sha256(json.dumps([
+            model_stat.st_mtime_ns, model_stat.st_size,
+            list(self.config.params_image_size),
+            self.config.params_batch_size,
+            self.config.params_learning_rate,
+            self.num_workers,  # Steps per epoch depend on the global batch size
+            self.config.params_is_augmentation,
+            self.config.params_data_pipeline,
+            self.config.params_precision_policy,
+            split_digest(self.config.split_index_path, "training"),
+            split_digest(self.config.split_index_path, "validation"),
+        ]).encode()).hexdigest()
+
+    def _checkpointed_sequences(self) -> list:
+        # Data sequences with their own shuffling RNG
+        return [self.train_generator] if isinstance(self.train_generator, TensorCacheSequence) else []
+
+    def resume_from_checkpoint(self) -> bool:
+        """
+        Restore the model, optimizer, RNG state and epoch from the latest valid checkpoint.
+
+        Call after `get_base_model` and `train_valid_generator`. Checkpoints written for
+        another configuration, and incomplete or unreadable ones, are skipped.
+
+        :return: True when training resumes from a checkpoint.
+        """
+        if self.config.params_training_mode != "full":
+            return False
+        checkpoint = load_latest_checkpoint(self.config.checkpoint_dir, self.checkpoint_fingerprint())
+        if checkpoint is None:
+            return False
+
+        self.model.set_weights(checkpoint["weights"])
+        optimizer = self.model.optimizer
+        with self.strategy.scope():  # Optimizer slots are mirrored like the model variables
+            optimizer.build(self.model.trainable_variables)
+        if len(optimizer.variables) != len(checkpoint["optimizer_variables"]):
+            logger.warning(f"Optimizer state of {checkpoint['path']} does not match the model, starting over")
+            return False
+        for variable, value in zip(optimizer.variables, checkpoint["optimizer_variables"]):
+            variable.assign(value)
+        restore_rng_state(checkpoint["rng_state"], self._checkpointed_sequences())
+
+        self.initial_epoch = checkpoint["epoch"] + 1
+        logger.info(f"Resuming training from {checkpoint['path']} (epoch {self.initial_epoch}, "
+                    f"step {checkpoint['global_step']})")
+        return True
+
     def train(self):
         """
         Train the model using the training and validation data generators.
-        """
-        # Calculate steps per epoch for training and validation
-        self.steps_per_epoch = self.train_generator.samples // self.train_generator.batch_size
-        self.validation_steps = self.valid_generator.samples // self.valid_generator.batch_size
 
-        # Train the model
+        Every CHECKPOINT_EVERY_EPOCHS epochs a checkpoint is written in the background;
+        `resume_from_checkpoint` picks training up from it after a crash. The checkpoints
+        are removed once the trained model is saved.
+        """
+        if self.num_workers > 1 and self.config.params_training_mode != "full":
+            raise ValueError("Multi-worker training supports TRAINING_MODE 'full' only")
+
+        # Train only the classification head on cached backbone features when selected in params.yaml
+        if self.config.params_training_mode == "cached_features":
+            return self.train_on_cached_features()
+        # Train a compact student on the cached soft targets of the teacher model
+        if self.config.params_training_mode == "distillation":
+            return self.train_distillation()
+
+        # Calculate steps per epoch for training and validation (one step covers the global batch)
+        self.steps_per_epoch = self.train_samples // self.global_batch_size
+        self.validation_steps = self.valid_samples // self.global_batch_size
+
+        # Train the model; only the chief worker writes checkpoints and the trained model
+        throughput = ThroughputCallback(self.global_batch_size)
+        callbacks = [throughput]
+        if self.is_chief:
+            callbacks.append(AsyncCheckpoint(
+                self.config.checkpoint_dir,
+                fingerprint=self.checkpoint_fingerprint(),
+                steps_per_epoch=self.steps_per_epoch,
+                every_epochs=self.config.params_checkpoint_every_epochs,
+                keep=self.config.params_checkpoint_keep,
+                sequences=self._checkpointed_sequences()
+            ))
         self.model.fit(
             self.train_generator,  # Training data generator
             epochs=self.config.params_epochs,  # Number of epochs
+            initial_epoch=self.initial_epoch,  # First epoch (after a resumed checkpoint)
             steps_per_epoch=self.steps_per_epoch,  # Steps per epoch
             validation_data=self.valid_generator,  # Validation data generator
-            validation_steps=self.validation_steps  # Validation steps
+            validation_steps=self.validation_steps,  # Validation steps
+            callbacks=callbacks  # Measure images per second, checkpoint every few epochs
         )
+        if not self.is_chief:
+            return
 
         # Save the trained model
         self.save_model(
             path=self.config.trained_model_path,  # Save path for trained model
             model=self.model  # The trained model
         )
+        self.save_training_metrics(throughput)
+
+        # The run is complete; a new run starts from the base model again
+        shutil.rmtree(self.config.checkpoint_dir, ignore_errors=True)
+
+    def save_training_metrics(self, throughput: ThroughputCallback):
+        """
+        Record the measured throughput and the precision settings for the evaluation stage.
+
+        :param throughput: Callback that timed the training epochs.
+        """
+        metrics = {
+            "precision_policy": self.config.params_precision_policy,
+            "jit_compile": self.config.params_jit_compile,
+            "num_workers": self.num_workers,
+            "train_images_per_second": throughput.images_per_second,
+        }
+        with open(self.config.training_metrics_path, "w") as f:
+            json.dump(metrics, f, indent=4)
+        logger.info(f"Training throughput: {metrics['train_images_per_second']:.1f} images/s")
+
+    def split_frozen_model(self):
+        """
+        Split the model into its frozen backbone and the trainable head layers.
+
+        The head is every layer after the last non-trainable layer (e.g. Flatten + Dense for
+        the default model), applied in sequence.
+
+        :return: Tuple of (backbone model, list of head layers).
+        """
+        layers = self.model.layers
+        frozen = [i for i, layer in enumerate(layers) if not layer.trainable]
+        if not frozen or frozen[-1] == len(layers) - 1:
+            raise ValueError("Cached-feature training needs a frozen backbone followed by a trainable head")
+
+        boundary = frozen[-1] + 1
+        backbone = tf.keras.models.Model(inputs=self.model.input, outputs=layers[boundary - 1].output)
+        return backbone, layers[boundary:]
+
+    def extract_features(self, backbone: tf.keras.Model, subset: str, store: str = "features",
+                         model_path: Path = None):
+        """
+        Run the frozen backbone over a subset, reusing features cached on disk.
+
+        Features are stored per image content hash, for as long as the model file and
+        IMAGE_SIZE are unchanged, so only new or modified images go through the
+        backbone. Images are not augmented, since every epoch reuses the same features.
+
+        :param backbone: Frozen model whose outputs are cached (backbone, or teacher logits).
+        :param subset: "training" or "validation".
+        :param store: Name of the store in `features_dir` (one store per model role).
+        :param model_path: Model file the outputs depend on (defaults to the base model).
+        :return: Tuple of (features, one-hot labels).
+        """
+        all_files, _, _ = list_image_files(self.config.training_data)
+        files, labels, class_names = self.load_subset(subset)
+        hashes = file_hashes(self.config.training_data, files, self.config.manifest_path)
+        one_hot = np.eye(len(class_names), dtype=np.float32)[labels]
+
+        # Key the store on everything except the images that changes the features
+        model_stat = os.stat(model_path or self.config.updated_base_model_path)
+        key = hashlib.sha256(json.dumps([
+            model_stat.st_mtime_ns, model_stat.st_size,
+            list(self.config.params_image_size),
+        ]).encode()).hexdigest()
+
+        features_path = Path(self.config.features_dir, f"{store}.npy")
+        meta_path = Path(self.config.features_dir, f"{store}.json")
+
+        # Load the content-addressed store (sha256 -> row) if it was built with the same model
+        stored, rows = None, {}
+        if features_path.exists() and meta_path.exists():
+            with open(meta_path) as f:
+                meta = json.load(f)
+            if meta.get("key") == key:
+                stored = np.load(features_path)
+                rows = {digest: row for row, digest in enumerate(meta["hashes"])}
+
+        missing = [i for i, digest in enumerate(hashes) if digest not in rows]
+        if not missing:
+            logger.info(f"Reusing cached {store} for all {len(files)} {subset} images")
+            return stored[[rows[digest] for digest in hashes]], one_hot
+
+        logger.info(f"Computing {store} for {len(missing)} of {len(files)} {subset} images")
+        dataset = build_dataset(
+            [files[i] for i in missing], [labels[i] for i in missing], len(class_names),
+            self.config.params_image_size[:-1], self.config.params_batch_size, cache=False
+        ).map(lambda images, y: images)
+        new_features = backbone.predict(dataset)
+
+        # Merge into the store, dropping images that are no longer in the dataset
+        current = set(file_hashes(self.config.training_data, all_files, self.config.manifest_path))
+        kept = [digest for digest in rows if digest in current]
+        store_hashes = kept + [hashes[i] for i in missing]
+        parts = ([stored[[rows[digest] for digest in kept]]] if kept else []) + [new_features]
+        store = np.concatenate(parts)
+
+        os.makedirs(self.config.features_dir, exist_ok=True)
+        np.save(f"{features_path}.tmp.npy", store)
+        os.replace(f"{features_path}.tmp.npy", features_path)
+        with open(meta_path, "w") as f:
+            json.dump({"key": key, "hashes": store_hashes}, f)
+
+        rows = {digest: row for row, digest in enumerate(store_hashes)}
+        return store[[rows[digest] for digest in hashes]], one_hot
+
+    def train_on_cached_features(self):
+        """
+        Train only the classification head on cached backbone features.
+
+        The frozen backbone runs once per image instead of once per image per epoch.
+        The head layers are shared with the full model, so the trained weights land in
+        `self.model`, which is saved in the usual full-model format.
+        """
+        backbone, head_layers = self.split_frozen_model()
+        train_features, train_labels = self.extract_features(backbone, "training")
+        valid_features, valid_labels = self.extract_features(backbone, "validation")
+
+        # Rebuild the head on a features input; layers (and weights) are shared with self.model
+        inputs = tf.keras.Input(shape=train_features.shape[1:])
+        x = inputs
+        for layer in head_layers:
+            x = layer(x)
+        head = tf.keras.models.Model(inputs=inputs, outputs=x)
+
+        # Same optimizer, loss and metrics as the full model
+        head.compile(
+            optimizer=tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate),
+            loss="binary_crossentropy",
+            metrics=["accuracy"],
+            jit_compile=self.config.params_jit_compile
+        )
+
+        # Train the head on the cached features
+        throughput = ThroughputCallback(self.config.params_batch_size)
+        head.fit(
+            np.asarray(train_features), train_labels,
+            batch_size=self.config.params_batch_size,
+            epochs=self.config.params_epochs,
+            shuffle=True,
+            validation_data=(np.asarray(valid_features), valid_labels),
+            callbacks=[throughput]
+        )
+
+        # Save the full model (backbone + trained head)
+        self.save_model(
+            path=self.config.trained_model_path,
+            model=self.model
+        )
+        self.save_training_metrics(throughput)
+
+    def train_distillation(self):
+        """
+        Distil the trained teacher model into a compact CNN student.
+
+        Teacher logits are computed once per image and kept in the content-addressed
+        store next to the cached features, so the teacher never runs again unless the
+        teacher file, IMAGE_SIZE or the images change. The student is trained on the
+        distillation loss (soft teacher targets plus hard labels) and saved in place of
+        the trained model, in the same .h5 format the prediction pipeline loads.
+        """
+        if not os.path.exists(self.config.teacher_model_path):
+            raise ValueError(
+                f"Teacher model not found at {self.config.teacher_model_path}; train it with "
+                f"TRAINING_MODE 'full' and copy {self.config.trained_model_path} there"
+            )
+        teacher = teacher_logits_model(tf.keras.models.load_model(self.config.teacher_model_path))
+
+        # Teacher logits for both subsets (cached on disk, reused across runs)
+        data = {}
+        for subset in ("training", "validation"):
+            files, labels, class_names = self.load_subset(subset)
+            logits, _ = self.extract_features(teacher, subset, store="teacher_logits",
+                                              model_path=self.config.teacher_model_path)
+            data[subset] = build_distillation_dataset(
+                files, labels, logits, len(class_names), self.config.params_image_size[:-1],
+                self.config.params_batch_size, shuffle=(subset == "training")
+            )
+        num_classes = len(class_names)
+
+        # The student is trained on its logits; its softmax output is what gets saved
+        student = build_student(self.config.params_image_size, num_classes, self.config.params_student_filters)
+        student_logits = tf.keras.models.Model(inputs=student.input, outputs=student.get_layer("logits").output)
+        student_logits.compile(
+            optimizer=tf.keras.optimizers.Adam(learning_rate=self.config.params_learning_rate),
+            loss=distillation_loss(num_classes, self.config.params_distillation_temperature,
+                                   self.config.params_distillation_alpha),
+            metrics=[distillation_accuracy(num_classes)],
+            jit_compile=self.config.params_jit_compile
+        )
+
+        throughput = ThroughputCallback(self.config.params_batch_size)
+        student_logits.fit(
+            data["training"],
+            epochs=self.config.params_epochs,
+            validation_data=data["validation"],
+            callbacks=[throughput]
+        )
+
+        # Save the student (with its softmax output) where the trained model is expected
+        student.compile(optimizer="adam", loss="binary_crossentropy", metrics=["accuracy"])
+        self.model = student
+        self.save_model(
+            path=self.config.trained_model_path,
+            model=student
+        )
+        self.save_training_metrics(throughput)
+        logger.info(f"Student with {student.count_params():,} parameters saved at {self.config.trained_model_path}")
 
 
 
@@ -9,6 +9,24 @@ from chest_cancer_classifier.entity.config_entity import (DataIngestionConfig,
                                                               TrainingConfig,
                                                               EvaluationConfig)
 
+# Backbones selectable with BACKBONE in params.yaml: (constructor, input scale, input offset).
+# Every input pipeline feeds images scaled to [0, 1]; a Rescaling layer in front of the
+# backbone maps them to the range its ImageNet weights expect. MobileNetV3 and EfficientNet
+# normalize internally from [0, 255], MobileNetV2 expects [-1, 1]. VGG16 and ResNet50 keep
+# the [0, 1] inputs this project has always fed VGG16 (no Rescaling layer is added).
+BACKBONES = {
+    "vgg16": (tf.keras.applications.VGG16, 1.0, 0.0),
+    "resnet50": (tf.keras.applications.ResNet50, 1.0, 0.0),
+    "mobilenet_v2": (tf.keras.applications.MobileNetV2, 2.0, -1.0),
+    "mobilenet_v3_small": (tf.keras.applications.MobileNetV3Small, 255.0, 0.0),
+    "mobilenet_v3_large": (tf.keras.applications.MobileNetV3Large, 255.0, 0.0),
+    "efficientnet_b0": (tf.keras.applications.EfficientNetB0, 255.0, 0.0),
+}
+
+# Classification heads selectable with HEAD in params.yaml
+HEADS = ("flatten", "gap", "gmp", "mlp")
+
+
 class PrepareBaseModel:
     def __init__(self, config: PrepareBaseModelConfig):
         # Initialize the class with a configuration object for preparing the base model
@@ -16,9 +34,22 @@ class PrepareBaseModel:
 
     
     def get_base_model(self):
-        # Create the base model using the VGG16 architecture from Keras
-        self.model = tf.keras.applications.vgg16.VGG16(
+        # Create the base model with the backbone selected in params.yaml
+        if self.config.params_backbone not in BACKBONES:
+            raise ValueError(
+                f"Unknown BACKBONE '{self.config.params_backbone}'; choose one of {', '.join(BACKBONES)}"
+            )
+        constructor, scale, offset = BACKBONES[self.config.params_backbone]
+
+        # Map the [0, 1] pipeline inputs to the backbone's expected range inside the model
+        input_tensor = None
+        if (scale, offset) != (1.0, 0.0):
+            inputs = tf.keras.Input(shape=self.config.params_image_size)
+            input_tensor = tf.keras.layers.Rescaling(scale, offset=offset, name="input_rescaling")(inputs)
+
+        self.model = constructor(
             input_shape=self.config.params_image_size,  # Set the input shape based on the config
+            input_tensor=input_tensor,  # Rescaled input (None builds the backbone's own input)
             weights=self.config.params_weights,  # Load weights specified in the config
             include_top=self.config.params_include_top  # Include the top layer or not, based on config
         )
@@ -28,8 +59,34 @@ class PrepareBaseModel:
 
     
     @staticmethod
-    def _prepare_full_model(model, classes, freeze_all, freeze_till, learning_rate):
-        # Prepare a full model by adding a classification layer on top of the base model
+    def _build_head(features, head, units, dropout):
+        """
+        Reduce the backbone's feature map to a feature vector for the output layer.
+
+        :param features: Output tensor of the backbone (height x width x channels).
+        :param head: "flatten" (every position, e.g. 25,088 features for VGG16 at 224x224),
+            "gap" / "gmp" (global average / max pooling, one feature per channel) or
+            "mlp" (global average pooling, a hidden ReLU layer and dropout).
+        :param units: Hidden units of the "mlp" head.
+        :param dropout: Dropout rate of the "mlp" head.
+        :return: The feature vector tensor.
+        """
+        if head == "flatten":
+            return tf.keras.layers.Flatten()(features)
+        if head == "gap":
+            return tf.keras.layers.GlobalAveragePooling2D()(features)
+        if head == "gmp":
+            return tf.keras.layers.GlobalMaxPooling2D()(features)
+        if head == "mlp":
+            x = tf.keras.layers.GlobalAveragePooling2D()(features)
+            x = tf.keras.layers.Dense(units=units, activation="relu")(x)
+            return tf.keras.layers.Dropout(rate=dropout)(x)
+        raise ValueError(f"Unknown HEAD '{head}'; choose one of {', '.join(HEADS)}")
+
+    @staticmethod
+    def _prepare_full_model(model, classes, freeze_all, freeze_till, learning_rate,
+                            head="flatten", head_units=256, head_dropout=0.5):
+        # Prepare a full model by adding a classification head on top of the base model
         
         # Freeze all layers if freeze_all is True
         if freeze_all:
@@ -40,13 +97,13 @@ class PrepareBaseModel:
             for layer in model.layers[:-freeze_till]:
                 layer.trainable = False
 
-        # Flatten the output from the base model
-        flatten_in = tf.keras.layers.Flatten()(model.output)
+        # Reduce the output of the base model with the selected head
+        head_out = PrepareBaseModel._build_head(model.output, head, head_units, head_dropout)
         # Add a dense layer for predictions with softmax activation
         prediction = tf.keras.layers.Dense(
             units=classes,  # Number of classes for the output
             activation="softmax"  # Softmax activation for multi-class classification
-        )(flatten_in)
+        )(head_out)
 
         # Create the full model with the specified inputs and outputs
         full_model = tf.keras.models.Model(
@@ -73,7 +130,10 @@ class PrepareBaseModel:
             classes=self.config.params_classes,  # Number of classes from the config
             freeze_all=True,  # Freeze all layers during training
             freeze_till=None,  # No layers to unfreeze
-            learning_rate=self.config.params_learning_rate  # Learning rate from the config
+            learning_rate=self.config.params_learning_rate,  # Learning rate from the config
+            head=self.config.params_head,  # Classification head from the config
+            head_units=self.config.params_head_units,  # Hidden units of the 'mlp' head
+            head_dropout=self.config.params_head_dropout  # Dropout rate of the 'mlp' head
         )
 
         # Save the updated full model to the specified path
@@ -0,0 +1,171 @@
+# Import libraries
+import os
+import json
+import pickle
+import random
+import shutil
+import numpy as np
+import tensorflow as tf
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from chest_cancer_classifier import logger
+
+
+def capture_rng_state(sequences=()) -> dict:
+    """
+    Snapshot the random number generators that drive shuffling and augmentation.
+
+    :param sequences: Data sequences with their own numpy `rng` (e.g. TensorCacheSequence).
+    :return: Picklable dictionary of generator states.
+    """
+    return {
+        "python": random.getstate(),
+        "numpy": np.random.get_state(),  # ImageDataGenerator iterators shuffle with the global numpy RNG
+        "tensorflow": tf.random.get_global_generator().state.numpy(),
+        "sequences": [sequence.rng.bit_generator.state for sequence in sequences],
+    }
+
+
+def restore_rng_state(state: dict, sequences=()):
+    """
+    Restore the generator states captured by `capture_rng_state`.
+    """
+    random.setstate(state["python"])
+    np.random.set_state(state["numpy"])
+    tf.random.get_global_generator().state.assign(state["tensorflow"])
+    for sequence, sequence_state in zip(sequences, state["sequences"]):
+        sequence.rng.bit_generator.state = sequence_state
+
+
+def list_checkpoints(checkpoint_dir: Path) -> list:
+    """
+    Complete checkpoints in `checkpoint_dir`, oldest first.
+
+    A checkpoint directory only gets its final name once every file is written, so
+    directories still named `*.tmp` (interrupted writes) are never listed.
+    """
+    if not os.path.isdir(checkpoint_dir):
+        return []
+    return sorted(
+        path for path in Path(checkpoint_dir).glob("epoch-*")
+        if path.is_dir() and not path.name.endswith(".tmp") and (path / "state.json").exists()
+    )
+
+
+def load_latest_checkpoint(checkpoint_dir: Path, fingerprint: str):
+    """
+    Load the newest complete checkpoint written for the same run configuration.
+
+    :param checkpoint_dir: Directory holding the checkpoints.
+    :param fingerprint: Fingerprint of the run configuration (see `Training.checkpoint_fingerprint`).
+    :return: Dictionary with the epoch, global step, model weights, optimizer variables and
+        RNG state, or None when there is no usable checkpoint.
+    """
+    for path in reversed(list_checkpoints(checkpoint_dir)):
+        try:
+            with open(path / "state.json") as f:
+                state = json.load(f)
+            if state["fingerprint"] != fingerprint:
+                logger.info(f"Ignoring checkpoint {path}: written for a different configuration")
+                continue
+            with np.load(path / "model.npz") as f:
+                weights = [f[f"arr_{i}"] for i in range(len(f.files))]
+            with np.load(path / "optimizer.npz") as f:
+                optimizer_variables = [f[f"arr_{i}"] for i in range(len(f.files))]
+            with open(path / "rng.pkl", "rb") as f:
+                rng_state = pickle.load(f)
+        except (OSError, ValueError, KeyError, EOFError, pickle.UnpicklingError) as e:
+            logger.warning(f"Skipping unreadable checkpoint {path}: {e}")
+            continue
+        state.update(path=path, weights=weights, optimizer_variables=optimizer_variables, rng_state=rng_state)
+        return state
+    return None
+
+
+class AsyncCheckpoint(tf.keras.callbacks.Callback):
+    """
+    Keras callback that checkpoints training at epoch boundaries without stalling it.
+
+    At the end of every `every_epochs`-th epoch the model weights, optimizer variables
+    and RNG states are copied to host memory (a short synchronous step), and a
+    background thread writes them to `epoch-NNNN.tmp`, which is renamed once complete.
+    Training continues while the files are written; the next checkpoint waits for the
+    previous write, so at most one snapshot is held in memory. Only the newest `keep`
+    checkpoints are kept.
+
+    Checkpoints are taken at epoch boundaries, so the data position of every input
+    pipeline is "start of the next epoch"; the restored RNG states reproduce the
+    shuffling of the numpy-driven pipelines (generator, tensor_cache).
+    """
+
+    def __init__(self, checkpoint_dir: Path, fingerprint: str, steps_per_epoch: int,
+                 every_epochs: int = 1, keep: int = 2, sequences=()):
+        """
+        :param checkpoint_dir: Directory for the checkpoints.
+        :param fingerprint: Fingerprint of the run configuration, stored with every checkpoint.
+        :param steps_per_epoch: Training steps per epoch (recorded as the iterator position).
+        :param every_epochs: Checkpoint every this many epochs.
+        :param keep: Number of checkpoints to keep.
+        :param sequences: Data sequences whose numpy RNG is checkpointed.
+        """
+        super().__init__()
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.fingerprint = fingerprint
+        self.steps_per_epoch = steps_per_epoch
+        self.every_epochs = max(1, every_epochs)
+        self.keep = max(1, keep)
+        self.sequences = sequences
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+
+    def _wait(self):
+        # Surface errors of the previous write and free its snapshot
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def on_epoch_end(self, epoch, logs=None):
+        if (epoch + 1) % self.every_epochs:
+            return
+        self._wait()
+
+        # Host copies, taken synchronously so training can change the variables right away
+        snapshot = {
+            "epoch": epoch,
+            "weights": self.model.get_weights(),
+            "optimizer_variables": [np.array(variable) for variable in self.model.optimizer.variables],
+            "rng_state": capture_rng_state(self.sequences),
+            "logs": {key: float(value) for key, value in (logs or {}).items()},
+        }
+        self._pending = self._executor.submit(self._write, snapshot)
+
+    def _write(self, snapshot: dict):
+        epoch = snapshot["epoch"]
+        final = self.checkpoint_dir / f"epoch-{epoch:04d}"
+        tmp = self.checkpoint_dir / f"epoch-{epoch:04d}.tmp"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+
+        np.savez(tmp / "model.npz", *snapshot["weights"])
+        np.savez(tmp / "optimizer.npz", *snapshot["optimizer_variables"])
+        with open(tmp / "rng.pkl", "wb") as f:
+            pickle.dump(snapshot["rng_state"], f)
+        # state.json last: its presence marks the checkpoint complete
+        with open(tmp / "state.json", "w") as f:
+            json.dump({
+                "fingerprint": self.fingerprint,
+                "epoch": epoch,
+                "global_step": (epoch + 1) * self.steps_per_epoch,
+                "logs": snapshot["logs"],
+            }, f, indent=4)
+
+        shutil.rmtree(final, ignore_errors=True)
+        os.replace(tmp, final)
+
+        for stale in list_checkpoints(self.checkpoint_dir)[:-self.keep]:
+            shutil.rmtree(stale, ignore_errors=True)
+        logger.info(f"Checkpoint for epoch {epoch + 1} saved at {final}")
+
+    def on_train_end(self, logs=None):
+        self._wait()
+        self._executor.shutdown()
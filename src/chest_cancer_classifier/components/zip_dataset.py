@@ -0,0 +1,146 @@
+# Import libraries
+import io
+import os
+import posixpath
+import threading
+import zipfile
+import tensorflow as tf
+from pathlib import Path
+from chest_cancer_classifier.components.input_pipeline import WHITE_LIST_FORMATS, build_dataset
+
+
+class ZipImageReader:
+    """
+    Thread- and process-safe random access to the members of a zip archive.
+
+    Every reader thread (and every process after a fork) lazily opens its own
+    `ZipFile` handle, so parallel tf.data map calls never share a file position
+    and never wait on each other's seeks.
+    """
+
+    def __init__(self, zip_path: Path):
+        """
+        :param zip_path: Path to the zip archive.
+        """
+        self.zip_path = str(zip_path)
+        self._local = threading.local()
+        self._handles = []
+        self._lock = threading.Lock()
+
+    def _handle(self) -> zipfile.ZipFile:
+        # Reopen after a fork: file descriptors inherited from the parent share their offset
+        pid = os.getpid()
+        if getattr(self._local, "pid", None) != pid:
+            self._local.zip_file = zipfile.ZipFile(self.zip_path, "r")
+            self._local.pid = pid
+            with self._lock:
+                self._handles.append(self._local.zip_file)
+        return self._local.zip_file
+
+    def namelist(self) -> list:
+        return self._handle().namelist()
+
+    def read(self, name: str) -> bytes:
+        """
+        Read and decompress a single member.
+
+        :param name: Member name inside the archive.
+        :return: The member's bytes.
+        """
+        return self._handle().read(name)
+
+    def open(self, name: str) -> io.BytesIO:
+        """
+        Return a member as an in-memory file object (e.g. for PIL).
+        """
+        return io.BytesIO(self.read(name))
+
+    def close(self):
+        """
+        Close every handle opened by this reader.
+        """
+        with self._lock:
+            for handle in self._handles:
+                handle.close()
+            self._handles.clear()
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # Handles and locks cannot be pickled; worker processes open their own
+        return {"zip_path": self.zip_path}
+
+    def __setstate__(self, state):
+        self.__init__(state["zip_path"])
+
+
+def list_zip_images(reader: ZipImageReader, data_root: str = "", validation_split: float = 0.0,
+                    subset: str = None, exclude=None):
+    """
+    Index the images of a zip archive the way `flow_from_directory` indexes a directory.
+
+    Classes are the sorted sub-directories of `data_root` inside the archive, members
+    are ordered like a sorted `os.walk`, and `validation_split` takes the first
+    fraction of every class for "validation". The result therefore lines up with
+    `list_image_files` on the extracted tree.
+
+    :param reader: Reader for the archive.
+    :param data_root: Directory inside the archive that holds one sub-directory per class.
+    :param validation_split: Fraction of each class reserved for validation.
+    :param subset: "training", "validation" or None for all members.
+    :param exclude: Paths relative to `data_root` to leave out before splitting.
+    :return: Tuple of (member names, integer labels, class names).
+    """
+    exclude = exclude or set()
+    prefix = data_root.strip("/") + "/" if data_root.strip("/") else ""
+
+    # Group members by class; directory entries are optional in zip files
+    classes = {}
+    for name in reader.namelist():
+        if not name.startswith(prefix):
+            continue
+        parts = name[len(prefix):].split("/")
+        if len(parts) < 2 or not parts[0]:
+            continue
+        members = classes.setdefault(parts[0], [])
+        if not name.endswith("/") and name.lower().endswith(WHITE_LIST_FORMATS) and \
+                name[len(prefix):] not in exclude:
+            members.append(name)
+
+    class_names = sorted(classes)
+    names, labels = [], []
+    for label, class_name in enumerate(class_names):
+        # Sorted by (directory, file name), as a sorted os.walk visits them
+        class_members = sorted(classes[class_name], key=lambda n: posixpath.split(n))
+
+        if validation_split and subset is not None:
+            split_at = int(validation_split * len(class_members))
+            class_members = class_members[:split_at] if subset == "validation" else class_members[split_at:]
+
+        names.extend(class_members)
+        labels.extend([label] * len(class_members))
+
+    return names, labels, class_names
+
+
+def build_zip_dataset(reader: ZipImageReader, names, labels, num_classes: int, image_size,
+                      batch_size: int, **kwargs) -> tf.data.Dataset:
+    """
+    Build the tf.data pipeline of `build_dataset` over members of a zip archive.
+
+    Members are decompressed in memory by the parallel map workers and decoded
+    straight from the bytes; nothing is written to disk.
+
+    :param reader: Reader for the archive.
+    :param names: Member names, e.g. from `list_zip_images`.
+    :param labels: Integer class labels aligned with `names`.
+    :param num_classes: Number of classes for one-hot encoding.
+    :param image_size: (height, width) to resize to.
+    :param batch_size: Batch size.
+    :param kwargs: Forwarded to `build_dataset` (shuffle, augment, repeat, cache, seed).
+    :return: A batched, prefetched tf.data.Dataset.
+    """
+    def read_member(name):
+        data = tf.numpy_function(lambda n: reader.read(n.decode()), [name], tf.string)
+        return tf.reshape(data, [])
+
+    return build_dataset(names, labels, num_classes, image_size, batch_size, read_fn=read_member, **kwargs)
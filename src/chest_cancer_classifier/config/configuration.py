@@ -2,9 +2,17 @@
 # Import necessary modules and classes from the chest_cancer_classifier package
 from chest_cancer_classifier import *  # Import all components from the chest_cancer_classifier module
 from chest_cancer_classifier.entity.config_entity import (DataIngestionConfig,
+                                                              DataValidationConfig,
+                                                              DataSplitConfig,
+                                                              DataPreprocessingConfig,
+                                                              DataShardingConfig,
                                                               PrepareBaseModelConfig,
                                                               TrainingConfig,
-                                                              EvaluationConfig)
+                                                              EvaluationConfig,
+                                                              ModelPruningConfig,
+                                                              HyperparameterSearchConfig,
+                                                              ModelExportConfig,
+                                                              ServingConfig)
 
 from chest_cancer_classifier.utils.common_functions import read_yaml, create_directories,save_json  # Import utility functions for reading YAML files and creating directories
 
@@ -38,13 +46,112 @@ class ConfigurationManager:
             root_dir=config.root_dir,  # Set the root directory
             source_URL=config.source_URL,  # Set the source URL for data ingestion
             local_data_file=config.local_data_file,  # Set the local path for the downloaded data file
-            unzip_dir=config.unzip_dir  # Set the directory where the data will be unzipped
+            unzip_dir=config.unzip_dir,  # Set the directory where the data will be unzipped
+            source_sha256=config.source_sha256,  # Expected checksum of the downloaded file
+            download_workers=int(config.download_workers),  # Parallel chunk downloads
+            download_chunk_size=int(config.download_chunk_size_mb) * 2**20,  # Chunk size in bytes
+            extract_manifest_path=Path(config.extract_manifest_path),  # Manifest of extracted members
+            extract_workers=int(config.extract_workers),  # Parallel extraction threads
+            extract_archive=bool(config.extract_archive),  # Skip extraction when only data.zip is read
+            data_dir=Path(config.unzip_dir, "Chest-CT-Scan-data"),  # Extracted dataset
+            manifest_path=Path(config.manifest_path)  # Per-file hashes of the extracted dataset
         )
 
         # Return the configured DataIngestionConfig object
         return data_ingestion_config
     
     
+    def get_data_validation_config(self) -> DataValidationConfig:
+        # Retrieve the configuration for the integrity and duplicate scan
+        config = self.config.data_validation
+
+        # Initialize the DataValidationConfig with relevant parameters
+        data_validation_config = DataValidationConfig(
+            data_dir=Path(self.config.data_ingestion.unzip_dir, "Chest-CT-Scan-data"),
+            extract_archive=bool(self.config.data_ingestion.extract_archive),
+            source_zip_path=Path(self.config.data_ingestion.local_data_file),
+            zip_data_root="Chest-CT-Scan-data",
+            extract_manifest_path=Path(self.config.data_ingestion.extract_manifest_path),
+            quarantine_dir=Path(config.quarantine_dir),
+            report_path=Path(config.report_path),
+            hamming_threshold=int(config.hamming_threshold),
+            max_excluded_fraction=float(config.max_excluded_fraction),
+            num_workers=config.num_workers
+        )
+
+        # Return the configuration object
+        return data_validation_config
+
+
+    def get_data_split_config(self) -> DataSplitConfig:
+        # Retrieve the configuration for the split index
+        config = self.config.data_split
+
+        # Create the directory for the split index
+        create_directories([config.root_dir])
+
+        # Initialize the DataSplitConfig with relevant parameters
+        data_split_config = DataSplitConfig(
+            root_dir=Path(config.root_dir),
+            data_dir=Path(self.config.data_ingestion.unzip_dir, "Chest-CT-Scan-data"),
+            extract_archive=bool(self.config.data_ingestion.extract_archive),
+            source_zip_path=Path(self.config.data_ingestion.local_data_file),
+            zip_data_root="Chest-CT-Scan-data",
+            split_index_path=Path(config.split_index_path),
+            manifest_path=Path(self.config.data_ingestion.manifest_path),
+            validation_report_path=Path(self.config.data_validation.report_path),
+            params_validation_split=float(self.params.VALIDATION_SPLIT),
+            params_test_split=float(self.params.TEST_SPLIT),
+            params_seed=int(self.params.SPLIT_SEED)
+        )
+
+        # Return the configuration object
+        return data_split_config
+
+
+    def get_data_preprocessing_config(self) -> DataPreprocessingConfig:
+        # Retrieve the configuration for the preprocessed tensor cache
+        config = self.config.data_preprocessing
+
+        # Create the directory for preprocessing artifacts
+        create_directories([config.root_dir])
+
+        # Initialize the DataPreprocessingConfig with relevant parameters
+        data_preprocessing_config = DataPreprocessingConfig(
+            root_dir=Path(config.root_dir),
+            data_dir=Path(self.config.data_ingestion.unzip_dir, "Chest-CT-Scan-data"),
+            images_path=Path(config.images_path),
+            index_path=Path(config.index_path),
+            params_image_size=self.params.IMAGE_SIZE,
+            manifest_path=Path(self.config.data_ingestion.manifest_path),
+            params_data_pipeline=self.params.DATA_PIPELINE
+        )
+
+        # Return the configuration object
+        return data_preprocessing_config
+
+
+    def get_data_sharding_config(self) -> DataShardingConfig:
+        # Retrieve the configuration for the sharded dataset
+        config = self.config.data_sharding
+
+        # Create the directory for the shards
+        create_directories([config.root_dir])
+
+        # Initialize the DataShardingConfig with relevant parameters
+        data_sharding_config = DataShardingConfig(
+            root_dir=Path(config.root_dir),
+            data_dir=Path(self.config.data_ingestion.unzip_dir, "Chest-CT-Scan-data"),
+            index_path=Path(config.index_path),
+            shard_size=int(config.shard_size_mb) * 2**20,
+            validation_report_path=Path(self.config.data_validation.report_path),
+            params_data_pipeline=self.params.DATA_PIPELINE
+        )
+
+        # Return the configuration object
+        return data_sharding_config
+
+
     def get_prepare_base_model_config(self) -> PrepareBaseModelConfig:
         # Retrieve the configuration for preparing the base model
         config = self.config.prepare_base_model
@@ -61,7 +168,11 @@ class ConfigurationManager:
             params_learning_rate=self.params.LEARNING_RATE,
             params_include_top=self.params.INCLUDE_TOP,
             params_weights=self.params.WEIGHTS,
-            params_classes=self.params.CLASSES
+            params_classes=self.params.CLASSES,
+            params_backbone=self.params.BACKBONE,
+            params_head=self.params.HEAD,
+            params_head_units=int(self.params.HEAD_UNITS),
+            params_head_dropout=float(self.params.HEAD_DROPOUT)
         )
 
         # Return the configuration object
@@ -91,8 +202,32 @@ class ConfigurationManager:
             training_data=Path(training_data),
             params_epochs=params.EPOCHS,
             params_batch_size=params.BATCH_SIZE,
+            params_learning_rate=float(params.TRAINING_LEARNING_RATE),
             params_is_augmentation=params.AUGMENTATION,
-            params_image_size=params.IMAGE_SIZE
+            params_image_size=params.IMAGE_SIZE,
+            params_data_pipeline=params.DATA_PIPELINE,
+            preprocessed_images_path=Path(self.config.data_preprocessing.images_path),
+            preprocessed_index_path=Path(self.config.data_preprocessing.index_path),
+            source_zip_path=Path(self.config.data_ingestion.local_data_file),
+            zip_data_root="Chest-CT-Scan-data",
+            shard_index_path=Path(self.config.data_sharding.index_path),
+            shard_shuffle_buffer=int(self.config.data_sharding.shuffle_buffer),
+            shard_cycle_length=int(self.config.data_sharding.cycle_length),
+            split_index_path=Path(self.config.data_split.split_index_path),
+            params_training_mode=params.TRAINING_MODE,
+            features_dir=Path(training.features_dir),
+            manifest_path=Path(self.config.data_ingestion.manifest_path),
+            params_precision_policy=params.PRECISION_POLICY,
+            params_jit_compile=params.JIT_COMPILE,
+            teacher_model_path=Path(training.teacher_model_path),
+            params_student_filters=list(params.STUDENT_FILTERS),
+            params_distillation_temperature=float(params.DISTILLATION_TEMPERATURE),
+            params_distillation_alpha=float(params.DISTILLATION_ALPHA),
+            checkpoint_dir=Path(training.checkpoint_dir),
+            params_checkpoint_every_epochs=int(params.CHECKPOINT_EVERY_EPOCHS),
+            params_checkpoint_keep=int(params.CHECKPOINT_KEEP),
+            params_distribution=params.DISTRIBUTION,
+            training_metrics_path=Path(training.training_metrics_path)
         )
 
         # Return the training configuration object
@@ -109,9 +244,127 @@ class ConfigurationManager:
             mlflow_uri="https://dagshub.com/muhammadadilnaeem/Chest-Cancer-Classification-Using-MLflow-and-DVC.mlflow",
             all_params=self.params,
             params_image_size=self.params.IMAGE_SIZE,
-            params_batch_size=self.params.BATCH_SIZE
+            params_batch_size=self.params.BATCH_SIZE,
+            params_data_pipeline=self.params.DATA_PIPELINE,
+            preprocessed_images_path=Path(self.config.data_preprocessing.images_path),
+            preprocessed_index_path=Path(self.config.data_preprocessing.index_path),
+            source_zip_path=Path(self.config.data_ingestion.local_data_file),
+            zip_data_root="Chest-CT-Scan-data",
+            shard_index_path=Path(self.config.data_sharding.index_path),
+            shard_cycle_length=int(self.config.data_sharding.cycle_length),
+            split_index_path=Path(self.config.data_split.split_index_path),
+            evaluation_cache_path=Path(self.config.training.evaluation_cache_path),
+            training_metrics_path=Path(self.config.training.training_metrics_path),
+            float32_baseline_path=Path(self.config.training.float32_baseline_path)
         )
 
         # Return the evaluation configuration object
         return eval_config
-    
\ No newline at end of file
+
+
+    def get_model_pruning_config(self) -> ModelPruningConfig:
+        # Retrieve the model pruning configuration
+        config = self.config.model_pruning
+
+        # Create the directory for pruned models
+        create_directories([config.root_dir])
+
+        # Initialize the ModelPruningConfig with relevant parameters
+        model_pruning_config = ModelPruningConfig(
+            root_dir=Path(config.root_dir),
+            model_path=Path(self.config.training.trained_model_path),
+            pruned_model_path=Path(config.pruned_model_path),
+            report_path=Path(config.report_path),
+            training_data=Path(self.config.data_ingestion.unzip_dir, "Chest-CT-Scan-data"),
+            split_index_path=Path(self.config.data_split.split_index_path),
+            params_image_size=self.params.IMAGE_SIZE,
+            params_batch_size=self.params.BATCH_SIZE,
+            params_ratios=[float(ratio) for ratio in self.params.PRUNING_RATIOS],
+            params_criterion=self.params.PRUNING_CRITERION,
+            params_sample_images=int(self.params.PRUNING_SAMPLE_IMAGES),
+            params_finetune_epochs=int(self.params.PRUNING_FINETUNE_EPOCHS),
+            params_learning_rate=float(self.params.PRUNING_LEARNING_RATE),
+            params_max_accuracy_drop=float(self.params.PRUNING_MAX_ACCURACY_DROP)
+        )
+
+        # Return the model pruning configuration object
+        return model_pruning_config
+
+
+    def get_hyperparameter_search_config(self) -> HyperparameterSearchConfig:
+        # Retrieve the hyperparameter search configuration
+        config = self.config.hyperparameter_search
+        params = self.params
+
+        # Create the directory for the search artifacts
+        create_directories([config.root_dir])
+
+        # Initialize the HyperparameterSearchConfig with relevant parameters
+        hyperparameter_search_config = HyperparameterSearchConfig(
+            root_dir=Path(config.root_dir),
+            leaderboard_path=Path(config.leaderboard_path),
+            training=self.get_training_config(),
+            params_algorithm=params.SEARCH_ALGORITHM,
+            params_learning_rates=[float(rate) for rate in params.SEARCH_LEARNING_RATES],
+            params_batch_sizes=[int(size) for size in params.SEARCH_BATCH_SIZES],
+            params_trials=int(params.SEARCH_TRIALS),
+            params_max_epochs=int(params.SEARCH_MAX_EPOCHS),
+            params_eta=int(params.SEARCH_ETA),
+            params_workers=int(params.SEARCH_WORKERS),
+            params_seed=int(params.SEARCH_SEED)
+        )
+
+        # Return the hyperparameter search configuration object
+        return hyperparameter_search_config
+
+
+    def get_model_export_config(self) -> ModelExportConfig:
+        # Retrieve the model export configuration
+        config = self.config.model_export
+
+        # Create the directory for exported models
+        create_directories([config.root_dir])
+
+        # Initialize the ModelExportConfig with relevant parameters
+        model_export_config = ModelExportConfig(
+            root_dir=Path(config.root_dir),
+            model_path=Path(self.config.training.trained_model_path),
+            training_data=Path(self.config.data_ingestion.unzip_dir, "Chest-CT-Scan-data"),
+            split_index_path=Path(self.config.data_split.split_index_path),
+            dynamic_range_model_path=Path(config.dynamic_range_model_path),
+            int8_model_path=Path(config.int8_model_path),
+            report_path=Path(config.report_path),
+            params_image_size=self.params.IMAGE_SIZE,
+            params_calibration_samples=self.params.TFLITE_CALIBRATION_SAMPLES,
+            onnx_model_path=Path(config.onnx_model_path),
+            parity_images_dir=Path(config.parity_images_dir),
+            params_onnx_opset=self.params.ONNX_OPSET,
+            params_onnx_parity_tolerance=self.params.ONNX_PARITY_TOLERANCE
+        )
+
+        # Return the model export configuration object
+        return model_export_config
+
+
+    def get_serving_config(self) -> ServingConfig:
+        # Retrieve the inference server configuration
+        config = self.config.serving
+
+        # Initialize the ServingConfig with relevant parameters
+        serving_config = ServingConfig(
+            model_path=Path(config.model_path),
+            backend=config.backend,
+            backend_options=(
+                {"intra_op_threads": int(config.onnx_intra_op_threads),
+                 "inter_op_threads": int(config.onnx_inter_op_threads)}
+                if config.backend == "onnx" else {}
+            ),
+            host=config.host,
+            port=int(config.port),
+            max_batch_size=int(config.max_batch_size),
+            max_wait_ms=float(config.max_wait_ms),
+            request_timeout_s=float(config.request_timeout_s)
+        )
+
+        # Return the serving configuration object
+        return serving_config
@@ -10,6 +10,64 @@ class DataIngestionConfig:
     source_URL: str  # URL to the source dataset
     local_data_file: Path  # Path for the downloaded local data file
     unzip_dir: Path  # Directory where the data will be unzipped
+    source_sha256: str  # Expected SHA-256 of the downloaded file (None to skip verification)
+    download_workers: int  # Number of chunks downloaded in parallel
+    download_chunk_size: int  # Size of every Range request in bytes
+    extract_manifest_path: Path  # JSON manifest of extracted members (CRC and size)
+    extract_workers: int  # Number of threads extracting members in parallel
+    extract_archive: bool  # Extract data.zip to disk (False keeps only the archive, for the 'zip' pipeline)
+    data_dir: Path  # Extracted dataset (one sub-directory per class)
+    manifest_path: Path  # Columnar manifest with the hash, class, size and dimensions of every image
+
+# Configuration class for the image integrity and duplicate scan
+@dataclass(frozen=True)
+class DataValidationConfig:
+    data_dir: Path  # Directory with the ingested images (one sub-directory per class)
+    extract_archive: bool  # False: decode the images inside data.zip (the 'zip' pipeline)
+    source_zip_path: Path  # Downloaded data.zip
+    zip_data_root: str  # Directory inside data.zip holding one sub-directory per class
+    extract_manifest_path: Path  # Extraction manifest; quarantined members are flagged so they are not extracted again
+    quarantine_dir: Path  # Undecodable extracted images are moved here, keeping their relative path
+    report_path: Path  # JSON report with quarantined files, duplicate groups and excluded files
+    hamming_threshold: int  # Largest dHash distance at which two images count as duplicates
+    max_excluded_fraction: float  # Largest fraction of images validation may quarantine or exclude
+    num_workers: int  # Processes decoding images (None uses the CPU count)
+
+# Configuration class for the persisted training / validation / test split
+@dataclass(frozen=True)
+class DataSplitConfig:
+    root_dir: Path  # Directory for storing the split index
+    data_dir: Path  # Directory with the ingested images (one sub-directory per class)
+    extract_archive: bool  # False: list and hash the images inside data.zip (the 'zip' pipeline)
+    source_zip_path: Path  # Downloaded data.zip
+    zip_data_root: str  # Directory inside data.zip holding one sub-directory per class
+    split_index_path: Path  # JSON index with the files and labels of every subset
+    manifest_path: Path  # Dataset manifest with per-file content hashes
+    validation_report_path: Path  # Validation report listing files to leave out of every subset
+    params_validation_split: float  # Fraction of each class assigned to the validation subset
+    params_test_split: float  # Fraction of each class held out for evaluation
+    params_seed: int  # Seed of the content-based ranking that assigns files to subsets
+
+# Configuration class for the preprocessed tensor cache
+@dataclass(frozen=True)
+class DataPreprocessingConfig:
+    root_dir: Path  # Directory for storing preprocessing artifacts
+    data_dir: Path  # Directory with the ingested images (one sub-directory per class)
+    images_path: Path  # Memory-mapped uint8 array with the resized images
+    index_path: Path  # JSON sidecar with file names, labels and cache metadata
+    params_image_size: list  # Image dimensions the cache is built for
+    manifest_path: Path  # Dataset manifest with per-file content hashes
+    params_data_pipeline: str  # Input pipeline; the cache is only built for 'tensor_cache'
+
+# Configuration class for the sharded TFRecord copy of the dataset
+@dataclass(frozen=True)
+class DataShardingConfig:
+    root_dir: Path  # Directory holding the shards and their index
+    data_dir: Path  # Directory with the ingested images (one sub-directory per class)
+    index_path: Path  # JSON index listing every shard and the records it holds
+    shard_size: int  # Target shard size in bytes
+    validation_report_path: Path  # Validation report listing files to leave out of the shards
+    params_data_pipeline: str  # Input pipeline; the shards are only written for 'shards'
 
 # Configuration class for preparing the base model settings
 @dataclass(frozen=True)
@@ -22,6 +80,10 @@ class PrepareBaseModelConfig:
     params_include_top: bool  # Flag to include the top layer of the model
     params_weights: str  # Source of pre-trained weights (e.g., 'imagenet')
     params_classes: int  # Number of classes for classification
+    params_backbone: str  # Backbone architecture (e.g., 'vgg16', 'mobilenet_v3_small', 'efficientnet_b0')
+    params_head: str  # Classification head: 'flatten', 'gap', 'gmp' or 'mlp'
+    params_head_units: int  # Hidden units of the 'mlp' head
+    params_head_dropout: float  # Dropout rate of the 'mlp' head
 
 # Configuration class for training settings
 @dataclass(frozen=True)
@@ -32,8 +94,32 @@ class TrainingConfig:
     training_data: Path  # Path to the training dataset
     params_epochs: int  # Number of epochs for training
     params_batch_size: int  # Batch size for training
+    params_learning_rate: float  # Adam learning rate of the 'full', 'cached_features' and 'distillation' modes (TRAINING_LEARNING_RATE)
     params_is_augmentation: bool  # Flag to indicate if data augmentation is used
     params_image_size: list  # Image dimensions for input to the model
+    params_data_pipeline: str  # Input pipeline: 'generator', 'tf_data', 'tensor_cache', 'zip' or 'shards'
+    preprocessed_images_path: Path  # Tensor cache images (used by the 'tensor_cache' pipeline)
+    preprocessed_index_path: Path  # Tensor cache index sidecar
+    source_zip_path: Path  # Downloaded data.zip (read directly by the 'zip' pipeline)
+    zip_data_root: str  # Directory inside data.zip holding one sub-directory per class
+    shard_index_path: Path  # Shard index (used by the 'shards' pipeline)
+    shard_shuffle_buffer: int  # Records in the shuffle buffer of the 'shards' pipeline
+    shard_cycle_length: int  # Shards read concurrently by the 'shards' pipeline
+    training_metrics_path: Path  # JSON file written by the training stage
+    params_training_mode: str  # 'full' (end-to-end), 'cached_features' (head only) or 'distillation' (student)
+    features_dir: Path  # Directory for cached backbone features
+    manifest_path: Path  # Dataset manifest with per-file content hashes
+    split_index_path: Path  # Split index with the training and validation files
+    params_precision_policy: str  # Keras dtype policy: 'float32' or 'mixed_bfloat16'
+    params_jit_compile: bool  # Compile the train step with XLA
+    teacher_model_path: Path  # Trained model distilled into the student ('distillation' mode)
+    params_student_filters: list  # Filters of every conv block of the student
+    params_distillation_temperature: float  # Softmax temperature of the soft targets
+    params_distillation_alpha: float  # Weight of the hard-label loss (the soft loss gets 1 - alpha)
+    checkpoint_dir: Path  # Directory for the epoch checkpoints used to resume an interrupted run
+    params_checkpoint_every_epochs: int  # Checkpoint every this many epochs
+    params_checkpoint_keep: int  # Number of checkpoints kept on disk
+    params_distribution: str  # Distribution strategy ('none' or 'multi_worker')
 
 # Configuration class for evaluation settings
 @dataclass(frozen=True)
@@ -44,4 +130,77 @@ class EvaluationConfig:
     all_params: dict  # Dictionary containing all relevant parameters for evaluation
     mlflow_uri: str  # URI for MLflow tracking server
     params_image_size: list  # Image dimensions for input to the model
-    params_batch_size: int  # Batch size for evaluation
\ No newline at end of file
+    params_batch_size: int  # Batch size for evaluation
+    params_data_pipeline: str  # Input pipeline: 'generator', 'tf_data', 'tensor_cache', 'zip' or 'shards'
+    preprocessed_images_path: Path  # Tensor cache images (used by the 'tensor_cache' pipeline)
+    preprocessed_index_path: Path  # Tensor cache index sidecar
+    source_zip_path: Path  # Downloaded data.zip (read directly by the 'zip' pipeline)
+    zip_data_root: str  # Directory inside data.zip holding one sub-directory per class
+    shard_index_path: Path  # Shard index (used by the 'shards' pipeline)
+    shard_cycle_length: int  # Shards read concurrently by the 'shards' pipeline
+    split_index_path: Path  # Split index with the held-out test files
+    evaluation_cache_path: Path  # Scores keyed by model, test subset and image size, reused across runs
+    training_metrics_path: Path  # JSON file written by the training stage
+    float32_baseline_path: Path  # Scores of the last float32 run, used for accuracy comparisons
+
+# Configuration class for filter pruning of the trained model
+@dataclass(frozen=True)
+class ModelPruningConfig:
+    root_dir: Path  # Directory for the pruned models and the report
+    model_path: Path  # Trained Keras model to prune
+    pruned_model_path: Path  # Pruned model selected within the accuracy budget
+    report_path: Path  # JSON report with FLOPs, latency, size and accuracy per pruning ratio
+    training_data: Path  # Dataset used for ranking, fine-tuning and validation
+    split_index_path: Path  # Split index (training files fine-tune, validation files score)
+    params_image_size: list  # Image dimensions for input to the model
+    params_batch_size: int  # Batch size for ranking, fine-tuning and validation
+    params_ratios: list  # Fractions of the filters of every conv layer to remove
+    params_criterion: str  # Filter ranking: 'l1' (kernel norm) or 'activation' (mean activation)
+    params_sample_images: int  # Training images used by the 'activation' criterion
+    params_finetune_epochs: int  # End-to-end fine-tuning epochs after pruning
+    params_learning_rate: float  # Learning rate for fine-tuning
+    params_max_accuracy_drop: float  # Largest accuracy loss accepted for the selected model
+
+# Configuration class for the hyperparameter search
+@dataclass(frozen=True)
+class HyperparameterSearchConfig:
+    root_dir: Path  # Directory for the shared cached features, trial models and the leaderboard
+    leaderboard_path: Path  # JSON leaderboard of all trials
+    training: TrainingConfig  # Training stage settings the trials start from
+    params_algorithm: str  # 'hyperband' or 'successive_halving'
+    params_learning_rates: list  # Candidate Adam learning rates
+    params_batch_sizes: list  # Candidate batch sizes
+    params_trials: int  # Trials started by 'successive_halving'
+    params_max_epochs: int  # Largest number of epochs a trial is trained for
+    params_eta: int  # Only the best 1 / eta trials of a rung advance to the next
+    params_workers: int  # Trials trained concurrently (0: one per CPU core)
+    params_seed: int  # Seed of the hyperparameter sampling
+
+# Configuration class for exporting the trained model for serving
+@dataclass(frozen=True)
+class ModelExportConfig:
+    root_dir: Path  # Directory for storing exported models
+    model_path: Path  # Trained Keras model to export
+    training_data: Path  # Dataset used for calibration and comparison
+    split_index_path: Path  # Split index (training files calibrate, test files are compared)
+    dynamic_range_model_path: Path  # TFLite model with dynamic-range quantization
+    int8_model_path: Path  # TFLite model with full-int8 quantization
+    report_path: Path  # JSON report comparing the exported models with Keras
+    params_image_size: list  # Image dimensions for input to the model
+    params_calibration_samples: int  # Number of training images used to calibrate int8 quantization
+    onnx_model_path: Path  # ONNX model for ONNX Runtime serving
+    parity_images_dir: Path  # Images used to check ONNX / Keras parity
+    params_onnx_opset: int  # ONNX opset version used for the conversion
+    params_onnx_parity_tolerance: float  # Largest allowed absolute difference between ONNX and Keras probabilities
+
+# Configuration class for the inference server settings
+@dataclass(frozen=True)
+class ServingConfig:
+    model_path: Path  # Path to the model served for predictions
+    backend: str  # Runtime used to run the model ('keras', 'tflite' or 'onnx')
+    backend_options: dict  # Keyword arguments for the backend loader
+    host: str  # Address the server listens on
+    port: int  # Port the server listens on
+    max_batch_size: int  # Largest number of requests coalesced into one batch
+    max_wait_ms: float  # Longest time a request waits for its batch to fill
+    request_timeout_s: float  # Longest time a request waits for its prediction (503 afterwards)
@@ -0,0 +1,42 @@
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.model_pruning import ModelPruning
+from chest_cancer_classifier import logger
+
+# Define the name of the stage for logging and tracking purposes
+STAGE_NAME = "Model Pruning stage"
+
+# Class to manage filter pruning of the trained model
+class ModelPruningPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Retrieve configuration settings for the pruning
+        config = ConfigurationManager()
+        model_pruning_config = config.get_model_pruning_config()
+
+        # Create an instance of ModelPruning with the retrieved configuration
+        model_pruning = ModelPruning(config=model_pruning_config)
+
+        # Load the trained model
+        model_pruning.load_model()
+        # Prune, fine-tune and report every ratio, keeping the best model within the accuracy budget
+        model_pruning.prune()
+
+# Entry point of the script
+if __name__ == '__main__':
+    try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+
+        # Create an instance of the pipeline and run the main method
+        obj = ModelPruningPipeline()
+        obj.main()
+
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
@@ -0,0 +1,40 @@
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.hyperparameter_search import HyperparameterSearch
+from chest_cancer_classifier import logger
+
+# Define the name of the stage for logging and tracking purposes
+STAGE_NAME = "Hyperparameter Search stage"
+
+# Class to manage the hyperparameter search
+class HyperparameterSearchPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Retrieve configuration settings for the search
+        config = ConfigurationManager()
+        hyperparameter_search_config = config.get_hyperparameter_search_config()
+
+        # Create an instance of HyperparameterSearch with the retrieved configuration
+        hyperparameter_search = HyperparameterSearch(config=hyperparameter_search_config)
+
+        # Train the trials concurrently, stop weak ones early and write the leaderboard
+        hyperparameter_search.search()
+
+# Entry point of the script (the guard also keeps the spawned trial workers from rerunning the stage)
+if __name__ == '__main__':
+    try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+
+        # Create an instance of the pipeline and run the main method
+        obj = HyperparameterSearchPipeline()
+        obj.main()
+
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
@@ -2,6 +2,7 @@
 
 from chest_cancer_classifier import logger
 from chest_cancer_classifier.components.data_ingestion import DataIngestion
+from chest_cancer_classifier.components.data_validation import DataValidation
 from chest_cancer_classifier.config.configuration import DataIngestionConfig, ConfigurationManager
 
 # Define the name of the current stage in the data processing pipeline
@@ -21,8 +22,16 @@ class DataIngestionTrainingPipeline:
         data_ingestion = DataIngestion(config=data_ingestion_config)
         # Download the data file from the configured URL
         data_ingestion.download_file()
-        # Extract the contents of the downloaded ZIP file
-        data_ingestion.extract_zip_file()
+        # Extract the contents of the downloaded ZIP file (unless the pipeline reads data.zip directly)
+        if data_ingestion_config.extract_archive:
+            data_ingestion.extract_zip_file()
+        else:
+            logger.info("extract_archive is disabled, keeping only the downloaded archive")
+            data_ingestion.skip_extraction()
+        # Quarantine undecodable images and report near-duplicates (inside data.zip when it is not extracted)
+        DataValidation(config=config.get_data_validation_config()).validate()
+        # Hash the images (only new or modified files are hashed)
+        data_ingestion.build_manifest()
 
 # Entry point for the script
 if __name__ == '__main__':
@@ -25,6 +25,8 @@ class ModelTrainingPipeline:
         
         # Call the method to prepare the training and validation generators
         training.train_valid_generator()
+        # Pick up an interrupted run from its latest valid checkpoint, if there is one
+        training.resume_from_checkpoint()
         # Call the method to train the model
         training.train()
 
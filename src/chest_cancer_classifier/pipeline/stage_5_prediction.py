@@ -1,40 +1,37 @@
+from chest_cancer_classifier.components.inference import (ImageClassifier,
+                                                          MODEL_PATH,
+                                                          IMAGE_SIZE,
+                                                          CLASS_LABELS)
 
-import os
-import numpy as np
-from tensorflow.keras.models import load_model
-from tensorflow.keras.utils import load_img, img_to_array
 
 class PredictionPipeline:
-    def __init__(self, filename):
-        # Initialize the pipeline with the image filename
+    def __init__(self, filename=None, model_path=MODEL_PATH, backend="keras", backend_options=None):
+        # Initialize the pipeline with the image filename, the model to serve and its runtime ('keras', 'tflite' or 'onnx')
         self.filename = filename
+        self.model_path = model_path
+        self.classifier = ImageClassifier(model_path=model_path, backend=backend, backend_options=backend_options)
 
     def predict(self):
-        # Load the pre-trained model from the specified path
-        model = load_model(os.path.join("model", "model.h5"))
+        # Classify the single image with one forward pass
+        record = self.classifier.classify(self.filename)
 
-        # Load the image and resize it to match the model's input size (224x224)
-        test_image = load_img(self.filename, target_size=(224, 224))
-        
-        # Convert the image to a numpy array
-        test_image = img_to_array(test_image)
-        
-        # Expand dimensions to create a batch of one image
-        test_image = np.expand_dims(test_image, axis=0)
-        
-        # Use the model to predict the class of the image
-        result = np.argmax(model.predict(test_image), axis=1)
-        
         # Output the prediction result
-        print(result)
-
-        # Check the predicted class and return the corresponding label
-        if result[0] == 1:
-            prediction = 'Normal'
-            return [{"image": prediction}]
-        else:
-            prediction = 'Adenocarcinoma Cancer'
-            return [{"image": prediction}]
+        print(record)
+
+        # Return the label in the response format used by the web app
+        return [{"image": record["label"]}]
+
+    def predict_batch(self, paths_or_arrays, batch_size=32, num_workers=4):
+        """
+        Predict labels for many images with one forward pass per batch.
+
+        :param paths_or_arrays: Iterable of file paths, PIL images or numpy arrays.
+        :param batch_size: Number of images per forward pass.
+        :param num_workers: Threads used to decode images.
+        :return: List of dicts with the label, per-class probabilities and confidence, in input order.
+        """
+        return self.classifier.classify_batch(paths_or_arrays, batch_size=batch_size, num_workers=num_workers)
+
 
 
 
@@ -0,0 +1,45 @@
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.data_preprocessing import DataPreprocessing
+from chest_cancer_classifier import logger
+
+# Define the name of the stage for logging and tracking purposes
+STAGE_NAME = "Data Preprocessing stage"
+
+# Class to manage building the preprocessed tensor cache
+class DataPreprocessingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Retrieve configuration settings for the tensor cache
+        config = ConfigurationManager()
+        data_preprocessing_config = config.get_data_preprocessing_config()
+
+        # Only the 'tensor_cache' pipeline reads the cache; don't build it for the others
+        if data_preprocessing_config.params_data_pipeline != "tensor_cache":
+            logger.info(f"DATA_PIPELINE is '{data_preprocessing_config.params_data_pipeline}', skipping the tensor cache")
+            return
+
+        # Create an instance of DataPreprocessing with the retrieved configuration
+        data_preprocessing = DataPreprocessing(config=data_preprocessing_config)
+
+        # Decode and resize every image once (skipped when the cache is up to date)
+        data_preprocessing.build_tensor_cache()
+
+# Entry point of the script
+if __name__ == '__main__':
+    try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+
+        # Create an instance of the pipeline and run the main method
+        obj = DataPreprocessingPipeline()
+        obj.main()
+
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
@@ -0,0 +1,47 @@
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.model_export import ModelExport
+from chest_cancer_classifier import logger
+
+# Define the name of the stage for logging and tracking purposes
+STAGE_NAME = "Model Export stage"
+
+# Class to manage exporting the trained model for lightweight serving
+class ModelExportPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Retrieve configuration settings for the model export
+        config = ConfigurationManager()
+        model_export_config = config.get_model_export_config()
+
+        # Create an instance of ModelExport with the retrieved configuration
+        model_export = ModelExport(config=model_export_config)
+
+        # Load the trained model
+        model_export.load_model()
+        # Write the dynamic-range and full-int8 TFLite models
+        model_export.export_tflite()
+        # Compare accuracy, latency and size against the Keras model
+        model_export.compare_models()
+        # Write the ONNX model and check it against Keras on the sample images
+        model_export.export_onnx()
+        model_export.check_onnx_parity()
+
+# Entry point of the script
+if __name__ == '__main__':
+    try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+
+        # Create an instance of the pipeline and run the main method
+        obj = ModelExportPipeline()
+        obj.main()
+
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
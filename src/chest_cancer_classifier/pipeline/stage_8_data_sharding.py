@@ -0,0 +1,45 @@
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.data_sharding import DataSharding
+from chest_cancer_classifier import logger
+
+# Define the name of the stage for logging and tracking purposes
+STAGE_NAME = "Data Sharding stage"
+
+# Class to manage packing the dataset into TFRecord shards
+class DataShardingPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Retrieve configuration settings for the shards
+        config = ConfigurationManager()
+        data_sharding_config = config.get_data_sharding_config()
+
+        # Only the 'shards' pipeline reads the shards; don't write them for the others
+        if data_sharding_config.params_data_pipeline != "shards":
+            logger.info(f"DATA_PIPELINE is '{data_sharding_config.params_data_pipeline}', skipping the shards")
+            return
+
+        # Create an instance of DataSharding with the retrieved configuration
+        data_sharding = DataSharding(config=data_sharding_config)
+
+        # Pack the images into shards (skipped when the shards are up to date)
+        data_sharding.write_shards()
+
+# Entry point of the script
+if __name__ == '__main__':
+    try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+
+        # Create an instance of the pipeline and run the main method
+        obj = DataShardingPipeline()
+        obj.main()
+
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
@@ -0,0 +1,40 @@
+from chest_cancer_classifier.config.configuration import ConfigurationManager
+from chest_cancer_classifier.components.data_split import DataSplit
+from chest_cancer_classifier import logger
+
+# Define the name of the stage for logging and tracking purposes
+STAGE_NAME = "Data Split stage"
+
+# Class to manage writing the training / validation / test split index
+class DataSplitPipeline:
+    def __init__(self):
+        pass
+
+    def main(self):
+        # Retrieve configuration settings for the split
+        config = ConfigurationManager()
+        data_split_config = config.get_data_split_config()
+
+        # Create an instance of DataSplit with the retrieved configuration
+        data_split = DataSplit(config=data_split_config)
+
+        # Assign every image to a subset (the index is only rewritten when it changes)
+        data_split.write_split_index()
+
+# Entry point of the script
+if __name__ == '__main__':
+    try:
+        # Log the start of the stage
+        logger.info(f"*******************")
+        logger.info(f">>>>>> stage {STAGE_NAME} started <<<<<<")
+
+        # Create an instance of the pipeline and run the main method
+        obj = DataSplitPipeline()
+        obj.main()
+
+        # Log the completion of the stage
+        logger.info(f">>>>>> stage {STAGE_NAME} completed <<<<<<\n\nx==========x")
+    except Exception as e:
+        # Log any exceptions that occur during the execution
+        logger.exception(e)
+        raise e  # Reraise the exception for further handling
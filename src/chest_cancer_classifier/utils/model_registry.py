@@ -0,0 +1,138 @@
+# Import libraries
+import os
+import time
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional
+from chest_cancer_classifier import logger
+
+
+def load_keras_model(path: str) -> Any:
+    """
+    Default loader used by the registry for Keras `.h5` models.
+
+    TensorFlow is imported lazily so that importing the registry stays cheap.
+    """
+    from tensorflow.keras.models import load_model
+    return load_model(path)
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded models.
+
+    Every model file is deserialized once and kept resident. Entries are keyed by
+    the resolved file path and loader, and remember the artifact's mtime and size
+    so a retrained model is reloaded automatically. Models that have not been used
+    for `max_idle_seconds` are evicted on the next registry access.
+    """
+
+    def __init__(self, max_idle_seconds: Optional[float] = 3600.0):
+        """
+        Initialize an empty registry.
+
+        :param max_idle_seconds: Idle time after which a model is evicted (None disables eviction).
+        """
+        self.max_idle_seconds = max_idle_seconds
+        self._entries = {}  # (path, loader) -> dict(model, fingerprint, last_used)
+        self._lock = threading.RLock()  # Guards the entries dictionary
+        self._key_locks = {}  # (path, loader) -> lock, so one slow load does not block other models
+
+    @staticmethod
+    def _fingerprint(path: str) -> tuple:
+        """
+        Return a cheap fingerprint of the model artifact on disk.
+
+        :param path: Path to the model file.
+        :return: Tuple of (mtime in nanoseconds, size in bytes).
+        """
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path, loader: Optional[Callable[[str], Any]] = None) -> Any:
+        """
+        Return the resident model for `path`, loading or reloading it if needed.
+
+        :param path: Path to the model file.
+        :param loader: Callable that deserializes the file (defaults to Keras `load_model`).
+        :return: Loaded model object.
+        """
+        loader = loader or load_keras_model
+        path = str(Path(path).resolve())
+        key = (path, getattr(loader, "__qualname__", repr(loader)))
+
+        # Evict idle models and pick the per-model lock
+        with self._lock:
+            self._evict_idle()
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            fingerprint = self._fingerprint(path)
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry["fingerprint"] == fingerprint:
+                    entry["last_used"] = time.monotonic()
+                    return entry["model"]
+
+            # Cache miss or the artifact changed on disk: (re)load outside the registry lock
+            if entry is None:
+                logger.info(f"Loading model '{path}' into the model registry")
+            else:
+                logger.info(f"Model '{path}' changed on disk, reloading")
+            model = loader(path)
+
+            with self._lock:
+                self._entries[key] = {
+                    "model": model,
+                    "fingerprint": fingerprint,
+                    "last_used": time.monotonic(),
+                }
+            return model
+
+    def _evict_idle(self):
+        """
+        Drop models that have been idle longer than `max_idle_seconds`.
+        Must be called with the registry lock held.
+        """
+        if self.max_idle_seconds is None:
+            return
+        now = time.monotonic()
+        for key in [k for k, e in self._entries.items() if now - e["last_used"] > self.max_idle_seconds]:
+            logger.info(f"Evicting idle model '{key[0]}' from the model registry")
+            del self._entries[key]
+
+    def evict(self, path=None):
+        """
+        Remove a single model (or every model when `path` is None) from the registry.
+
+        :param path: Path of the model to evict.
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+                return
+            path = str(Path(path).resolve())
+            for key in [k for k in self._entries if k[0] == path]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared registry used by all prediction entry points in this process
+model_registry = ModelRegistry()
+
+
+def get_model(path, loader: Optional[Callable[[str], Any]] = None) -> Any:
+    """
+    Fetch a model from the process-wide registry.
+
+    Args:
+        path (Path): Path to the model file.
+        loader (Callable, optional): Deserializer for the file. Defaults to Keras `load_model`.
+
+    Returns:
+        Any: The resident model object.
+    """
+    return model_registry.get(path, loader=loader)
@@ -2,12 +2,10 @@
 
 # import libraries
 import os
-import numpy as np
 import streamlit as st
 from PIL import Image
 from tensorflow.keras.models import load_model
-from tensorflow.keras.utils import img_to_array
-import time
+from chest_cancer_classifier.components.inference import ImageClassifier
 
 # Page configuration
 st.set_page_config(
@@ -385,29 +383,19 @@ st.markdown(
     unsafe_allow_html=True
 )
 
-# Class for prediction pipeline
-class PredictionPipeline:
-    def __init__(self, model_path):
-        self.model = load_model(model_path)
-
-    def preprocess_image(self, image):
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-        resized_image = image.resize((224, 224))
-        image_array = img_to_array(resized_image)
-        preprocessed_image = np.expand_dims(image_array, axis=0)
-        preprocessed_image /= 255.0
-        return preprocessed_image
-
-    def predict(self, image):
-        preprocessed_image = self.preprocess_image(image)
-        result = np.argmax(self.model.predict(preprocessed_image), axis=1)
-        confidence = np.max(self.model.predict(preprocessed_image)) * 100
-        return ("Normal" if result[0] == 1 else "Adenocarcinoma Cancer", confidence)
+# Load the model once per Streamlit server process instead of on every rerun
+@st.cache_resource
+def load_classifier(model_path):
+    return ImageClassifier(model=load_model(model_path))
 
 # Initialize model
 MODEL_PATH = r"model/model.h5"
-pipeline = PredictionPipeline(MODEL_PATH)
+classifier = load_classifier(MODEL_PATH)
+
+def predict(image):
+    # Single forward pass: label, per-class probabilities and confidence come back together
+    record = classifier.classify(image)
+    return record["label"], record["confidence"] * 100
 
 if uploaded_file:
     # Display the uploaded image
@@ -426,14 +414,8 @@ if uploaded_file:
 
     if st.button("🔍 Analyze Image", key="analyze_button"):
         with st.spinner("Processing image..."):
-            # Progress bar animation
-            progress_bar = st.progress(0)
-            for i in range(100):
-                time.sleep(0.01)
-                progress_bar.progress(i + 1)
-            
             # Get prediction
-            prediction, confidence = pipeline.predict(image)
+            prediction, confidence = predict(image)
             
             # Display results
             if prediction == "Normal":
@@ -644,14 +626,8 @@ if st.session_state.selected_image_path:
 
     if st.button("🔬 Analyze Selected Image", key="analyze_sample_button"):
         with st.spinner("🛠️ Processing image..."):
-            # Progress bar animation
-            progress_bar = st.progress(0)
-            for i in range(100):
-                time.sleep(0.01)
-                progress_bar.progress(i + 1)
-
             # Get prediction
-            prediction, confidence = pipeline.predict(selected_image)
+            prediction, confidence = predict(selected_image)
 
             # Display results
             if prediction == "Normal":
@@ -0,0 +1,55 @@
+# ONNX / Keras parity on sample_images/, the same check the model_export stage runs
+# after converting the trained model (skipped when tf2onnx or onnxruntime is missing)
+
+from pathlib import Path
+
+import pytest
+
+tf = pytest.importorskip("tensorflow")
+pytest.importorskip("tf2onnx")
+pytest.importorskip("onnxruntime")
+
+from chest_cancer_classifier.utils.common_functions import read_yaml
+from chest_cancer_classifier.entity.config_entity import ModelExportConfig
+from chest_cancer_classifier.components.model_export import ModelExport
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def build_model(image_size: list) -> tf.keras.Model:
+    # Small CNN with the layer types of the classifier (conv, pooling, dense softmax head)
+    tf.keras.utils.set_random_seed(0)
+    inputs = tf.keras.Input(shape=tuple(image_size))
+    x = tf.keras.layers.Conv2D(8, 3, strides=2, activation="relu")(inputs)
+    x = tf.keras.layers.MaxPooling2D()(x)
+    x = tf.keras.layers.GlobalAveragePooling2D()(x)
+    outputs = tf.keras.layers.Dense(2, activation="softmax")(x)
+    return tf.keras.Model(inputs=inputs, outputs=outputs)
+
+
+def test_onnx_matches_keras_on_sample_images(tmp_path):
+    params = read_yaml(REPO_ROOT / "params.yaml")
+    model_path = tmp_path / "model.keras"
+    build_model(params.IMAGE_SIZE).save(model_path)
+
+    export = ModelExport(config=ModelExportConfig(
+        root_dir=tmp_path,
+        model_path=model_path,
+        training_data=tmp_path,
+        split_index_path=tmp_path / "split_index.json",
+        dynamic_range_model_path=tmp_path / "model_dynamic_range.tflite",
+        int8_model_path=tmp_path / "model_int8.tflite",
+        report_path=tmp_path / "report.json",
+        params_image_size=params.IMAGE_SIZE,
+        params_calibration_samples=0,
+        onnx_model_path=tmp_path / "model.onnx",
+        parity_images_dir=REPO_ROOT / "sample_images",
+        params_onnx_opset=params.ONNX_OPSET,
+        params_onnx_parity_tolerance=params.ONNX_PARITY_TOLERANCE,
+    ))
+    export.load_model()
+    export.export_onnx()
+
+    # Raises when a probability differs by more than the tolerance or a predicted class differs
+    max_difference = export.check_onnx_parity()
+    assert max_difference <= params.ONNX_PARITY_TOLERANCE